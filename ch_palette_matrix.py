@@ -0,0 +1,311 @@
+"""
+Palette contrast and difference matrix.
+
+Compare every color in a palette against every other color, either by
+WCAG 2.1 contrast ratio or by a Delta E method.
+"""
+import sublime
+import sublime_plugin
+import mdpopups
+from .lib import colorbox
+from .lib.coloraide import Color
+from .lib.coloraide import algebra as alg
+from .lib.coloraide import distance
+from .ch_mixin import _ColorMixin
+from . import ch_util as util
+
+BORDER_SIZE = 1
+MAX_GRID_WIDTH = 960
+MIN_CELL_SIZE = 4
+# Only the worst failing pairs are shown as each one is drawn as its own swatch.
+MAX_FAILURES = 25
+
+CONTRAST = 'contrast'
+MAX_CONTRAST = 21.0
+
+# Thresholds by method: contrast pairs below the threshold fail WCAG AA, while
+# difference pairs below the threshold are considered too similar.
+THRESHOLDS = {
+    CONTRAST: 4.5,
+    'ok': 0.05,
+    'itp': 5.0
+}
+DEF_THRESHOLD = 5.0
+
+METHODS = [
+    (CONTRAST, 'Contrast'),
+    ('2000', 'ΔE 2000'),
+    ('ok', 'ΔE OK'),
+    ('itp', 'ΔE ITP')
+]
+
+# Heat map gradient, created on first use.
+heat_map = None
+
+
+def get_heat_map():
+    """Get the heat map gradient."""
+
+    global heat_map
+
+    if heat_map is None:
+        heat_map = Color.interpolate(['#d73027', '#fee08b', '#1a9850'], space='oklab', out_space='srgb')
+    return heat_map
+
+
+def contrast_matrix(colors):
+    """
+    Calculate the WCAG 2.1 contrast matrix.
+
+    Luminance is only calculated once per color, and as contrast is symmetric,
+    only half the matrix is calculated.
+    """
+
+    lums = [max(0.0, c.luminance()) for c in colors]
+    size = len(lums)
+    matrix = [[1.0] * size for _ in range(size)]
+    for i in range(size):
+        l1 = lums[i] + 0.05
+        row = matrix[i]
+        for j in range(i + 1, size):
+            l2 = lums[j] + 0.05
+            row[j] = matrix[j][i] = l1 / l2 if l1 > l2 else l2 / l1
+    return matrix
+
+
+def delta_e_matrix(colors, method):
+    """
+    Calculate the Delta E matrix.
+
+    Colors are converted to the method's working space once up front so that
+    comparisons do not need to repeat the conversion for every pair.
+    """
+
+    algorithm = colors[0].DE_MAP.get(method) if colors else None
+    if algorithm is None:
+        raise ValueError("'{}' is not a supported distancing algorithm".format(method))
+
+    return distance.distance_pairs(algorithm, colors)
+
+
+def heat(value, threshold, minimum, maximum):
+    """Map a value to a position on the heat map, failing values are on the lower half."""
+
+    if value < threshold:
+        return 0.5 * alg.clamp((value - minimum) / (threshold - minimum), 0.0, 1.0) if threshold > minimum else 0.0
+    return 0.5 + 0.5 * alg.clamp((value - threshold) / (maximum - threshold), 0.0, 1.0) if maximum > threshold else 1.0
+
+
+class ColorHelperPaletteMatrixCommand(_ColorMixin, sublime_plugin.TextCommand):
+    """Show the contrast or difference matrix of a palette."""
+
+    def on_navigate(self, href):
+        """Handle link clicks."""
+
+        if href == '__close__':
+            self.view.hide_popup()
+        elif href == '__palettes__':
+            self.view.run_command('color_helper', {'mode': 'palette'})
+        elif href.startswith('__method__'):
+            self.method = href.split(':', 1)[1]
+            self.threshold = THRESHOLDS.get(self.method, DEF_THRESHOLD)
+            self.show_matrix(update=True)
+
+    def get_palette(self, palette_type, palette_name):
+        """Get the palette."""
+
+        target = None
+        if palette_type == "__special__":
+            if palette_name == "Current Colors":
+                target = {
+                    "name": palette_name,
+                    "colors": self.view.settings().get('color_helper.file_palette', [])
+                }
+            elif palette_name == "Favorites":
+                target = util.get_favs()
+        elif palette_type == "__global__":
+            for palette in util.get_palettes():
+                if palette_name == palette['name']:
+                    target = palette
+        elif palette_type == "__project__":
+            for palette in util.get_project_palettes(self.view.window()):
+                if palette_name == palette['name']:
+                    target = palette
+        return target
+
+    def select_palette(self, method, threshold):
+        """Prompt the user to select a palette."""
+
+        window = self.view.window()
+        if window is None:
+            return
+
+        palettes = [('__special__', 'Current Colors'), ('__special__', util.get_favs()['name'])]
+        palettes.extend(('__global__', p['name']) for p in util.get_palettes())
+        palettes.extend(('__project__', p['name']) for p in util.get_project_palettes(window))
+
+        def on_done(index):
+            """Show the matrix for the selected palette."""
+
+            if index == -1:
+                return
+            palette_type, palette_name = palettes[index]
+            self.view.run_command(
+                'color_helper_palette_matrix',
+                {
+                    'palette_type': palette_type,
+                    'palette_name': palette_name,
+                    'method': method,
+                    'threshold': threshold
+                }
+            )
+
+        window.show_quick_panel(
+            [
+                sublime.QuickPanelItem(name, annotation='Project' if palette_type == '__project__' else '')
+                for palette_type, name in palettes
+            ],
+            on_done
+        )
+
+    def format_matrix(self, matrix, previews):
+        """Format the matrix as a heat map with the palette colors as the headers."""
+
+        if self.method == CONTRAST:
+            minimum, maximum = 1.0, MAX_CONTRAST
+        else:
+            minimum = 0.0
+            maximum = max((max(row) for row in matrix), default=0.0)
+
+        gradient = get_heat_map()
+        headers = [p.preview1 for p in previews]
+        corner = self.default_border
+        rows = [[corner] + headers]
+        for i, row in enumerate(matrix):
+            cells = [headers[i]]
+            for j, value in enumerate(row):
+                if i == j:
+                    cells.append(corner)
+                else:
+                    cells.append(
+                        gradient(heat(value, self.threshold, minimum, maximum)).convert(self.gamut_space).fit(
+                            **self.gamut_map
+                        )
+                    )
+            rows.append(cells)
+
+        cell_size = max(MIN_CELL_SIZE, min(self.height, MAX_GRID_WIDTH // (len(rows) or 1) - BORDER_SIZE))
+        return colorbox.color_grid(
+            rows, self.default_border, cell_size=cell_size, border_size=BORDER_SIZE,
+            check_size=self.check_size(cell_size), gamut_space=self.gamut_space
+        )
+
+    def format_failures(self, matrix, previews):
+        """List the worst pairs that fail the threshold, along with the total number of failing pairs."""
+
+        failures = []
+        size = len(matrix)
+        for i in range(size):
+            for j in range(i + 1, size):
+                value = min(matrix[i][j], matrix[j][i])
+                if value < self.threshold:
+                    failures.append((value, i, j))
+        failures.sort()
+
+        height = self.height
+        width = self.width * 2
+        check_size = self.check_size(height)
+        pairs = []
+        for value, i, j in failures[:MAX_FAILURES]:
+            c1 = self.colors[i]
+            c2 = self.colors[j]
+            pairs.append(
+                '{} {} / {}: **{:.4g}**'.format(
+                    colorbox.color_box(
+                        [previews[i].preview2, previews[j].preview2],
+                        self.default_border, height=height, width=width, border_size=BORDER_SIZE,
+                        check_size=check_size
+                    ),
+                    util.html_encode(c1.to_string(**util.DEFAULT)),
+                    util.html_encode(c2.to_string(**util.DEFAULT)),
+                    value
+                )
+            )
+        return pairs, len(failures), (size * (size - 1)) // 2
+
+    def show_matrix(self, update=False):
+        """Show the matrix."""
+
+        if self.method == CONTRAST:
+            matrix = contrast_matrix(self.colors)
+            title = 'WCAG 2.1 Contrast'
+        else:
+            matrix = delta_e_matrix(self.colors, self.method)
+            title = 'Delta E {}'.format(self.method)
+
+        previews = [self.get_preview(c) for c in self.colors]
+        failures, failed, total = self.format_failures(matrix, previews)
+        template_vars = {
+            'palette_name': self.palette_name,
+            'title': title,
+            'methods': [(m, label) for m, label in METHODS if m != self.method],
+            'matrix': self.format_matrix(matrix, previews),
+            'threshold': self.threshold,
+            'failures': failures,
+            'failed': failed,
+            'total': total,
+            'is_contrast': self.method == CONTRAST
+        }
+
+        if update:
+            mdpopups.update_popup(
+                self.view,
+                util.FRONTMATTER + sublime.load_resource('Packages/ColorHelper/panels/matrix.html.j2'),
+                wrapper_class="color-helper content",
+                css=util.ADD_CSS,
+                template_vars=template_vars
+            )
+        else:
+            mdpopups.show_popup(
+                self.view,
+                util.FRONTMATTER + sublime.load_resource('Packages/ColorHelper/panels/matrix.html.j2'),
+                wrapper_class="color-helper content",
+                css=util.ADD_CSS, location=-1, max_width=1024, max_height=512,
+                on_navigate=self.on_navigate,
+                flags=sublime.COOPERATE_WITH_AUTO_COMPLETE,
+                template_vars=template_vars
+            )
+
+    def run(self, edit, palette_type=None, palette_name=None, method=CONTRAST, threshold=None):
+        """Run command."""
+
+        if threshold is None:
+            threshold = THRESHOLDS.get(method, DEF_THRESHOLD)
+
+        self.base = util.get_base_color()
+        if palette_name is None:
+            self.select_palette(method, threshold)
+            return
+
+        palette = self.get_palette(palette_type, palette_name)
+        if palette is None:
+            return
+
+        self.setup_gamut_style()
+        self.setup_image_border()
+        self.setup_sizes()
+        self.method = method
+        self.threshold = threshold
+        self.palette_name = palette['name']
+        self.colors = []
+        for c in palette['colors']:
+            try:
+                self.colors.append(self.base(c))
+            except Exception:
+                util.log("Could not parse color '{}' in '{}'".format(c, palette_name))
+
+        if len(self.colors) < 2:
+            sublime.status_message("Palette '{}' needs at least two colors to compare".format(palette_name))
+            return
+
+        self.show_matrix()
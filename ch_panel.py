@@ -13,6 +13,7 @@ from .lib.coloraide import __version_info__ as color_ver
 from .ch_native_picker import pick as native_picker
 from .ch_mixin import _ColorMixin
 from . import ch_util as util
+import json
 
 __pc_name__ = "ColorHelper"
 
@@ -21,6 +22,10 @@ PALETTE_SCALE_X = 6
 PALETTE_SCALE_Y = 2
 BORDER_SIZE = 1
 
+# Computed color info and outputs, so panels can be re-shown without recomputing them.
+INFO_MEMO = util.Memo()
+INSERT_MEMO = util.Memo()
+
 
 ###########################
 # Main Code
@@ -65,6 +70,12 @@ class ColorHelperCommand(_ColorMixin, sublime_plugin.TextCommand):
             self.add_fav(href.split(':', 1)[1])
         elif href.startswith('__remove_fav__'):
             self.remove_fav(href.split(':', 1)[1])
+        elif href.startswith('__matrix__'):
+            parts = href.split(':', 3)
+            self.view.run_command(
+                'color_helper_palette_matrix',
+                {'method': parts[1], 'palette_type': parts[2], 'palette_name': self.unescape(parts[3])}
+            )
         elif href.startswith('__delete_colors__'):
             parts = href.split(':', 2)
             self.show_colors(parts[1], self.unescape(parts[2]), delete=True, update=True)
@@ -352,6 +363,19 @@ class ColorHelperCommand(_ColorMixin, sublime_plugin.TextCommand):
             self.view.sel().add(sublime.Region(sel_start + len(value), sel_start))
         self.view.hide_popup()
 
+    def get_preview_key(self):
+        """Get a key representing the current preview settings."""
+
+        return (
+            self.gamut_space,
+            json.dumps(self.gamut_map, sort_keys=True),
+            self.show_out_of_gamut_preview,
+            self.height,
+            self.width,
+            tuple(self.default_border[:]),
+            tuple(self.out_of_gamut_border[:])
+        )
+
     def format_palettes(self, color_list, label, palette_type, caption=None, color=None, delete=False):
         """Format color palette previews."""
 
@@ -439,9 +463,30 @@ class ColorHelperCommand(_ColorMixin, sublime_plugin.TextCommand):
         color = obj.color
         current = self.view.substr(sublime.Region(obj.start, obj.end))
 
+        key = (current, self.base, self.custom_color_class, self.get_preview_key())
+        info = INFO_MEMO.get(key)
+        if info is None:
+            preview = self.get_preview(color)
+            message = ''
+            if preview.message:
+                message = '<p class="comment">* {}</p>'.format(preview.message)
+            info = INFO_MEMO.set(
+                key,
+                (
+                    color.to_string(**util.COLOR_FULL_PREC),
+                    colorbox.color_box(
+                        [preview.preview1, preview.preview2], preview.border,
+                        height=self.height * PREVIEW_SCALE, width=self.width * PREVIEW_SCALE,
+                        border_size=BORDER_SIZE, check_size=self.check_size(self.height * PREVIEW_SCALE, scale=8)
+                    ),
+                    message
+                )
+            )
+        generic_color, color_preview, message = info
+
         # Store color in normal and generic format.
         template_vars['current_color'] = "`#!color-helper {}`".format(current)
-        template_vars['generic_color'] = color.to_string(**util.COLOR_FULL_PREC)
+        template_vars['generic_color'] = generic_color
         template_vars['edit'] = '__colormod__' if self.edit_mode == "st-colormod" else '__edit__'
 
         show_global_palettes = s.get('enable_global_user_palettes', True)
@@ -474,29 +519,25 @@ class ColorHelperCommand(_ColorMixin, sublime_plugin.TextCommand):
             template_vars['show_global_palette_menu'] = True
         if show_favorite_palette and color_ver_okay:
             template_vars['show_favorite_menu'] = True
-            template_vars['is_marked'] = color.to_string(**util.COLOR_SERIALIZE) in util.get_favs()['colors']
-
-        preview = self.get_preview(color)
-        message = ''
-        if preview.message:
-            message = '<p class="comment">* {}</p>'.format(preview.message)
-        template_vars['color_preview'] = (
-            colorbox.color_box(
-                [preview.preview1, preview.preview2], preview.border,
-                height=self.height * PREVIEW_SCALE, width=self.width * PREVIEW_SCALE,
-                border_size=BORDER_SIZE, check_size=self.check_size(self.height * PREVIEW_SCALE, scale=8)
-            )
-        )
+            # Favorites can change at any time, so this is never cached.
+            # Serialized favorites use the same format as the generic color.
+            template_vars['is_marked'] = generic_color in util.get_favs()['colors']
+
+        template_vars['color_preview'] = color_preview
         template_vars['color_preview_message'] = message
 
     def show_insert(self, color, dialog_type, palette_name=None, update=False, raw=None):
         """Show insert panel."""
 
         original = color
-        color = self.base(color)
 
-        sels = self.view.sel()
-        if color is not None and len(sels) == 1:
+        key = (
+            original, raw, self.base, self.custom_color_class,
+            json.dumps(self.output_options, sort_keys=True)
+        )
+        cached = INSERT_MEMO.get(key)
+        if cached is None:
+            color = self.base(color)
             outputs = []
             if raw is not None:
                 outputs.append((util.encode_color(raw), util.html_encode(raw)))
@@ -511,12 +552,17 @@ class ColorHelperCommand(_ColorMixin, sublime_plugin.TextCommand):
                         code
                     )
                 )
+            tool_color = util.encode_color(raw if raw else color.to_string(**util.COLOR_FULL_PREC))
+            cached = INSERT_MEMO.set(key, (outputs, tool_color))
+        outputs, tool_color = cached
 
+        sels = self.view.sel()
+        if len(sels) == 1:
             template_vars = {
                 "dialog_type": dialog_type,
                 "palette_name": palette_name,
                 "current_color": original,
-                "tool_color": util.encode_color(raw if raw else color.to_string(**util.COLOR_FULL_PREC))
+                "tool_color": tool_color
             }
             template_vars['outputs'] = outputs
 
@@ -2,7 +2,6 @@
 import sublime
 import sublime_plugin
 import mdpopups
-from .lib import colorbox
 from . import ch_util as util
 from .ch_mixin import _ColorMixin
 import copy
@@ -35,7 +34,7 @@ Transparent backdrops will be <code>normal</code> blended with white.
 """
 
 
-def parse_color(base, string, start=0, second=False):
+def parse_color(base, string, start=0, second=False, memo=None):
     """
     Parse colors.
 
@@ -50,7 +49,7 @@ def parse_color(base, string, start=0, second=False):
     space = None
     blend_mode = 'normal'
     # First color
-    color = base.match(string, start=start, fullmatch=False)
+    color = tools.match_color(base, string, start, memo)
     if color:
         start = color.end
         if color.end != length:
@@ -97,7 +96,7 @@ def parse_color(base, string, start=0, second=False):
     return color, more, space, blend_mode
 
 
-def evaluate(base, string):
+def evaluate(base, string, memo=None):
     """Evaluate color."""
 
     colors = []
@@ -109,12 +108,12 @@ def evaluate(base, string):
         space = None
 
         # Try to capture the color or the two colors to mix
-        first, more, space, blend_mode = parse_color(base, color)
+        first, more, space, blend_mode = parse_color(base, color, memo=memo)
         if first and more is not None:
             if more is False:
                 first = None
             else:
-                second, more, space, blend_mode = parse_color(base, color, start=first.end, second=True)
+                second, more, space, blend_mode = parse_color(base, color, start=first.end, second=True, memo=memo)
                 if not second or more is False:
                     first = None
                     second = None
@@ -173,47 +172,11 @@ class ColorHelperBlendModeInputHandler(tools._ColorInputHandler):
         style = self.get_html_style()
 
         try:
-            colors = evaluate(self.base, text)
+            colors = evaluate(self.base, text, self.color_memo)
 
             html = ""
             for color in colors:
-                pcolor = self.base(color)
-                message = ""
-                color_string = ""
-                if self.gamut_space == 'srgb':
-                    check_space = self.gamut_space if pcolor.space() not in util.SRGB_SPACES else pcolor.space()
-                else:
-                    check_space = self.gamut_space
-                if not pcolor.in_gamut(check_space):
-                    pcolor.fit(self.gamut_space, **self.gamut_map)
-                    message = '<br><em style="font-size: 0.9em;">* preview out of gamut</em>'
-                    color_string = "<strong>Gamut Mapped</strong>: {}<br>".format(pcolor.to_string())
-                pcolor.convert(self.gamut_space, in_place=True).fit(**self.gamut_map)
-                color_string += "<strong>Color</strong>: {}".format(color.to_string(**util.DEFAULT))
-                preview = pcolor.clone().set('alpha', 1)
-                preview_alpha = pcolor
-                preview_border = self.default_border
-                temp = self.base(preview_border)
-                if temp.luminance() < 0.5:
-                    second_border = temp.mix('white', 0.25, space=self.gamut_space, out_space=self.gamut_space)
-                    second_border.set('alpha', 1)
-                else:
-                    second_border = temp.mix('black', 0.25, space=self.gamut_space, out_space=self.gamut_space)
-                    second_border.set('alpha', 1)
-
-                height = self.height * 3
-                width = self.width * 3
-                check_size = self.check_size(height, scale=8)
-
-                html += tools.PREVIEW_IMG.format(
-                    colorbox.color_box(
-                        [preview, preview_alpha],
-                        preview_border, second_border,
-                        border_size=2, height=height, width=width, check_size=check_size
-                    ),
-                    message,
-                    color_string
-                )
+                html += self.format_color_preview(color)
             if html:
                 return sublime.Html('<html><body>{}</body></html>'.format(style + html))
             else:
@@ -227,7 +190,7 @@ class ColorHelperBlendModeInputHandler(tools._ColorInputHandler):
         """Validate."""
 
         try:
-            color = evaluate(self.base, color)
+            color = evaluate(self.base, color, self.color_memo)
             return len(color) > 0
         except Exception:
             return False
@@ -41,7 +41,7 @@ of either **black** or **white** will be used.
 """
 
 
-def parse_color(base, string, start=0, second=False):
+def parse_color(base, string, start=0, second=False, memo=None):
     """
     Parse colors.
 
@@ -55,7 +55,7 @@ def parse_color(base, string, start=0, second=False):
     more = None
     ratio = None
     # First color
-    color = base.match(string, start=start, fullmatch=False)
+    color = tools.match_color(base, string, start, memo)
     if color:
         start = color.end
         if color.end != length:
@@ -83,7 +83,7 @@ def parse_color(base, string, start=0, second=False):
     return color, ratio, more
 
 
-def evaluate(base, string, gamut_map):
+def evaluate(base, string, gamut_map, memo=None):
     """Evaluate color."""
 
     colors = []
@@ -94,12 +94,12 @@ def evaluate(base, string, gamut_map):
         ratio = None
 
         # Try to capture the color or the two colors to mix
-        first, ratio, more = parse_color(base, color)
+        first, ratio, more = parse_color(base, color, memo=memo)
         if first and more is not None:
             if more is False:
                 first = None
             else:
-                second, ratio, more = parse_color(base, color, start=first.end, second=True)
+                second, ratio, more = parse_color(base, color, start=first.end, second=True, memo=memo)
                 if not second or more is False:
                     first = None
                     second = None
@@ -127,15 +127,8 @@ def evaluate(base, string, gamut_map):
                 first.update(hwb_fg)
                 second.update(hwb_bg)
 
-                colormod = util.import_color("ColorHelper.custom.st_colormod.Color")
-                color = colormod(
-                    "color({} min-contrast({} {}))".format(
-                        hwb_fg.to_string(**util.FULL_PREC),
-                        hwb_bg.to_string(**util.FULL_PREC),
-                        ratio
-                    )
-                )
-                first.update(base(color))
+                colormod = util.import_color("ColorHelper.custom.st_colormod.ColorMod")
+                first.update(base(colormod().get_min_contrast(hwb_fg, hwb_bg, ratio)))
                 colors[0] = first
 
             if first[-1] < 1.0:
@@ -160,6 +153,7 @@ class ColorHelperContrastRatioInputHandler(tools._ColorInputHandler):
 
         self.color = initial
         super().__init__(view, **kwargs)
+        self.result_memo = util.Memo()
 
     def placeholder(self):
         """Placeholder."""
@@ -187,13 +181,26 @@ class ColorHelperContrastRatioInputHandler(tools._ColorInputHandler):
                     return color.to_string(**util.DEFAULT)
         return ''
 
+    def evaluate(self, text):
+        """
+        Evaluate the colors.
+
+        Contrast adjustments are expensive, and both `preview` and `validate`
+        evaluate the same text, so reuse results for text we've already seen.
+        """
+
+        colors = self.result_memo.get(text)
+        if colors is None:
+            colors = self.result_memo.set(text, evaluate(self.base, text, self.gamut_map, self.color_memo))
+        return colors
+
     def preview(self, text):
         """Preview."""
 
         style = self.get_html_style()
 
         try:
-            colors = evaluate(self.base, text, self.gamut_map)
+            colors = self.evaluate(text)
             html = mdpopups.md2html(self.view, DEF_RATIO.format(style))
             if len(colors) >= 3:
                 lum2 = colors[1].luminance()
@@ -233,7 +240,7 @@ class ColorHelperContrastRatioInputHandler(tools._ColorInputHandler):
         """Validate."""
 
         try:
-            colors = evaluate(self.base, color, self.gamut_map)
+            colors = self.evaluate(color)
             return len(colors) > 0
         except Exception:
             return False
@@ -1,7 +1,6 @@
 """Color difference tool."""
 import sublime
 import sublime_plugin
-from .lib import colorbox
 import mdpopups
 from . import ch_util as util
 from .ch_mixin import _ColorMixin
@@ -31,7 +30,7 @@ The first color will be returned on completion.
 """
 
 
-def parse_color(base, string, start=0, second=False):
+def parse_color(base, string, start=0, second=False, memo=None):
     """
     Parse colors.
 
@@ -45,7 +44,7 @@ def parse_color(base, string, start=0, second=False):
     more = None
     method = None
     # First color
-    color = base.match(string, start=start, fullmatch=False)
+    color = tools.match_color(base, string, start, memo)
     if color:
         start = color.end
         if color.end != length:
@@ -73,7 +72,7 @@ def parse_color(base, string, start=0, second=False):
     return color, method, more
 
 
-def evaluate(base, string):
+def evaluate(base, string, memo=None):
     """Evaluate color."""
 
     colors = []
@@ -84,12 +83,12 @@ def evaluate(base, string):
         method = None
 
         # Try to capture the color or the two colors diff
-        first, method, more = parse_color(base, color)
+        first, method, more = parse_color(base, color, memo=memo)
         if first and more is not None:
             if more is False:
                 first = None
             else:
-                second, method, more = parse_color(base, color, start=first.end, second=True)
+                second, method, more = parse_color(base, color, start=first.end, second=True, memo=memo)
                 if not second or more is False:
                     first = None
                     second = None
@@ -172,49 +171,13 @@ class ColorHelperDifferenceInputHandler(tools._ColorInputHandler):
         style = self.get_html_style()
 
         try:
-            colors, delta = evaluate(self.base, text)
+            colors, delta = evaluate(self.base, text, self.color_memo)
             if not colors:
                 raise ValueError('No colors')
             html = mdpopups.md2html(self.view, DEF_DIFF.format(style))
             html = ""
             for color in colors:
-                orig = self.base(color)
-                message = ""
-                color_string = ""
-                if self.gamut_space == 'srgb':
-                    check_space = self.gamut_space if orig.space() not in util.SRGB_SPACES else orig.space()
-                else:
-                    check_space = self.gamut_space
-                if not orig.in_gamut(check_space):
-                    orig.fit(self.gamut_space, **self.gamut_map)
-                    message = '<br><em style="font-size: 0.9em;">* preview out of gamut</em>'
-                    color_string = "<strong>Gamut Mapped</strong>: {}<br>".format(orig.to_string())
-                orig.convert(self.gamut_space, in_place=True).fit(**self.gamut_map)
-                color_string += "<strong>Color</strong>: {}".format(color.to_string(**util.DEFAULT))
-                preview = orig.clone().set('alpha', 1)
-                preview_alpha = orig
-                preview_border = self.default_border
-                temp = self.base(preview_border)
-                if temp.luminance() < 0.5:
-                    second_border = temp.mix('white', 0.25, space=self.gamut_space, out_space=self.gamut_space)
-                    second_border.set('alpha', 1)
-                else:
-                    second_border = temp.mix('black', 0.25, space=self.gamut_space, out_space=self.gamut_space)
-                    second_border.set('alpha', 1)
-
-                height = self.height * 3
-                width = self.width * 3
-                check_size = self.check_size(height, scale=8)
-
-                html += tools.PREVIEW_IMG.format(
-                    colorbox.color_box(
-                        [preview, preview_alpha],
-                        preview_border, second_border,
-                        border_size=2, height=height, width=width, check_size=check_size
-                    ),
-                    message,
-                    color_string
-                )
+                html += self.format_color_preview(color)
             if colors:
                 html += delta
             return sublime.Html(style + html)
@@ -225,7 +188,7 @@ class ColorHelperDifferenceInputHandler(tools._ColorInputHandler):
         """Validate."""
 
         try:
-            colors, _ = evaluate(self.base, color)
+            colors, _ = evaluate(self.base, color, self.color_memo)
             return len(colors) > 0
         except Exception:
             return False
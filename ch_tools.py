@@ -3,6 +3,8 @@ import sublime
 import sublime_plugin
 from . import ch_util as util
 from .ch_mixin import _ColorMixin
+from .lib import colorbox
+from .lib.coloraide import ColorMatch
 import re
 
 PREVIEW_IMG = '''\
@@ -47,6 +49,65 @@ div {{
 """
 
 
+def segment_end(string, start):
+    """
+    Find the end of the color segment that begins at `start`.
+
+    Color syntax never contains whitespace outside of parenthesis, so a color
+    match starting at `start` cannot look past the first whitespace found outside
+    of a parenthetical group. This allows us to memoize matches on just the segment
+    instead of the entire input.
+    """
+
+    depth = 0
+    for index in range(start, len(string)):
+        c = string[index]
+        if c == '(':
+            depth += 1
+        elif c == ')':
+            if depth:
+                depth -= 1
+        elif not depth and c.isspace():
+            return index
+    return len(string)
+
+
+class ColorMemo:
+    """
+    Memoize color matches by segment and offset.
+
+    As the user types, only the segment being edited changes, so the colors
+    earlier in the input do not need to be re-parsed.
+    """
+
+    def __init__(self, base, size=util.MEMO_SIZE):
+        """Initialize."""
+
+        self.base = base
+        self.memo = util.Memo(size)
+
+    def match(self, string, start=0):
+        """Match a color at the given offset."""
+
+        end = segment_end(string, start)
+        key = (string[start:end], start)
+        m = self.memo.get(key, False)
+        if m is False:
+            m = self.base.match(string[:end], start=start, fullmatch=False)
+            self.memo.set(key, m)
+
+        # Callers are free to alter the match and color, so always return a copy.
+        return ColorMatch(m.color.clone(), m.start, m.end) if m is not None else None
+
+
+def match_color(base, string, start=0, memo=None):
+    """Match a color, using the memo if one is provided."""
+
+    if memo is not None:
+        return memo.match(string, start)
+    return base.match(string, start=start, fullmatch=False)
+
+
 class _ColorInputHandler(_ColorMixin, sublime_plugin.TextInputHandler):
     """Color input handler base class."""
 
@@ -59,6 +120,8 @@ class _ColorInputHandler(_ColorMixin, sublime_plugin.TextInputHandler):
         self.setup_gamut_style()
         self.setup_image_border()
         self.setup_sizes()
+        self.color_memo = ColorMemo(self.base)
+        self.preview_memo = util.Memo()
 
     def cancel(self):
         """On cancel."""
@@ -82,3 +145,55 @@ class _ColorInputHandler(_ColorMixin, sublime_plugin.TextInputHandler):
         code = temp.mix("white" if is_dark else "black", 0.15, space="srgb").to_string(**util.HEX)
         font = sublime.load_settings("Preferences.sublime-settings").get('font_face', 'Courier')
         return STYLE.format(fg=fg, bg=bg, code=code, font=font)
+
+    def format_color_preview(self, color):
+        """
+        Format the preview for a color.
+
+        Previews only depend on the color, so they are cached to avoid
+        gamut mapping and generating images for unchanged colors.
+        """
+
+        key = (color.space(), tuple(color[:]))
+        html = self.preview_memo.get(key)
+        if html is not None:
+            return html
+
+        pcolor = self.base(color)
+        message = ""
+        color_string = ""
+        if self.gamut_space == 'srgb':
+            check_space = self.gamut_space if pcolor.space() not in util.SRGB_SPACES else pcolor.space()
+        else:
+            check_space = self.gamut_space
+        if not pcolor.in_gamut(check_space):
+            pcolor.fit(self.gamut_space, **self.gamut_map)
+            message = '<br><em style="font-size: 0.9em;">* preview out of gamut</em>'
+            color_string = "<strong>Gamut Mapped</strong>: {}<br>".format(pcolor.to_string())
+        pcolor.convert(self.gamut_space, in_place=True).fit(**self.gamut_map)
+        color_string += "<strong>Color</strong>: {}".format(color.to_string(**util.DEFAULT))
+        preview = pcolor.clone().set('alpha', 1)
+        preview_alpha = pcolor
+        preview_border = self.default_border
+        temp = self.base(preview_border)
+        if temp.luminance() < 0.5:
+            second_border = temp.mix('white', 0.25, space=self.gamut_space, out_space=self.gamut_space)
+            second_border.set('alpha', 1)
+        else:
+            second_border = temp.mix('black', 0.25, space=self.gamut_space, out_space=self.gamut_space)
+            second_border.set('alpha', 1)
+
+        height = self.height * 3
+        width = self.width * 3
+        check_size = self.check_size(height, scale=8)
+
+        html = PREVIEW_IMG.format(
+            colorbox.color_box(
+                [preview, preview_alpha],
+                preview_border, second_border,
+                border_size=2, height=height, width=width, check_size=check_size
+            ),
+            message,
+            color_string
+        )
+        return self.preview_memo.set(key, html)
@@ -14,6 +14,7 @@ from .lib.coloraide import Color as Base
 from .lib.coloraide import __version_info__ as coloraide_version
 import functools
 import re
+from collections import OrderedDict
 
 COLOR_PARTS = {
     "strict_percent": r"(?:[+\-]?(?:[0-9]*\.)?[0-9]+(?:e[-+]?[0-9]+)?%)",
@@ -44,12 +45,14 @@ RE_COLOR_MATCH = re.compile(
     )
 )
 
-SUPPORTED_SPACES = list(Base.CS_MAP.values())
+SUPPORTED_SPACES = Base.CS_MAP.registered()
 
 
 class Color(Base):
     """Custom base."""
 
+    __slots__ = ()
+
 
 PALETTE_CONFIG = 'color_helper.palettes'
 REQUIRED_COLOR_VERSION = (0, 1, 0, 'alpha', 19)
@@ -84,6 +87,7 @@ CSS_L4_SPACES = (
     "prophoto-rgb", "a98-rgb", "xyz-d65", "xyz-d50", "srgb-linear"
 )
 GAMUT_SPACES = ("srgb", "display-p3", "rec2020", "prophoto-rgb", "a98-rgb")
+MEMO_SIZE = 64
 
 lang_map = {
     # `'name': (('mapping_alias',), ('tmLanguage_or_sublime-syntax file',))`
@@ -208,6 +212,38 @@ DEF_OUTPUT = [
 ]
 
 
+class Memo:
+    """Simple least recently used memo."""
+
+    def __init__(self, size=MEMO_SIZE):
+        """Initialize."""
+
+        self.size = size
+        self.cache = OrderedDict()
+
+    def get(self, key, default=None):
+        """Get the value for the key and mark it as recently used."""
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        return default
+
+    def set(self, key, value):  # noqa: A003
+        """Store the value, evicting the least recently used entry if needed."""
+
+        self.cache[key] = value
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.size:
+            self.cache.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Clear the memo."""
+
+        self.cache.clear()
+
+
 @functools.lru_cache()
 def get_base_color():
     """Get base color."""
@@ -79,5 +79,7 @@ class ASRGB(sRGB):
 class ColorAlphaHex(get_base_color()):
     """Color object whose sRGB color space looks for colors of format `#RRGGBBAA` as `#AARRGGBB`."""
 
+    __slots__ = ()
+
 
 ColorAlphaHex.register(ASRGB(), overwrite=True)
@@ -73,5 +73,7 @@ class AssABGR(sRGB):
 class ColorAssABGR(get_base_color()):
     """Color class for ASS `ABGR` colors."""
 
+    __slots__ = ()
+
 
 ColorAssABGR.register(AssABGR(), overwrite=True)
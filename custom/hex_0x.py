@@ -38,5 +38,7 @@ class HexSRGB(sRGB):
 class ColorHex(get_base_color()):
     """Color object whose sRGB color space looks for colors of format `#RRGGBBAA` as `#AARRGGBB`."""
 
+    __slots__ = ()
+
 
 ColorHex.register(HexSRGB(), overwrite=True)
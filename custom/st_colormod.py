@@ -465,16 +465,27 @@ class ColorMod:
         else:
             raise ValueError("Found unterminated or invalid 'min-contrast('")
 
-        this = self._color.convert("srgb")
-        color2 = color2.convert("srgb")
-        color2[-1] = 1.0
-
-        self.min_contrast(this, color2, value)
-        self._color.update(this)
+        self._color.update(self.get_min_contrast(self._color, color2, value))
         if not self._color.is_nan("hsl.hue"):
             hue = self._color.get("hsl.hue")
         return start, hue
 
+    def get_min_contrast(self, color, background, target):
+        """
+        Get a color adjusted to have at least the target contrast ratio with the background.
+
+        This is the programmatic equivalent of `color(color min-contrast(background target))`
+        and accepts `Color` objects directly. The background's alpha is ignored and the
+        adjusted color is returned in the sRGB color space.
+        """
+
+        this = Color(color).convert("srgb", in_place=True)
+        background = Color(background).convert("srgb", in_place=True)
+        background[-1] = 1.0
+
+        self.min_contrast(this, background, target)
+        return this
+
     def min_contrast(self, color1, color2, target):
         """
         Get the color with the best contrast.
@@ -608,6 +619,8 @@ class ColorMod:
 class Color(BASE):
     """Color modify class."""
 
+    __slots__ = ()
+
     def __init__(self, color, data=None, alpha=util.DEF_ALPHA, *, variables=None, **kwargs):
         """Initialize."""
 
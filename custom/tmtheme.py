@@ -742,5 +742,7 @@ class SRGBX11(sRGB):
 class ColorSRGBX11(get_base_color()):
     """Hex SRGB with X11 color names."""
 
+    __slots__ = ()
+
 
 ColorSRGBX11.register(SRGBX11(), overwrite=True)
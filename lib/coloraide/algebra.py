@@ -24,7 +24,6 @@ import sys
 import cmath
 import math
 import operator
-import functools
 import itertools as it
 from .types import (
     ArrayLike, MatrixLike, EmptyShape, VectorShape, MatrixShape, TensorShape, ArrayShape, VectorLike,
@@ -74,9 +73,6 @@ D2_SC = (2, 0)
 D2_D1 = (2, 1)
 DN_DM = (-1, -1)
 
-# Vector used to create a special matrix used in natural splines
-M141 = [1, 4, 1]
-
 # QR decomposition modes
 QR_MODES = {'reduced', 'complete', 'r', 'raw'}
 
@@ -753,16 +749,38 @@ def ilerp3d(
     return xyz
 
 
-@functools.lru_cache(maxsize=10)
-def _matrix_141(n: int) -> Matrix:
-    """Get matrix '1 4 1'."""
+def solve_tridiagonal(lower: float, diag: float, upper: float, b: MatrixLike) -> Matrix:
+    """
+    Solve a constant tridiagonal system of equations using the Thomas algorithm.
+
+    The matrix has `diag` along the diagonal, `lower` below it, and `upper` above it,
+    and each row of `b` can be a vector of values to solve simultaneously. This is `O(n)`
+    and never creates the dense matrix.
+
+    https://en.wikipedia.org/wiki/Tridiagonal_matrix_algorithm
+    """
+
+    n = len(b)
+    if not n:
+        return []
+
+    # Forward sweep, the modified upper diagonal is the same for every column of `b`.
+    cp = [0.0] * n
+    cp[0] = upper / diag
+    x = [[v / diag for v in b[0]]]  # type: Matrix
+    for i in range(1, n):
+        m = diag - lower * cp[i - 1]
+        cp[i] = upper / m
+        prev = x[-1]
+        x.append([(v - lower * p) / m for v, p in zip(b[i], prev)])
+
+    # Back substitution
+    for i in range(n - 2, -1, -1):
+        c = cp[i]
+        nxt = x[i + 1]
+        x[i] = [v - c * nx for v, nx in zip(x[i], nxt)]
 
-    m = [[0] * n for _ in range(n)]  # type: Matrix
-    m[0][0:2] = M141[1:]
-    m[-1][-2:] = M141[:-1]
-    for x in range(n - 2):
-        m[x + 1][x:x + 3] = M141
-    return inv(m)
+    return x
 
 
 def naturalize_bspline_controls(coordinates: list[Vector]) -> None:
@@ -785,9 +803,6 @@ def naturalize_bspline_controls(coordinates: list[Vector]) -> None:
 
     # Handle all other cases where n does not result in linear interpolation
     elif n > 1:
-        # Create [1, 4, 1] matrix for size `n` set of control points
-        m = _matrix_141(n)
-
         # Create C matrix from the data points
         c = []  # type: Matrix
         for r in range(1, n + 1):
@@ -798,8 +813,8 @@ def naturalize_bspline_controls(coordinates: list[Vector]) -> None:
             else:
                 c.append([a * 6 for a in coordinates[r]])
 
-        # Dot M^-1 and C to get B (control points)
-        v = dot(m, c, dims=D2)
+        # Solve the `[1, 4, 1]` tridiagonal system to get B (control points)
+        v = solve_tridiagonal(1.0, 4.0, 1.0, c)
         for r in range(1, n + 1):
             coordinates[r] = v[r - 1]
 
@@ -1618,6 +1633,37 @@ def matmul_x3(
     raise ValueError('Inputs require at least 1 dimension, scalars are not allowed')
 
 
+def vecdot_x3(a: VectorLike, b: VectorLike) -> float:
+    """Unrolled dot product of two 3 element vectors."""
+
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def matvec_x3(m: MatrixLike, v: VectorLike) -> Vector:
+    """
+    Unrolled multiplication of a 3 x 3 matrix and a 3 element vector.
+
+    Color conversions almost exclusively multiply 3 x 3 matrices by vectors. Unlike `matmul_x3`,
+    there is no shape dispatch, which matters when every conversion bottoms out in this call.
+    """
+
+    x, y, z = v
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = m
+    return [m00 * x + m01 * y + m02 * z, m10 * x + m11 * y + m12 * z, m20 * x + m21 * y + m22 * z]
+
+
+def matmat_x3(a: MatrixLike, b: MatrixLike) -> Matrix:
+    """Unrolled multiplication of two 3 x 3 matrices."""
+
+    (a00, a01, a02), (a10, a11, a12), (a20, a21, a22) = a
+    (b00, b01, b02), (b10, b11, b12), (b20, b21, b22) = b
+    return [
+        [a00 * b00 + a01 * b10 + a02 * b20, a00 * b01 + a01 * b11 + a02 * b21, a00 * b02 + a01 * b12 + a02 * b22],
+        [a10 * b00 + a11 * b10 + a12 * b20, a10 * b01 + a11 * b11 + a12 * b21, a10 * b02 + a11 * b12 + a12 * b22],
+        [a20 * b00 + a21 * b10 + a22 * b20, a20 * b01 + a21 * b11 + a22 * b21, a20 * b02 + a21 * b12 + a22 * b22]
+    ]
+
+
 @overload
 def dot_x3(a: float, b: float, *, dims: DimHints = ...) -> float:
     ...
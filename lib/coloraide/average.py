@@ -4,152 +4,309 @@ import math
 from . import util
 import itertools as it
 from .spaces import HWBish
-from .types import ColorInput, AnyColor
-from typing import Iterable
+from .types import ColorInput, AnyColor, Vector
+from typing import Generic, Iterable
 
 
 class Sentinel(float):
     """Sentinel object that is specific to averaging that we shouldn't see defined anywhere else."""
 
 
-def _iter_colors(colors: Iterable[ColorInput]) -> Iterable[tuple[ColorInput, float]]:
-    """Iterate colors and return weights."""
-
-    for c in colors:
-        yield c, 1.0
-
-
-def average(
-    color_cls: type[AnyColor],
-    colors: Iterable[ColorInput],
-    weights: Iterable[float] | None,
-    space: str,
-    premultiplied: bool = True
-) -> AnyColor:
+class ColorAccumulator(Generic[AnyColor]):
     """
-    Average a list of colors together.
+    Accumulate colors to average, along with the extent and variance of each channel.
+
+    Colors can be added incrementally, and accumulators of the same color space can be merged,
+    so large sets of colors never need to be held in memory at once. Channel statistics are of
+    the unweighted channel values in the accumulator's color space, except hue variance, which
+    is the circular variance (between 0 and 1). Hue has no minimum or maximum on a circle, so its
+    extent is undefined.
 
     Polar coordinates use a circular mean: https://en.wikipedia.org/wiki/Circular_mean.
+    Variance is tracked and merged as described in
+    https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm.
     """
 
-    sentinel = Sentinel()
-    obj = color_cls(space, [])
-
-    # Get channel information
-    cs = obj.CS_MAP[space]
-    if cs.is_polar():
-        hue_index = cs.hue_index()  # type: ignore[attr-defined]
-        is_hwb = isinstance(cs, HWBish)
-        hue_max = cs.channels[hue_index].high
-        to_rad = math.tau / hue_max
-        to_hue = hue_max / math.tau
-    else:
-        hue_index = -1
-        is_hwb = False
-        hue_max = 0.0
-        to_rad = 0.0
-        to_hue = 0.0
-    channels = cs.channels
-    chan_count = len(channels)
-    avgs = [0.0] * chan_count
-    counts = [0] * chan_count
-    sin = 0.0
-    cos = 0.0
-    wavg = 0.0
-    no_weights = weights is None
-    if no_weights:
-        weights = ()
-    mx = 0.0
-
-    # Sum channel values using a rolling average. Apply premultiplication and additional weighting as required.
-    count = 0
-    for c, w in (_iter_colors(colors) if no_weights else it.zip_longest(colors, weights, fillvalue=sentinel)):  # type: ignore[arg-type]
-
-        # Handle explicit weighted cases
-        if not no_weights:
-            # If there are more weights than colors, ignore additional weights
-            if c is sentinel:
-                break
+    def __init__(
+        self,
+        color_cls: type[AnyColor],
+        space: str | None = None,
+        premultiplied: bool = True
+    ) -> None:
+        """Initialize."""
 
-            # If there are less weights than colors, assume full weight for colors without weights
-            if w is sentinel:
-                w = mx
+        if space is None:
+            space = color_cls.AVERAGE
 
-            # Negative weights are considered as zero weight
-            if w < 0.0:
-                w = 0.0
+        self.color_cls = color_cls
+        self.space = space
+        self.premultiplied = premultiplied
+        self._obj = color_cls(space, [])
 
-            # Track the largest weight so we can populate colors with no weights
-            elif w > mx:
-                mx = w
+        # Get channel information
+        cs = self._obj.CS_MAP[space]
+        if cs.is_polar():
+            self._hue_index = cs.hue_index()  # type: ignore[attr-defined]
+            self._hue_max = cs.channels[self._hue_index].high
+            self._to_rad = math.tau / self._hue_max
+            self._to_hue = self._hue_max / math.tau
+        else:
+            self._hue_index = -1
+            self._hue_max = 0.0
+            self._to_rad = 0.0
+            self._to_hue = 0.0
+        chan_count = len(cs.channels)
 
-        obj.update(c)  # type: ignore[arg-type]
+        # Rolling averages of the weighted, and possibly premultiplied, channels
+        self.count = 0
+        self._wavg = 0.0
+        self._avgs = [0.0] * chan_count
+        self._counts = [0] * chan_count
+        self._sin = 0.0
+        self._cos = 0.0
+
+        # Channel statistics, hue is tracked on the unit circle instead of with an extent, mean, and deviations
+        self._n = [0] * chan_count
+        self._means = [0.0] * chan_count
+        self._m2 = [0.0] * chan_count
+        self._mins = [math.inf] * chan_count
+        self._maxs = [-math.inf] * chan_count
+        self._hue_sin = 0.0
+        self._hue_cos = 0.0
+
+    def __len__(self) -> int:
+        """Number of accumulated colors."""
+
+        return self.count
+
+    def _track(self, i: int, coord: float) -> None:
+        """Track the extent and variance of a defined, non-hue channel value."""
+
+        n = self._n[i] = self._n[i] + 1
+        if coord < self._mins[i]:
+            self._mins[i] = coord
+        if coord > self._maxs[i]:
+            self._maxs[i] = coord
+        delta = coord - self._means[i]
+        self._means[i] += delta / n
+        self._m2[i] += delta * (coord - self._means[i])
+
+    def add(self, color: ColorInput, weight: float = 1.0) -> None:
+        """Add a color, negative weights are considered as zero weight."""
+
+        if weight < 0.0:
+            weight = 0.0
+
+        obj = self._obj
+        hue_index = self._hue_index
+        obj.update(color)  # type: ignore[arg-type]
         # If cylindrical color is achromatic, ensure hue is undefined
         if hue_index >= 0 and not math.isnan(obj[hue_index]) and obj.is_achromatic():
             obj[hue_index] = math.nan
         coords = obj[:]
 
         # Average weights
-        count += 1
-        wavg += (w - wavg) / count
+        self.count += 1
+        self._wavg += (weight - self._wavg) / self.count
 
         # Include alpha in average if it is defined. If not defined, skip, but assume color is opaque.
+        avgs = self._avgs
+        counts = self._counts
         alpha = coords[-1]
         if math.isnan(alpha):
             alpha = 1.0
         else:
             counts[-1] += 1
-            avgs[-1] += ((coords[-1] *  w) - avgs[-1]) / counts[-1]
+            avgs[-1] += ((coords[-1] * weight) - avgs[-1]) / counts[-1]
+            self._track(-1, alpha)
 
         # Color channels use the provided weight and alpha weighting if premultiply is enabled
-        wfactor = (alpha * w) if premultiplied else w
-        for i in range(chan_count - 1):
+        premultiplied = self.premultiplied
+        wfactor = (alpha * weight) if premultiplied else weight
+        for i in range(len(coords) - 1):
             coord = coords[i]
-            # No need to include a color component if its value is undefined of alpha is zero
-            if not math.isnan(coord) and (premultiplied or alpha):
+            if math.isnan(coord):
+                continue
+
+            if i == hue_index:
+                rad = coord * self._to_rad
+                sin = math.sin(rad)
+                cos = math.cos(rad)
+                n = self._n[i] = self._n[i] + 1
+                self._hue_sin += (sin - self._hue_sin) / n
+                self._hue_cos += (cos - self._hue_cos) / n
+            else:
+                self._track(i, coord)
+
+            # No need to include a color component if its alpha is zero
+            if premultiplied or alpha:
                 counts[i] += 1
                 n = counts[i]
                 if i == hue_index:
-                    rad = coord * to_rad
-                    sin += ((math.sin(rad) * wfactor) - sin) / n
-                    cos += ((math.cos(rad) * wfactor) - cos) / n
+                    self._sin += ((sin * wfactor) - self._sin) / n
+                    self._cos += ((cos * wfactor) - self._cos) / n
                 else:
                     avgs[i] += ((coord * wfactor) - avgs[i]) / n
 
-    if not count:
-        raise ValueError('At least one color must be provided in order to average colors')
-
-    # Undo premultiplication and weighting to get the final color.
-    # Adjust a channel to be undefined if all values in channel were undefined or if it is an achromatic hue channel.
-    if not wavg:
-        wavg = math.nan
-    avgs[-1] = alpha = math.nan if not counts[-1] else avgs[-1] / wavg
-    if math.isnan(alpha):
-        alpha = 1.0
-    factor = (alpha * wavg) if premultiplied else wavg
-
-    for i in range(chan_count - 1):
-        if not counts[i] or not alpha:
-            avgs[i] = math.nan
-        elif i == hue_index:
-            sin /= factor
-            cos /= factor
-            # Combine polar parts into a degree
-            if abs(sin) < util.ACHROMATIC_THRESHOLD_SM and abs(cos) < util.ACHROMATIC_THRESHOLD_SM:
+    def extend(self, colors: Iterable[ColorInput], weights: Iterable[float] | None = None) -> None:
+        """
+        Add colors with optional weights.
+
+        If there are more weights than colors, additional weights are ignored, and if there are
+        less weights than colors, colors without weights use the largest weight given.
+        """
+
+        if weights is None:
+            for c in colors:
+                self.add(c)
+            return
+
+        sentinel = Sentinel()
+        mx = 0.0
+        for c, w in it.zip_longest(colors, weights, fillvalue=sentinel):
+            # If there are more weights than colors, ignore additional weights
+            if c is sentinel:
+                break
+
+            # If there are less weights than colors, assume full weight for colors without weights
+            if w is sentinel:
+                w = mx
+
+            # Track the largest weight so we can populate colors with no weights
+            elif w > mx:
+                mx = w
+
+            self.add(c, w)  # type: ignore[arg-type]
+
+    def merge(self, other: ColorAccumulator[AnyColor]) -> None:
+        """Merge the colors of another accumulator, such as one filled in a different process."""
+
+        if other.space != self.space or other.premultiplied != self.premultiplied:
+            kind = 'premultiplied' if self.premultiplied else 'non-premultiplied'
+            raise ValueError(f'Cannot merge accumulators that are not both {kind} averages in {self.space}')
+
+        if not other.count:
+            return
+
+        total = self.count + other.count
+        self._wavg = (self._wavg * self.count + other._wavg * other.count) / total
+        self.count = total
+
+        for i in range(len(self._avgs)):
+            # Combine the averages of each channel
+            na = self._counts[i]
+            nb = other._counts[i]
+            if nb:
+                n = self._counts[i] = na + nb
+                if i == self._hue_index:
+                    self._sin = (self._sin * na + other._sin * nb) / n
+                    self._cos = (self._cos * na + other._cos * nb) / n
+                else:
+                    self._avgs[i] = (self._avgs[i] * na + other._avgs[i] * nb) / n
+
+            # Combine the channel statistics
+            na = self._n[i]
+            nb = other._n[i]
+            if not nb:
+                continue
+            n = self._n[i] = na + nb
+            if i == self._hue_index:
+                self._hue_sin = (self._hue_sin * na + other._hue_sin * nb) / n
+                self._hue_cos = (self._hue_cos * na + other._hue_cos * nb) / n
+            else:
+                self._mins[i] = min(self._mins[i], other._mins[i])
+                self._maxs[i] = max(self._maxs[i], other._maxs[i])
+                delta = other._means[i] - self._means[i]
+                self._means[i] += delta * nb / n
+                self._m2[i] += other._m2[i] + delta * delta * na * nb / n
+
+    def average(self) -> AnyColor:
+        """Get the average of the accumulated colors."""
+
+        if not self.count:
+            raise ValueError('At least one color must be provided in order to average colors')
+
+        hue_index = self._hue_index
+        counts = self._counts
+        avgs = self._avgs[:]
+
+        # Undo premultiplication and weighting to get the final color.
+        # Adjust a channel to be undefined if all values in channel were undefined
+        # or if it is an achromatic hue channel.
+        wavg = self._wavg
+        if not wavg:
+            wavg = math.nan
+        avgs[-1] = alpha = math.nan if not counts[-1] else avgs[-1] / wavg
+        if math.isnan(alpha):
+            alpha = 1.0
+        factor = (alpha * wavg) if self.premultiplied else wavg
+
+        for i in range(len(avgs) - 1):
+            if not counts[i] or not alpha:
                 avgs[i] = math.nan
+            elif i == hue_index:
+                sin = self._sin / factor
+                cos = self._cos / factor
+                # Combine polar parts into a degree
+                if abs(sin) < util.ACHROMATIC_THRESHOLD_SM and abs(cos) < util.ACHROMATIC_THRESHOLD_SM:
+                    avgs[i] = math.nan
+                else:
+                    avg_theta = math.atan2(sin, cos) * self._to_hue
+                    avgs[i] = (avg_theta + self._hue_max) if avg_theta < 0 else avg_theta
             else:
-                avg_theta = math.atan2(sin, cos) * to_hue
-                avgs[i] = (avg_theta + hue_max) if avg_theta < 0 else avg_theta
-        else:
-            avgs[i] /= factor
-
-    # Create the color. If polar and there is no defined hue, force an achromatic state.
-    color = obj.update(space, avgs[:-1], avgs[-1])
-    if cs.is_polar():
-        if is_hwb and math.isnan(color[hue_index]):
-            w, b = cs.indexes()[1:]
-            if color[w] + color[b] < 1:
-                color[w] = 1 - color[b]
-        elif math.isnan(color[hue_index]) and not math.isnan(color[cs.radial_index()]):  # type: ignore[attr-defined]
-            color[cs.radial_index()] = 0  # type: ignore[attr-defined]
-    return color
+                avgs[i] /= factor
+
+        # Create the color. If polar and there is no defined hue, force an achromatic state.
+        color = self.color_cls(self.space, avgs[:-1], avgs[-1])
+        cs = color._space
+        if hue_index >= 0:
+            if isinstance(cs, HWBish) and math.isnan(color[hue_index]):
+                w, b = cs.indexes()[1:]
+                if color[w] + color[b] < 1:
+                    color[w] = 1 - color[b]
+            elif math.isnan(color[hue_index]):
+                radial = cs.radial_index()  # type: ignore[attr-defined]
+                if not math.isnan(color[radial]):
+                    color[radial] = 0
+        return color
+
+    def minimum(self) -> Vector:
+        """Get the minimum of each channel, including alpha, undefined channels and hue are undefined."""
+
+        return [math.nan if math.isinf(v) else v for v in self._mins]
+
+    def maximum(self) -> Vector:
+        """Get the maximum of each channel, including alpha, undefined channels and hue are undefined."""
+
+        return [math.nan if math.isinf(v) else v for v in self._maxs]
+
+    def variance(self) -> Vector:
+        """Get the population variance of each channel, including alpha, undefined channels are undefined."""
+
+        variance = []
+        for i, n in enumerate(self._n):
+            if not n:
+                variance.append(math.nan)
+            elif i == self._hue_index:
+                variance.append(max(0.0, 1.0 - math.hypot(self._hue_sin, self._hue_cos)))
+            else:
+                variance.append(self._m2[i] / n)
+        return variance
+
+
+def average(
+    color_cls: type[AnyColor],
+    colors: Iterable[ColorInput],
+    weights: Iterable[float] | None,
+    space: str,
+    premultiplied: bool = True
+) -> AnyColor:
+    """
+    Average a list of colors together.
+
+    Polar coordinates use a circular mean: https://en.wikipedia.org/wiki/Circular_mean.
+    """
+
+    accumulator = ColorAccumulator(color_cls, space, premultiplied)
+    accumulator.extend(colors, weights)
+    return accumulator.average()
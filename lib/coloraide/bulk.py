@@ -0,0 +1,330 @@
+"""
+Bulk operations on arrays of colors.
+
+Colors are provided as `(N, channels)` arrays of coordinates instead of `Color` objects.
+If NumPy is importable, arrays are NumPy arrays and conversion steps that are declared
+as a plain matrix multiply (linear RGB to XYZ, von Kries chromatic adaptation, etc.) are
+applied to all colors with a single `@`, with consecutive matrices merged into one. Other
+steps, and everything when NumPy is not available, are applied one color at a time and
+results are returned as lists. NumPy is not imported until a bulk operation is used.
+"""
+from __future__ import annotations
+import math
+import functools
+from . import algebra as alg
+from . import temperature
+from . import util
+from .channels import FLG_ANGLE
+from .spaces import RGBish, Space
+from .types import VectorLike, AnyColor
+from typing import Any, Sequence
+
+# A conversion step is either a matrix or a function that converts a single color.
+Step = Any
+
+
+def _adapt_step(color_cls: type[AnyColor], w1: VectorLike, w2: VectorLike, method: str | None = None) -> Step:
+    """Get a chromatic adaptation step, as a matrix if the CAT declares one, otherwise as a function."""
+
+    if method is None:
+        method = color_cls.CHROMATIC_ADAPTATION
+    adapter = color_cls.CAT_MAP.get(method)
+    if not adapter:
+        raise ValueError(f"'{method}' is not a supported CAT")
+    m = adapter.matrix(tuple(w1), tuple(w2))  # type: ignore[arg-type]
+    return functools.partial(color_cls.chromatic_adaptation, w1, w2, method=method) if m is None else m
+
+
+def _rows(coords: Any) -> Any:
+    """Get a list of rows from the coordinates, treating a single, flat color as one row."""
+
+    return [coords] if len(coords) and not isinstance(coords[0], Sequence) else coords
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(
+    color_cls: type[AnyColor],
+    chain: tuple[tuple[Space, Space, int, bool], ...],
+    cat: str
+) -> tuple[Step, ...]:
+    """Compile a conversion chain into a list of matrices and per color functions."""
+
+    # Only conversions that are declared as a matrix are treated as one.
+    # A conversion can be linear in places, so it can't be verified by sampling it.
+    fns = []  # type: list[Step]
+    for a, b, direction, adapt in chain:
+        if direction and adapt:
+            fns.append(_adapt_step(color_cls, a.WHITE, b.WHITE, cat))
+        if direction:
+            fns.append(b.from_base if b.FROM_BASE_MATRIX is None else b.FROM_BASE_MATRIX)
+        else:
+            fns.append(a.to_base if a.TO_BASE_MATRIX is None else a.TO_BASE_MATRIX)
+        if not direction and adapt:
+            fns.append(_adapt_step(color_cls, a.WHITE, b.WHITE, cat))
+
+    # Merge consecutive matrices so a run of linear steps is a single multiply.
+    steps = []  # type: list[Step]
+    for fn in fns:
+        if isinstance(fn, list) and steps and isinstance(steps[-1], list):
+            steps[-1] = alg.matmat_x3(fn, steps[-1])
+        else:
+            steps.append(fn)
+    return tuple(steps)
+
+
+def _resolve(cs: Space, coords: Any) -> Any:
+    """Copy the coordinates, replacing undefined values with the channel defaults."""
+
+    np = util.import_numpy()
+    defaults = [c.nans for c in cs.CHANNELS]
+    if np is not None:
+        arr = np.array(coords, dtype=float).reshape(-1, len(defaults))
+        return np.where(np.isnan(arr), np.asarray(defaults), arr)
+    return [[d if math.isnan(v) else v for v, d in zip(row, defaults)] for row in _rows(coords)]
+
+
+def _apply(steps: Sequence[Step], coords: Any) -> Any:
+    """Apply the conversion steps to the coordinates."""
+
+    np = util.import_numpy()
+    for step in steps:
+        if isinstance(step, list):
+            coords = coords @ np.asarray(step).T if np is not None else [alg.matvec_x3(step, c) for c in coords]
+        elif np is not None:
+            coords = np.array([step(c) for c in coords.tolist()], dtype=float)
+        else:
+            coords = [step(c) for c in coords]
+    return coords
+
+
+def convert(color_cls: type[AnyColor], coords: Any, space: str, target: str) -> Any:
+    """
+    Convert an `(N, channels)` array of coordinates from one color space to another.
+
+    Undefined values resolve just as they do when converting a single color, and the results
+    are not normalized, just like `convert(space, norm=False)`.
+    """
+
+    cs = color_cls.CS_MAP.get(space)
+    if cs is None:
+        raise ValueError(f"'{space}' is not a valid color space")
+
+    coords = _resolve(cs, coords)
+    if space == target:
+        return coords
+
+    chain = color_cls._get_convert_chain(cs, target)  # type: ignore[attr-defined]
+    return _apply(_compile(color_cls, tuple(chain), color_cls.CHROMATIC_ADAPTATION), coords)
+
+
+def _clip_space(color_cls: type[AnyColor], coords: Any, space: str) -> tuple[Any, Any]:
+    """
+    Clip the coordinates to the channel limits of the space, in place, like `gamut.clip_channels`.
+
+    Along with the coordinates, whether each color had a channel clipped is returned.
+    """
+
+    np = util.import_numpy()
+    cs = color_cls.CS_MAP[space]
+    if type(cs).normalize is not Space.normalize:
+        if np is not None:
+            coords[:] = [cs.normalize(c) for c in coords.tolist()]
+        else:
+            coords = [cs.normalize(c) for c in coords]
+
+    changed = np.zeros(len(coords), dtype=bool) if np is not None else [False] * len(coords)
+    for i, chan in enumerate(cs.CHANNELS):
+        # Ignore angles and unbounded channels
+        if not chan.bound or chan.flags & FLG_ANGLE:
+            continue
+
+        if np is not None:
+            col = coords[:, i]
+            changed |= (col < chan.low) | (col > chan.high)
+            np.clip(col, chan.low, chan.high, out=col)
+        else:
+            for j, c in enumerate(coords):
+                if c[i] < chan.low:
+                    c[i] = chan.low
+                elif c[i] > chan.high:
+                    c[i] = chan.high
+                else:
+                    continue
+                changed[j] = True
+    return coords, changed
+
+
+def clip(color_cls: type[AnyColor], coords: Any, space: str, gamut: str | None = None) -> Any:
+    """
+    Clip an `(N, channels)` array of coordinates to a gamut.
+
+    If no gamut is given, coordinates are clipped to the space's own gamut. Just as with `Color.clip`,
+    coordinates are clipped in the space's clipping space, colors that were actually clipped there
+    are converted back, and the rest are clipped in their own space.
+    """
+
+    coords = convert(color_cls, coords, space, space)
+
+    # Clip in the gamut's space and convert everything back.
+    if gamut is not None and gamut != space:
+        return convert(color_cls, clip(color_cls, convert(color_cls, coords, space, gamut), gamut), gamut, space)
+
+    cs = color_cls.CS_MAP[space]
+    target = cs.CLIP_SPACE or cs.GAMUT_CHECK or space
+    if target == space:
+        return _clip_space(color_cls, coords, space)[0]
+
+    clipped, changed = _clip_space(color_cls, convert(color_cls, coords, space, target), target)
+    coords = _clip_space(color_cls, coords, space)[0]
+    if util.import_numpy() is not None:
+        if changed.any():
+            coords[changed] = convert(color_cls, clipped[changed], target, space)
+    else:
+        indexes = [i for i, c in enumerate(changed) if c]
+        for i, c in zip(indexes, convert(color_cls, [clipped[i] for i in indexes], target, space)):
+            coords[i] = c
+    return coords
+
+
+def composite(
+    color_cls: type[AnyColor],
+    source: Any,
+    backdrop: Any,
+    space: str = 'srgb'
+) -> Any:
+    """
+    Composite an `(N, channels + alpha)` array of colors over a backdrop with normal blending and source-over.
+
+    The backdrop can be an array of the same length or a single color. Undefined values are treated as zero
+    and alpha is clamped, just like `Color.layer`.
+    """
+
+    if not isinstance(color_cls.CS_MAP[space], RGBish):
+        raise ValueError(f"Can only compose in an RGBish color space, not {type(color_cls.CS_MAP[space])}")
+
+    np = util.import_numpy()
+    channels = len(color_cls.CS_MAP[space].channels)
+    if np is not None:
+        src = np.nan_to_num(np.array(source, dtype=float).reshape(-1, channels), nan=0.0)
+        dst = np.nan_to_num(np.array(backdrop, dtype=float).reshape(-1, channels), nan=0.0)
+        sa = np.clip(src[:, -1:], 0.0, 1.0)
+        ba = np.clip(dst[:, -1:], 0.0, 1.0) * (1.0 - sa)
+        alpha = sa + ba
+        coords = src[:, :-1] * sa + dst[:, :-1] * ba
+        np.divide(coords, alpha, out=coords, where=alpha > 0.0)
+        return np.concatenate((coords, np.broadcast_to(alpha, (len(coords), 1))), axis=1)
+
+    backdrop = _rows(backdrop)
+    single = len(backdrop) == 1
+    results = []
+    for i, color in enumerate(_rows(source)):
+        bg = backdrop[0 if single else i]
+        sa = 0.0 if math.isnan(color[-1]) else alg.clamp(color[-1], 0.0, 1.0)
+        ba = (0.0 if math.isnan(bg[-1]) else alg.clamp(bg[-1], 0.0, 1.0)) * (1.0 - sa)
+        alpha = sa + ba
+        coords = [
+            (0.0 if math.isnan(s) else s) * sa + (0.0 if math.isnan(b) else b) * ba
+            for s, b in zip(color[:-1], bg[:-1])
+        ]
+        if alpha > 0.0:
+            coords = [c / alpha for c in coords]
+        coords.append(alpha)
+        results.append(coords)
+    return results
+
+
+def luminance(color_cls: type[AnyColor], coords: Any, space: str, white: VectorLike | None = None) -> Any:
+    """Get the relative luminance of an `(N, channels)` array of coordinates."""
+
+    xyz = convert(color_cls, coords, space, 'xyz-d65')
+    if white is not None:
+        xyz = _apply([_adapt_step(color_cls, color_cls.CS_MAP['xyz-d65'].WHITE, white)], xyz)
+    return xyz[:, 1] if util.import_numpy() is not None else [c[1] for c in xyz]
+
+
+def contrast(color_cls: type[AnyColor], coords1: Any, coords2: Any, space: str) -> Any:
+    """
+    Get the WCAG 2.1 contrast ratio between two `(N, channels)` arrays of coordinates.
+
+    Either array can be a single color which will be compared with every color in the other.
+    """
+
+    lum1 = luminance(color_cls, coords1, space)
+    lum2 = luminance(color_cls, coords2, space)
+    np = util.import_numpy()
+    if np is not None:
+        lum1 = np.maximum(lum1, 0.0)
+        lum2 = np.maximum(lum2, 0.0)
+        return (np.maximum(lum1, lum2) + 0.05) / (np.minimum(lum1, lum2) + 0.05)
+
+    if len(lum1) == 1:
+        lum1 = lum1 * len(lum2)
+    elif len(lum2) == 1:
+        lum2 = lum2 * len(lum1)
+    results = []
+    for l1, l2 in zip(lum1, lum2):
+        l1 = max(l1, 0.0)
+        l2 = max(l2, 0.0)
+        results.append((l2 + 0.05) / (l1 + 0.05) if l2 > l1 else (l1 + 0.05) / (l2 + 0.05))
+    return results
+
+
+def _rgb_scale(coords: Any) -> Any:
+    """Scale each RGB color, in place, like `util.rgb_scale`."""
+
+    np = util.import_numpy()
+    if np is not None:
+        w = coords.min(axis=1, keepdims=True)
+        np.subtract(coords, w, out=coords, where=w < 0.0)
+        m = coords.max(axis=1, keepdims=True)
+        np.divide(coords, m, out=coords, where=m != 0.0)
+        return coords
+    return [util.rgb_scale(c) for c in coords]
+
+
+def blackbody(
+    color_cls: type[AnyColor],
+    temps: Sequence[float],
+    space: str,
+    duv: float = 0.0,
+    *,
+    scale: bool = True,
+    scale_space: str | None = None,
+    method: str | None = None
+) -> Any:
+    """
+    Get an `(N, channels)` array of colors along the black body curve, one per temperature in Kelvin.
+
+    This is the bulk equivalent of `Color.blackbody`. If the CCT method can calculate many temperatures
+    at once (e.g. Ohno 2013), the Planckian locus is integrated for all temperatures together, otherwise
+    each color is calculated with `Color.blackbody`.
+    """
+
+    np = util.import_numpy()
+    cct = temperature.cct(method, color_cls)
+    if not hasattr(cct, 'from_cct_many'):
+        coords = [
+            color_cls.blackbody(space, t, duv, scale=scale, scale_space=scale_space, method=method)[:-1]
+            for t in temps
+        ]
+        if np is not None:
+            return np.array(coords, dtype=float).reshape(-1, len(color_cls.CS_MAP[space].CHANNELS))
+        return coords
+
+    if scale_space is None:
+        scale_space = 'srgb-linear'
+
+    # Create XYZ from the chromaticity coordinates relative to the white point of the target space.
+    white = color_cls.CS_MAP[space].WHITE
+    xyz = [
+        color_cls.convert_chromaticity(cct.CHROMATICITY, 'xyz', [*uv, 1], white=white)
+        for uv in cct.from_cct_many(temps, duv)
+    ]
+    if np is not None:
+        xyz = np.array(xyz, dtype=float).reshape(-1, 3)
+    xyz = _apply([_adapt_step(color_cls, white, color_cls.CS_MAP['xyz-d65'].WHITE)], xyz)
+
+    # Normalize in the given RGB color space.
+    if scale and isinstance(color_cls.CS_MAP[scale_space], RGBish):
+        return convert(color_cls, _rgb_scale(convert(color_cls, xyz, 'xyz-d65', scale_space)), scale_space, space)
+    return convert(color_cls, xyz, 'xyz-d65', space)
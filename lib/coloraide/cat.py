@@ -66,10 +66,10 @@ def calc_adaptation_matrices(
     http://www.brucelindbloom.com/index.html?Math.html
     """
 
-    src = alg.matmul_x3(m, util.xy_to_xyz(w1), dims=alg.D2_D1)
-    dest = alg.matmul_x3(m, util.xy_to_xyz(w2), dims=alg.D2_D1)
+    src = alg.matvec_x3(m, util.xy_to_xyz(w1))
+    dest = alg.matvec_x3(m, util.xy_to_xyz(w2))
     m2 = alg.diag(alg.divide_x3(dest, src, dims=alg.D1))
-    adapt = alg.matmul_x3(alg.solve(m, m2), m, dims=alg.D2)
+    adapt = alg.matmat_x3(alg.solve(m, m2), m)
 
     return adapt, alg.inv(adapt)
 
@@ -83,6 +83,15 @@ class CAT(Plugin, metaclass=ABCMeta):
     def adapt(self, w1: tuple[float, float], w2: tuple[float, float], xyz: VectorLike) -> Vector:
         """Adapt a given XYZ color using the provided white points."""
 
+    def matrix(self, w1: tuple[float, float], w2: tuple[float, float]) -> Matrix | None:
+        """
+        Get the matrix `adapt` multiplies by for the provided white points.
+
+        `None` is returned if the adaptation is not just a matrix multiply.
+        """
+
+        return None
+
 
 class VonKries(CAT):
     """
@@ -115,9 +124,17 @@ class VonKries(CAT):
         if w1 == w2:
             return [*xyz]
 
+        return alg.matvec_x3(self.matrix(w1, w2), xyz)
+
+    def matrix(self, w1: tuple[float, float], w2: tuple[float, float]) -> Matrix:
+        """Get the adaptation matrix for the provided white points."""
+
+        if w1 == w2:
+            return alg.identity(3)
+
         a, b = sorted([w1, w2])
         m, mi = calc_adaptation_matrices(a, b, self.MATRIX)
-        return alg.matmul_x3(mi if a != w1 else m, xyz, dims=alg.D2_D1)
+        return mi if a != w1 else m
 
 
 class Bradford(VonKries):
@@ -2,7 +2,6 @@
 from __future__ import annotations
 import sys
 import abc
-import functools
 import random
 import math
 from . import cat
@@ -23,7 +22,7 @@ from .deprecate import warn_deprecated
 from itertools import zip_longest as zipl
 from .css import parse
 from .types import VectorLike, Vector, ColorInput
-from .spaces import Space, RGBish
+from .spaces import Space, RGBish, LazySpace, SpaceMap
 from .spaces.hsv import HSV
 from .spaces.srgb.css import sRGB
 from .spaces.srgb_linear import sRGBLinear
@@ -31,23 +30,10 @@ from .spaces.hsl.css import HSL
 from .spaces.hwb.css import HWB
 from .spaces.lab.css import Lab
 from .spaces.lch.css import LCh
-from .spaces.lab_d65 import LabD65
-from .spaces.lch_d65 import LChD65
-from .spaces.display_p3 import DisplayP3
-from .spaces.display_p3_linear import DisplayP3Linear
-from .spaces.a98_rgb import A98RGB
-from .spaces.a98_rgb_linear import A98RGBLinear
-from .spaces.prophoto_rgb import ProPhotoRGB
-from .spaces.prophoto_rgb_linear import ProPhotoRGBLinear
-from .spaces.rec2020 import Rec2020
-from .spaces.rec2020_linear import Rec2020Linear
 from .spaces.xyz_d65 import XYZD65
 from .spaces.xyz_d50 import XYZD50
 from .spaces.oklab.css import Oklab
 from .spaces.oklch.css import OkLCh
-from .spaces.rec2100_pq import Rec2100PQ
-from .spaces.rec2100_hlg import Rec2100HLG
-from .spaces.rec2100_linear import Rec2100Linear
 from .spaces.jzazbz.css import Jzazbz
 from .spaces.jzczhz.css import JzCzhz
 from .spaces.ictcp.css import ICtCp
@@ -82,7 +68,7 @@ from .temperature import CCT
 from .temperature.ohno_2013 import Ohno2013
 from .temperature.robertson_1968 import Robertson1968
 from .types import Plugin
-from typing import Iterator, overload, Sequence, Iterable, Any, Callable, Mapping
+from typing import Iterator, overload, Sequence, Iterable, Any, Callable, Mapping, ClassVar
 if (3, 11) <= sys.version_info:
     from typing import Self
 else:
@@ -127,7 +113,7 @@ class ColorMeta(abc.ABCMeta):
 
         # Ensure subclassed Color objects do not use the same plugin mappings
         if len(cls.mro()) > 2:
-            cls.CS_MAP = cls.CS_MAP.copy()  # type: dict[str, Space]
+            cls.CS_MAP = cls.CS_MAP.copy()  # type: SpaceMap
             cls.DE_MAP = cls.DE_MAP.copy()  # type: dict[str, DeltaE]
             cls.FIT_MAP = cls.FIT_MAP.copy()  # type: dict[str, Fit]
             cls.CAT_MAP = cls.CAT_MAP.copy()  # type: dict[str, CAT]
@@ -138,24 +124,16 @@ class ColorMeta(abc.ABCMeta):
 
         # Ensure each derived class tracks its own conversion paths for color spaces
         # relative to the installed color space plugins.
-        @classmethod  # type: ignore[misc]
-        @functools.lru_cache(maxsize=256)
-        def _get_convert_chain(
-            cls: type[Color],
-            space: Space,
-            target: str
-        ) -> list[tuple[Space, Space, int, bool]]:
-            """Resolve a conversion chain, cache it for speed."""
-
-            return convert.get_convert_chain(cls, space, target)
-
-        cls._get_convert_chain = _get_convert_chain
+        cls._CONVERT_GRAPH = convert.ConversionGraph(cls)  # type: ignore[arg-type]
 
 
 class Color(metaclass=ColorMeta):
     """Color class object which provides access and manipulation of color spaces."""
 
-    CS_MAP = {}  # type: dict[str, Space]
+    # Subclasses should define `__slots__` as well to avoid creating a `__dict__` per instance.
+    __slots__ = ('_space', '_coords')
+
+    CS_MAP = SpaceMap()
     DE_MAP = {}  # type: dict[str, DeltaE]
     FIT_MAP = {}  # type: dict[str, Fit]
     CAT_MAP = {}  # type: dict[str, CAT]
@@ -187,6 +165,9 @@ class Color(metaclass=ColorMeta):
     #    XYZ -> sRGB Linear -> sRGB -> HSL -> HSV -> HWB
     _MAX_CONVERT_ITERATIONS = 10
 
+    # Conversion chains between the registered color spaces, each class gets its own.
+    _CONVERT_GRAPH: ClassVar[convert.ConversionGraph]
+
     def __init__(
         self,
         color: ColorInput,
@@ -198,6 +179,15 @@ class Color(metaclass=ColorMeta):
 
         self._space, self._coords = self._parse(color, data, alpha, **kwargs)
 
+    def __reduce__(self) -> tuple[type[Self], tuple[str, Vector, float]]:
+        """
+        Reduce the color to its space name, coordinates, and alpha for pickling and copying.
+
+        The space is resolved from the class's registered spaces when the color is restored.
+        """
+
+        return type(self), (self._space.NAME, self._coords[:-1], self._coords[-1])
+
     def __len__(self) -> int:
         """Get number of channels."""
 
@@ -316,15 +306,28 @@ class Color(metaclass=ColorMeta):
 
         # Attempt color match
         if string[start:start + 6].lower() == 'color(':
-            for space_class in cls.CS_MAP.values():
+            for space_class in cls.CS_MAP.loaded():
                 if not space_class.COLOR_FORMAT:  # pragma: no cover
                     continue
                 m = parse.parse_css(space_class, string, start, fullmatch, True)
                 if m is not None:
                     return space_class, m[0][0], m[0][1], start, m[1]
 
+            # Only load a lazily registered space if the color is specified in its space.
+            lazy = cls.CS_MAP.lazy()
+            if lazy:
+                ident = parse.tokenize_css(string, start).get('id')
+                for ls in lazy:
+                    if ident in ls.SERIALIZE:
+                        space_class = cls.CS_MAP[ls.NAME]
+                        if not space_class.COLOR_FORMAT:  # pragma: no cover
+                            continue
+                        m = parse.parse_css(space_class, string, start, fullmatch, True)
+                        if m is not None:
+                            return space_class, m[0][0], m[0][1], start, m[1]
+
         # Attempt color space specific match
-        for space_class in cls.CS_MAP.values():
+        for space_class in cls.CS_MAP.loaded():
             m2 = space_class.match(string, start, fullmatch)
             if m2 is not None:
                 return space_class, m2[0][0], m2[0][1], start, m2[1]
@@ -356,6 +359,13 @@ class Color(metaclass=ColorMeta):
 
         return isinstance(obj, Color)
 
+    @classmethod
+    def _get_convert_chain(cls, space: Space, target: str) -> list[tuple[Space, Space, int, bool]]:
+        """Resolve a conversion chain."""
+
+        chain = cls._CONVERT_GRAPH.chains.get((space, target))
+        return cls._CONVERT_GRAPH.chain(space, target) if chain is None else chain
+
     @classmethod
     def register(
         cls,
@@ -370,7 +380,7 @@ class Color(metaclass=ColorMeta):
         mapping = None  # type: Any
         p = None  # type: Any
         for i in [plugin] if not isinstance(plugin, Sequence) else plugin:
-            if isinstance(i, Space):
+            if isinstance(i, (Space, LazySpace)):
                 mapping = cls.CS_MAP
                 reset_convert_cache = True
                 p = i
@@ -397,24 +407,24 @@ class Color(metaclass=ColorMeta):
                 p = i
                 if p.NAME == 'clip':
                     if reset_convert_cache:  # pragma: no cover
-                        cls._get_convert_chain.cache_clear()
+                        cls._CONVERT_GRAPH.clear()
                     if not silent:
                         raise ValueError("'{}' is a reserved name for gamut mapping/reduction and cannot be overridden")
                     continue  # pragma: no cover
             else:
                 if reset_convert_cache:  # pragma: no cover
-                    cls._get_convert_chain.cache_clear()
+                    cls._CONVERT_GRAPH.clear()
                 raise TypeError(f"Cannot register plugin of type '{type(i)}'")
 
             if p.NAME != "*" and (p.NAME not in mapping or overwrite):
                 mapping[p.NAME] = p
             elif not silent:
                 if reset_convert_cache:  # pragma: no cover
-                    cls._get_convert_chain.cache_clear()
+                    cls._CONVERT_GRAPH.clear()
                 raise ValueError(f"A plugin of name '{p.NAME}' already exists or is not allowed")
 
         if reset_convert_cache:
-            cls._get_convert_chain.cache_clear()
+            cls._CONVERT_GRAPH.clear()
 
     @classmethod
     def deregister(cls, plugin: str | Sequence[str], *, silent: bool = False) -> None:
@@ -436,6 +446,7 @@ class Color(metaclass=ColorMeta):
                 cls.INTERPOLATE_MAP.clear()
                 cls.CCT_MAP.clear()
                 cls.FIT_MAP.clear()
+                cls._CONVERT_GRAPH.clear()
                 return
 
             ptype, name = p.split(':', 1)
@@ -458,7 +469,7 @@ class Color(metaclass=ColorMeta):
                 mapping = cls.FIT_MAP
                 if name == 'clip':
                     if reset_convert_cache:  # pragma: no cover
-                        cls._get_convert_chain.cache_clear()
+                        cls._CONVERT_GRAPH.clear()
                     if not silent:
                         raise ValueError(
                             f"'{name}' is a reserved name gamut mapping/reduction and cannot be removed"
@@ -466,7 +477,7 @@ class Color(metaclass=ColorMeta):
                     continue  # pragma: no cover
             else:
                 if reset_convert_cache:  # pragma: no cover
-                    cls._get_convert_chain.cache_clear()
+                    cls._CONVERT_GRAPH.clear()
                 raise ValueError(f"The plugin category of '{ptype}' is not recognized")
 
             if name == '*':
@@ -475,11 +486,11 @@ class Color(metaclass=ColorMeta):
                 del mapping[name]
             elif not silent:
                 if reset_convert_cache:
-                    cls._get_convert_chain.cache_clear()
+                    cls._CONVERT_GRAPH.clear()
                 raise ValueError(f"A plugin of name '{name}' under category '{ptype}' could not be found")
 
         if reset_convert_cache:
-            cls._get_convert_chain.cache_clear()
+            cls._CONVERT_GRAPH.clear()
 
     @classmethod
     def random(cls, space: str, *, limits: Sequence[Sequence[float] | None] | None = None) -> Self:
@@ -1281,7 +1292,7 @@ class Color(metaclass=ColorMeta):
 
     def closest(
         self,
-        colors: Sequence[ColorInput],
+        colors: Sequence[ColorInput] | distance.ColorIndex[Self],
         *,
         method: str | None = None,
         **kwargs: Any
@@ -1518,29 +1529,33 @@ Color.register(
         XYZD50(),
         sRGB(),
         sRGBLinear(),
-        DisplayP3(),
-        DisplayP3Linear(),
+        LazySpace('display-p3', '.spaces.display_p3.DisplayP3'),
+        LazySpace(
+            'display-p3-linear',
+            '.spaces.display_p3_linear.DisplayP3Linear',
+            ('display-p3-linear', '--display-p3-linear')
+        ),
         Oklab(),
         OkLCh(),
         Lab(),
         LCh(),
-        LabD65(),
-        LChD65(),
+        LazySpace('lab-d65', '.spaces.lab_d65.LabD65', ('--lab-d65',)),
+        LazySpace('lch-d65', '.spaces.lch_d65.LChD65', ('--lch-d65',)),
         Jzazbz(),
         JzCzhz(),
         ICtCp(),
         HSV(),
         HSL(),
         HWB(),
-        Rec2020(),
-        Rec2020Linear(),
-        Rec2100PQ(),
-        Rec2100HLG(),
-        Rec2100Linear(),
-        A98RGB(),
-        A98RGBLinear(),
-        ProPhotoRGB(),
-        ProPhotoRGBLinear(),
+        LazySpace('rec2020', '.spaces.rec2020.Rec2020'),
+        LazySpace('rec2020-linear', '.spaces.rec2020_linear.Rec2020Linear', ('--rec2020-linear',)),
+        LazySpace('rec2100-pq', '.spaces.rec2100_pq.Rec2100PQ', ('rec2100-pq', '--rec2100-pq')),
+        LazySpace('rec2100-hlg', '.spaces.rec2100_hlg.Rec2100HLG', ('rec2100-hlg', '--rec2100-hlg')),
+        LazySpace('rec2100-linear', '.spaces.rec2100_linear.Rec2100Linear'),
+        LazySpace('a98-rgb', '.spaces.a98_rgb.A98RGB'),
+        LazySpace('a98-rgb-linear', '.spaces.a98_rgb_linear.A98RGBLinear', ('--a98-rgb-linear',)),
+        LazySpace('prophoto-rgb', '.spaces.prophoto_rgb.ProPhotoRGB'),
+        LazySpace('prophoto-rgb-linear', '.spaces.prophoto_rgb_linear.ProPhotoRGBLinear', ('--prophoto-rgb-linear',)),
 
         # CAT
         Bradford(),
@@ -55,7 +55,8 @@ def calc_path_to_xyz(
 def get_convert_chain(
     color: type[Color],
     space: Space,
-    target: str
+    target: str,
+    graph: ConversionGraph | None = None
 ) -> list[tuple[Space, Space, int, bool]]:
     """
     Create a conversion chain.
@@ -64,10 +65,16 @@ def get_convert_chain(
     Direction refers to whether conversions are moving to or from XYZ D65 as that will dictate whether
     `to_base` or `from_base` call method is used. If either the "from" or "to" color space is XYZ D65
     a chromatic adaptation will need to occur.
+
+    The chain is composed from the paths of both color spaces to XYZ D65.
     """
 
-    # Get the color space chain for the current space to XYZ
-    from_color, from_color_index = calc_path_to_xyz(color, target)
+    if graph is None:
+        graph = ConversionGraph(color)
+
+    # Get the color space chain for the target space to XYZ and for the current space to XYZ.
+    to_color, to_color_index = graph.path(target)
+    from_color = [space] if space.NAME == ABSOLUTE_BASE else [space, *graph.path(space.BASE)[0]]
 
     # Start building up the conversion chain.
     # The first stage builds up the chain towards XYZ D65.
@@ -75,55 +82,84 @@ def get_convert_chain(
     # the current space and XYZ D65, nothing will get added.
     current = space
     chain = []  # type: list[tuple[Space, Space, int, bool]]
-    if current.NAME != ABSOLUTE_BASE:
-        count = 0
-        while current.NAME not in from_color_index:
+    index = 0
+    while current.NAME not in to_color_index:
 
-            # Get the "base space" (the space through which the current color converts to and from)
-            base_space = color.CS_MAP[current.BASE]
+        # Get the "base space" (the space through which the current color converts to and from)
+        index += 1
+        base_space = from_color[index]
 
-            # Do we need to chromatically adapt towards XYZ D65?
-            adapt = base_space.NAME == ABSOLUTE_BASE and current.WHITE != base_space.WHITE
+        # Do we need to chromatically adapt towards XYZ D65?
+        adapt = base_space.NAME == ABSOLUTE_BASE and current.WHITE != base_space.WHITE
 
-            # Add conversion chain entry
-            chain.append((current, base_space, 0, adapt))
+        # Add conversion chain entry
+        chain.append((current, base_space, 0, adapt))
 
-            # The base space is now the current space
-            current = base_space
-
-            count += 1
-            if count > color._MAX_CONVERT_ITERATIONS:  # pragma: no cover
-                raise RuntimeError(
-                    'Conversions reached max iteration of {} and has terminated to avoid an infinite loop'.format(
-                        count
-                    )
-                )
+        # The base space is now the current space
+        current = base_space
 
     # If the chain still didn't resolve to the target space after the first stage,
     # build up the chain in the direction away from XYZ-D65.
-    if current.NAME != target:
-        # Start in the chain where the current color resides
-        start = from_color_index[current.NAME] - 1
-
-        # Moving away from XYZ D65, convert towards our desired target
-        for index in range(start, -1, -1):
-            base_space = current
-            current = from_color[index]
+    # Start in the chain where the current color resides.
+    for index in range(to_color_index[current.NAME] - 1, -1, -1):
+        base_space = current
+        current = to_color[index]
 
-            # Do we need to chromatically adapt away from XYZ D65?
-            adapt = base_space.NAME == ABSOLUTE_BASE and current.WHITE != base_space.WHITE
+        # Do we need to chromatically adapt away from XYZ D65?
+        adapt = base_space.NAME == ABSOLUTE_BASE and current.WHITE != base_space.WHITE
 
-            # Add the conversion chain entry
-            chain.append((base_space, current, 1, adapt))
+        # Add the conversion chain entry
+        chain.append((base_space, current, 1, adapt))
 
     return chain
 
 
+class ConversionGraph:
+    """
+    Conversion chains between the color spaces registered to a color class.
+
+    The path from each color space to XYZ D65 is calculated once, and every chain composed
+    from those paths is kept, so conversions between any number of color spaces never need
+    to recalculate a chain. Everything must be cleared when color spaces are registered or
+    deregistered.
+    """
+
+    def __init__(self, color: type[Color]) -> None:
+        """Initialize."""
+
+        self.color = color
+        self.paths = {}  # type: dict[str, tuple[list[Space], dict[str, int]]]
+        self.chains = {}  # type: dict[tuple[Space, str], list[tuple[Space, Space, int, bool]]]
+
+    def path(self, space: str) -> tuple[list[Space], dict[str, int]]:
+        """Get the path from the color space to XYZ D65."""
+
+        path = self.paths.get(space)
+        if path is None:
+            path = self.paths[space] = calc_path_to_xyz(self.color, space)
+        return path
+
+    def chain(self, space: Space, target: str) -> list[tuple[Space, Space, int, bool]]:
+        """Get the conversion chain from the color space to the target."""
+
+        key = (space, target)
+        chain = self.chains.get(key)
+        if chain is None:
+            chain = self.chains[key] = get_convert_chain(self.color, space, target, self)
+        return chain
+
+    def clear(self) -> None:
+        """Clear all paths and chains."""
+
+        self.paths.clear()
+        self.chains.clear()
+
+
 def convert(color: Color, space: str) -> tuple[Space, Vector]:
     """Convert the color coordinates to the specified space."""
 
     # Grab the convert for the current space to the desired space
-    # Result is cached for quicker future conversions.
+    # Result is kept in the class's conversion graph for quicker future conversions.
     chain = color._get_convert_chain(color._space, space)  # type: ignore[attr-defined]
 
     # Get coordinates and convert NaN values to 0
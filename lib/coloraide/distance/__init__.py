@@ -2,13 +2,28 @@
 from __future__ import annotations
 import math
 from .. import algebra as alg
+from .. import util
 from abc import ABCMeta, abstractmethod
-from ..types import ColorInput, Plugin, AnyColor
-from typing import Any, Sequence
+from .index import ColorIndex
+from ..types import ColorInput, Plugin, AnyColor, Vector, VectorLike
+from typing import Any, Sequence, Iterable
 
+# Below this many samples, NumPy's array setup costs more than it saves.
+NP_MIN_SAMPLES = 32
 
-def closest(color: AnyColor, colors: Sequence[ColorInput], method: str | None = None, **kwargs: Any) -> AnyColor:
-    """Get the closest color."""
+
+def closest(
+    color: AnyColor,
+    colors: Sequence[ColorInput] | ColorIndex[AnyColor],
+    method: str | None = None,
+    **kwargs: Any
+) -> AnyColor:
+    """
+    Get the closest color.
+
+    A color index is only searched if the distancing method is Euclidean in the index's color space,
+    otherwise the indexed colors are scanned so that the result is always the true closest color.
+    """
 
     if method is None:
         method = color.DELTA_E
@@ -17,19 +32,85 @@ def closest(color: AnyColor, colors: Sequence[ColorInput], method: str | None =
     if not algorithm:
         raise ValueError(f"'{method}' is not currently a supported distancing algorithm.")
 
-    lowest = math.inf
-    closest = None
-    for c in colors:
-        color2 = color._handle_color_input(c)
-        de = algorithm.distance(color, color2, **kwargs)
-        if de < lowest:
-            lowest = de
-            closest = color2
-
-    if closest is None:
+    if isinstance(colors, ColorIndex):
+        # Use the index to find the nearest color instead of scanning every color.
+        if algorithm.euclidean_space(**kwargs) == colors.space:
+            return colors.closest(color)
+        samples = colors.colors
+    else:
+        samples = [color._handle_color_input(c) for c in colors]
+    if not samples:
         raise ValueError('No colors to compare')
 
-    return closest
+    deltas = distance_many(algorithm, color, samples, **kwargs)
+    return samples[min(range(len(deltas)), key=deltas.__getitem__)]
+
+
+def distance_many(
+    algorithm: DeltaE,
+    color: AnyColor,
+    samples: Sequence[AnyColor],
+    **kwargs: Any
+) -> list[float]:
+    """
+    Get the distance between a color and each sample.
+
+    The color is only converted once, and the samples are converted and compared in
+    a batch. Algorithms that do not support batches are compared one pair at a time.
+    """
+
+    try:
+        return algorithm.distance_many(
+            algorithm.to_coords(color, **kwargs),
+            algorithm.prepare(samples, **kwargs),
+            **kwargs
+        )
+    except NotImplementedError:
+        return [algorithm.distance(color, s, **kwargs) for s in samples]
+
+
+def distance_pairs(algorithm: DeltaE, colors: Sequence[AnyColor], **kwargs: Any) -> list[list[float]]:
+    """Get the distance between every pair of colors as a matrix."""
+
+    try:
+        return algorithm.distance_pairs(algorithm.prepare(colors, **kwargs), **kwargs)
+    except NotImplementedError:
+        return [[algorithm.distance(c1, c2, **kwargs) for c2 in colors] for c1 in colors]
+
+
+def euclidean_many(
+    reference: VectorLike,
+    samples: Sequence[VectorLike],
+    weights: VectorLike | None = None,
+    scalar: float = 1.0
+) -> list[float]:
+    """
+    Weighted Euclidean distance between a reference and each sample.
+
+    The weights are applied to the squared channel differences.
+    """
+
+    np = util.import_numpy() if len(samples) >= NP_MIN_SAMPLES else None
+    if np is not None:
+        diff = np.asarray(samples, dtype=float) - np.asarray(reference, dtype=float)
+        diff *= diff
+        if weights is not None:
+            diff *= np.asarray(weights, dtype=float)
+        return (np.sqrt(diff.sum(axis=1)) * scalar).tolist()  # type: ignore[no-any-return]
+
+    if len(reference) == 3:
+        # Nearly every distancing space has 3 channels, so unroll the common case.
+        x, y, z = reference
+        wx, wy, wz = (1.0, 1.0, 1.0) if weights is None else weights
+        sqrt = math.sqrt
+        return [
+            scalar * sqrt(wx * (x - s[0]) ** 2 + wy * (y - s[1]) ** 2 + wz * (z - s[2]) ** 2) for s in samples
+        ]
+
+    w = [1.0] * len(reference) if weights is None else weights
+    return [
+        scalar * math.sqrt(sum(wi * (a - b) ** 2 for wi, a, b in zip(w, reference, s))) for s in samples
+    ]
 
 
 def distance_euclidean(color: AnyColor, sample: AnyColor, space: str = "lab-d65") -> float:
@@ -69,3 +150,42 @@ class DeltaE(Plugin, metaclass=ABCMeta):
     @abstractmethod
     def distance(self, color: AnyColor, sample: AnyColor, **kwargs: Any) -> float:
         """Get distance between color and sample."""
+
+    def euclidean_space(self, **kwargs: Any) -> str | None:
+        """
+        Get the rectangular color space the distance is a (scaled) Euclidean distance in.
+
+        If the distance is not simply Euclidean in some color space, `None` is returned.
+        """
+
+        return None
+
+    def to_coords(self, color: AnyColor, **kwargs: Any) -> Vector:
+        """
+        Get the color's coordinates in the algorithm's working space.
+
+        Algorithms that support batch comparisons must implement this and `distance_coords`.
+        """
+
+        raise NotImplementedError(f"'{self.NAME}' does not support batch comparisons")
+
+    def distance_coords(self, coords1: VectorLike, coords2: VectorLike, **kwargs: Any) -> float:
+        """Get the distance between two sets of coordinates in the algorithm's working space."""
+
+        raise NotImplementedError(f"'{self.NAME}' does not support batch comparisons")
+
+    def prepare(self, colors: Iterable[AnyColor], **kwargs: Any) -> list[Vector]:
+        """Get the coordinates of a block of colors in the algorithm's working space."""
+
+        return [self.to_coords(c, **kwargs) for c in colors]
+
+    def distance_many(self, reference: VectorLike, samples: Sequence[VectorLike], **kwargs: Any) -> list[float]:
+        """Get the distance between the reference coordinates and each of the sample coordinates."""
+
+        distance = self.distance_coords
+        return [distance(reference, s, **kwargs) for s in samples]
+
+    def distance_pairs(self, samples: Sequence[VectorLike], **kwargs: Any) -> list[list[float]]:
+        """Get the distance between every pair of sample coordinates as a matrix."""
+
+        return [self.distance_many(s, samples, **kwargs) for s in samples]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 from ..distance import DeltaE
 from ..spaces.lab import CIELab
-from ..types import AnyColor
+from ..types import AnyColor, Vector, VectorLike
 from typing import Any
 
 
@@ -27,6 +27,16 @@ class DE2000(DeltaE):
         self.kh = kh
         self.space = space
 
+    def to_coords(self, color: AnyColor, space: str | None = None, **kwargs: Any) -> Vector:
+        """Get the color's CIE Lab coordinates."""
+
+        if space is None:
+            space = self.space
+        if not isinstance(color.CS_MAP[space], CIELab):
+            raise ValueError("Distance color space must be a CIE Lab color space.")
+
+        return color.convert(space).coords(nans=False)
+
     def distance(
         self,
         color: AnyColor,
@@ -36,6 +46,19 @@ class DE2000(DeltaE):
         kh: float | None = None,
         space: str | None = None,
         **kwargs: Any
+    ) -> float:
+        """Calculate distance."""
+
+        return self.distance_coords(self.to_coords(color, space), self.to_coords(sample, space), kl, kc, kh)
+
+    def distance_coords(
+        self,
+        coords1: VectorLike,
+        coords2: VectorLike,
+        kl: float | None = None,
+        kc: float | None = None,
+        kh: float | None = None,
+        **kwargs: Any
     ) -> float:
         """
         Calculate distance doing a direct translation of the algorithm from the CIE Delta E 2000 paper.
@@ -55,13 +78,8 @@ class DE2000(DeltaE):
         if kh is None:
             kh = self.kh
 
-        if space is None:
-            space = self.space
-        if not isinstance(color.CS_MAP[space], CIELab):
-            raise ValueError("Distance color space must be a CIE Lab color space.")
-
-        l1, a1, b1 = color.convert(space).coords(nans=False)
-        l2, a2, b2 = sample.convert(space).coords(nans=False)
+        l1, a1, b1 = coords1
+        l2, a2, b2 = coords2
 
         # Equation (2)
         c1 = math.sqrt(a1 ** 2 + b1 ** 2)
@@ -1,8 +1,9 @@
 """Delta E 76."""
 from __future__ import annotations
-from ..distance import DeltaE, distance_euclidean
-from ..types import AnyColor
-from typing import Any
+import math
+from ..distance import DeltaE, euclidean_many
+from ..types import AnyColor, Vector, VectorLike
+from typing import Any, Sequence
 from ..spaces.lab import CIELab
 
 
@@ -16,6 +17,21 @@ class DE76(DeltaE):
 
         self.space = space
 
+    def euclidean_space(self, space: str | None = None, **kwargs: Any) -> str | None:
+        """Delta E 1976 is Euclidean distance in the Lab space."""
+
+        return self.space if space is None else space
+
+    def to_coords(self, color: AnyColor, space: str | None = None, **kwargs: Any) -> Vector:
+        """Get the color's CIE Lab coordinates."""
+
+        if space is None:
+            space = self.space
+        if not isinstance(color.CS_MAP[space], CIELab):
+            raise ValueError("Distance color space must be a CIE Lab color space.")
+
+        return color.convert(space, norm=False).coords(nans=False)
+
     def distance(
         self,
         color: AnyColor,
@@ -31,10 +47,15 @@ class DE76(DeltaE):
         Basically this is Euclidean distance in the Lab space.
         """
 
-        if space is None:
-            space = self.space
-        if not isinstance(color.CS_MAP[space], CIELab):
-            raise ValueError("Distance color space must be a CIE Lab color space.")
+        return self.distance_coords(self.to_coords(color, space), self.to_coords(sample, space))
+
+    def distance_coords(self, coords1: VectorLike, coords2: VectorLike, **kwargs: Any) -> float:
+        """Delta E 1976 color distance formula."""
 
         # Equation (1)
-        return distance_euclidean(color, sample, space=space)
+        return math.sqrt(sum((x - y) ** 2 for x, y in zip(coords1, coords2)))
+
+    def distance_many(self, reference: VectorLike, samples: Sequence[VectorLike], **kwargs: Any) -> list[float]:
+        """Delta E 1976 distance of each sample."""
+
+        return euclidean_many(reference, samples)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 from ..distance import DeltaE
 from ..spaces.lab import CIELab
-from .. types import AnyColor
+from ..types import AnyColor, Vector, VectorLike
 from typing import Any
 
 
@@ -26,6 +26,16 @@ class DE94(DeltaE):
         self.k2 = k2
         self.space = space
 
+    def to_coords(self, color: AnyColor, space: str | None = None, **kwargs: Any) -> Vector:
+        """Get the color's CIE Lab coordinates."""
+
+        if space is None:
+            space = self.space
+        if not isinstance(color.CS_MAP[space], CIELab):
+            raise ValueError("Distance color space must be a CIE Lab color space.")
+
+        return color.convert(space).coords(nans=False)
+
     def distance(
         self,
         color: AnyColor,
@@ -35,6 +45,19 @@ class DE94(DeltaE):
         k2: float | None = None,
         space: str | None = None,
         **kwargs: Any
+    ) -> float:
+        """Delta E 1994 color distance formula."""
+
+        return self.distance_coords(self.to_coords(color, space), self.to_coords(sample, space), kl, k1, k2)
+
+    def distance_coords(
+        self,
+        coords1: VectorLike,
+        coords2: VectorLike,
+        kl: float | None = None,
+        k1: float | None = None,
+        k2: float | None = None,
+        **kwargs: Any
     ) -> float:
         """
         Delta E 1994 color distance formula.
@@ -51,13 +74,8 @@ class DE94(DeltaE):
         if k2 is None:
             k2 = self.k2
 
-        if space is None:
-            space = self.space
-        if not isinstance(color.CS_MAP[space], CIELab):
-            raise ValueError("Distance color space must be a CIE Lab color space.")
-
-        l1, a1, b1 = color.convert(space).coords(nans=False)
-        l2, a2, b2 = sample.convert(space).coords(nans=False)
+        l1, a1, b1 = coords1
+        l2, a2, b2 = coords2
 
         # Equation (5)
         c1 = math.sqrt(a1 ** 2 + b1 ** 2)
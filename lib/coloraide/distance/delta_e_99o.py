@@ -4,9 +4,10 @@ Delta E 99o.
 https://de.wikipedia.org/wiki/DIN99-Farbraum
 """
 from __future__ import annotations
-from ..distance import DeltaE, distance_euclidean
-from ..types import AnyColor
-from typing import Any
+import math
+from ..distance import DeltaE, euclidean_many
+from ..types import AnyColor, Vector, VectorLike
+from typing import Any, Sequence
 
 
 class DE99o(DeltaE):
@@ -14,7 +15,22 @@ class DE99o(DeltaE):
 
     NAME = '99o'
 
+    def to_coords(self, color: AnyColor, **kwargs: Any) -> Vector:
+        """Get the color's DIN99o coordinates."""
+
+        return color.convert('din99o', norm=False).coords(nans=False)
+
     def distance(self, color: AnyColor, sample: AnyColor, **kwargs: Any) -> float:
         """Get delta E 99o."""
 
-        return distance_euclidean(color, sample, space='din99o')
+        return self.distance_coords(self.to_coords(color), self.to_coords(sample))
+
+    def distance_coords(self, coords1: VectorLike, coords2: VectorLike, **kwargs: Any) -> float:
+        """Get delta E 99o."""
+
+        return math.sqrt(sum((x - y) ** 2 for x, y in zip(coords1, coords2)))
+
+    def distance_many(self, reference: VectorLike, samples: Sequence[VectorLike], **kwargs: Any) -> list[float]:
+        """Get delta E 99o of each sample."""
+
+        return euclidean_many(reference, samples)
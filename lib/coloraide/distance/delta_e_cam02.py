@@ -11,11 +11,11 @@ https://www.ncbi.nlm.nih.gov/pmc/articles/PMC9698626/pdf/sensors-22-08869.pdf
 """
 from __future__ import annotations
 import math
-from ..distance import DeltaE
+from ..distance import DeltaE, euclidean_many
 from ..spaces.cam02_ucs import CAM02UCS
 from ..spaces.cam16_ucs import COEFFICENTS
-from ..types import AnyColor
-from typing import Any
+from ..types import AnyColor, Vector, VectorLike
+from typing import Any, Sequence
 
 
 class DECAM02(DeltaE):
@@ -23,6 +23,22 @@ class DECAM02(DeltaE):
 
     NAME = "cam02"
 
+    def to_coords(self, color: AnyColor, space: str = "cam02-ucs", **kwargs: Any) -> Vector:
+        """
+        Get the color's UCS coordinates.
+
+        Lightness is pre-scaled by the UCS model's `kl` so coordinates can be compared with simple Euclidean distance.
+        """
+
+        # Normal approach to specifying CAM02 target space
+        cs = color.CS_MAP[space]
+        if not isinstance(cs, CAM02UCS):
+            raise ValueError("Distance color space must be derived from CAM02UCS.")
+        kl = COEFFICENTS[cs.MODEL][0]
+
+        j, a, b = color.convert(space).coords(nans=False)
+        return [j / kl, a, b]
+
     def distance(
         self,
         color: AnyColor,
@@ -32,18 +48,21 @@ class DECAM02(DeltaE):
     ) -> float:
         """Delta E CAM02 color distance formula."""
 
-        # Normal approach to specifying CAM02 target space
-        cs = color.CS_MAP[space]
-        if not isinstance(cs, CAM02UCS):
-            raise ValueError("Distance color space must be derived from CAM02UCS.")
-        model = cs.MODEL
-        kl = COEFFICENTS[model][0]
+        return self.distance_coords(self.to_coords(color, space), self.to_coords(sample, space))
 
-        j1, a1, b1 = color.convert(space).coords(nans=False)
-        j2, a2, b2 = sample.convert(space).coords(nans=False)
+    def distance_coords(self, coords1: VectorLike, coords2: VectorLike, **kwargs: Any) -> float:
+        """Delta E CAM02 color distance formula."""
+
+        j1, a1, b1 = coords1
+        j2, a2, b2 = coords2
 
         dj = j1 - j2
         da = a1 - a2
         db = b1 - b2
 
-        return math.sqrt((dj / kl) ** 2 + da ** 2 + db ** 2)
+        return math.sqrt(dj ** 2 + da ** 2 + db ** 2)
+
+    def distance_many(self, reference: VectorLike, samples: Sequence[VectorLike], **kwargs: Any) -> list[float]:
+        """Delta E CAM02 of each sample."""
+
+        return euclidean_many(reference, samples)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from ..distance import DeltaE
 from ..spaces.lab import CIELab
 import math
-from ..types import AnyColor
+from ..types import AnyColor, Vector, VectorLike
 from typing import Any
 
 
@@ -24,6 +24,16 @@ class DECMC(DeltaE):
         self.c = c
         self.space = space
 
+    def to_coords(self, color: AnyColor, space: str | None = None, **kwargs: Any) -> Vector:
+        """Get the color's CIE Lab coordinates."""
+
+        if space is None:
+            space = self.space
+        if not isinstance(color.CS_MAP[space], CIELab):
+            raise ValueError("Distance color space must be a CIE Lab color space.")
+
+        return color.convert(space).coords(nans=False)
+
     def distance(
         self,
         color: AnyColor,
@@ -32,6 +42,18 @@ class DECMC(DeltaE):
         c: float | None = None,
         space: str | None = None,
         **kwargs: Any
+    ) -> float:
+        """Delta E CMC."""
+
+        return self.distance_coords(self.to_coords(color, space), self.to_coords(sample, space), l, c)
+
+    def distance_coords(
+        self,
+        coords1: VectorLike,
+        coords2: VectorLike,
+        l: float | None = None,
+        c: float | None = None,
+        **kwargs: Any
     ) -> float:
         """
         Delta E CMC.
@@ -45,13 +67,8 @@ class DECMC(DeltaE):
         if c is None:
             c = self.c
 
-        if space is None:
-            space = self.space
-        if not isinstance(color.CS_MAP[space], CIELab):
-            raise ValueError("Distance color space must be a CIE Lab color space.")
-
-        l1, a1, b1 = color.convert(space).coords(nans=False)
-        l2, a2, b2 = sample.convert(space).coords(nans=False)
+        l1, a1, b1 = coords1
+        l2, a2, b2 = coords2
 
         # Equation (3)
         c1 = math.sqrt(a1 ** 2 + b1 ** 2)
@@ -1,10 +1,10 @@
 """Delta E CAM16."""
 from __future__ import annotations
 import math
-from ..distance import DeltaE
+from ..distance import DeltaE, euclidean_many
 from ..spaces.cam16_ucs import COEFFICENTS
-from ..types import VectorLike, AnyColor
-from typing import Any, TYPE_CHECKING
+from ..types import Vector, VectorLike, AnyColor
+from typing import Any, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:  #pragma: no cover
     from ..color import Color
@@ -34,15 +34,28 @@ class DEHCT(DeltaE):
 
     NAME = "hct"
 
+    def to_coords(self, color: AnyColor, **kwargs: Any) -> Vector:
+        """Get the color's tone and UCS a and b coordinates."""
+
+        return list(convert_ucs_ab(
+            color.convert('hct', norm=False) if color.space() != 'hct' else color.clone().normalize(nans=False)
+        ))
+
     def distance(self, color: AnyColor, sample: AnyColor, **kwargs: Any) -> float:
         """Delta E HCT color distance formula."""
 
-        t1, a1, b1 = convert_ucs_ab(
-            color.convert('hct', norm=False) if color.space() != 'hct' else color.clone().normalize(nans=False)
-        )
-        t2, a2, b2 = convert_ucs_ab(
-            sample.convert('hct', norm=False) if sample.space() != 'hct' else sample.clone().normalize(nans=False)
-        )
+        return self.distance_coords(self.to_coords(color), self.to_coords(sample))
+
+    def distance_coords(self, coords1: VectorLike, coords2: VectorLike, **kwargs: Any) -> float:
+        """Delta E HCT color distance formula."""
+
+        t1, a1, b1 = coords1
+        t2, a2, b2 = coords2
 
         # Use simple euclidean distance
         return math.sqrt((t1 - t2) ** 2 + (a1 - a2) ** 2 + (b1 - b2) ** 2)
+
+    def distance_many(self, reference: VectorLike, samples: Sequence[VectorLike], **kwargs: Any) -> list[float]:
+        """Delta E HCT of each sample."""
+
+        return euclidean_many(reference, samples)
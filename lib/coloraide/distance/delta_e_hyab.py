@@ -3,7 +3,7 @@ from __future__ import annotations
 from ..distance import DeltaE
 import math
 from ..spaces import Labish
-from ..types import AnyColor
+from ..types import AnyColor, Vector, VectorLike
 from typing import Any
 
 
@@ -17,24 +17,32 @@ class DEHyAB(DeltaE):
 
         self.space = space
 
-    def distance(self, color: AnyColor, sample: AnyColor, space: str | None = None, **kwargs: Any) -> float:
-        """
-        HyAB distance for Lab-ish spaces.
-
-        http://markfairchild.org/PDFs/PAP40.pdf.
-        """
+    def to_coords(self, color: AnyColor, space: str | None = None, **kwargs: Any) -> Vector:
+        """Get the color's lightness, a, and b coordinates."""
 
         if space is None:
             space = self.space
 
         color = color.convert(space)
-        sample = sample.convert(space)
 
         if not isinstance(color._space, Labish):
             raise ValueError(f"The space '{space}' is not a 'lab-ish' color space and cannot use HyAB")
 
-        names = color._space.names()
-        l1, a1, b1 = color.get(names, nans=False)
-        l2, a2, b2 = sample.get(names, nans=False)
+        return color.get(color._space.names(), nans=False)
+
+    def distance(self, color: AnyColor, sample: AnyColor, space: str | None = None, **kwargs: Any) -> float:
+        """
+        HyAB distance for Lab-ish spaces.
+
+        http://markfairchild.org/PDFs/PAP40.pdf.
+        """
+
+        return self.distance_coords(self.to_coords(color, space), self.to_coords(sample, space))
+
+    def distance_coords(self, coords1: VectorLike, coords2: VectorLike, **kwargs: Any) -> float:
+        """HyAB distance for Lab-ish spaces."""
+
+        l1, a1, b1 = coords1
+        l2, a2, b2 = coords2
 
         return abs(l1 - l2) + math.sqrt((a1 - a2) ** 2 + (b1 - b2) ** 2)
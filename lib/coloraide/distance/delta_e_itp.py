@@ -5,9 +5,11 @@ https://kb.portrait.com/help/ictcp-color-difference-metric
 """
 from __future__ import annotations
 import math
-from ..distance import DeltaE
-from ..types import AnyColor
-from typing import Any
+from ..distance import DeltaE, euclidean_many
+from ..types import AnyColor, Vector, VectorLike
+from typing import Any, Sequence
+
+WEIGHTS = (1.0, 0.25, 1.0)
 
 
 class DEITP(DeltaE):
@@ -20,14 +22,41 @@ class DEITP(DeltaE):
 
         self.scalar = scalar
 
+    def to_coords(self, color: AnyColor, **kwargs: Any) -> Vector:
+        """Get the color's ICtCp coordinates."""
+
+        return color.convert('ictcp').coords(nans=False)
+
     def distance(self, color: AnyColor, sample: AnyColor, scalar: float | None = None, **kwargs: Any) -> float:
         """Delta E ITP color distance formula."""
 
+        return self.distance_coords(self.to_coords(color), self.to_coords(sample), scalar)
+
+    def distance_coords(
+        self,
+        coords1: VectorLike,
+        coords2: VectorLike,
+        scalar: float | None = None,
+        **kwargs: Any
+    ) -> float:
+        """Delta E ITP color distance formula."""
+
         if scalar is None:
             scalar = self.scalar
 
-        i1, t1, p1 = color.convert('ictcp').coords(nans=False)
-        i2, t2, p2 = sample.convert('ictcp').coords(nans=False)
+        i1, t1, p1 = coords1
+        i2, t2, p2 = coords2
 
         # Equation (1)
         return scalar * math.sqrt((i1 - i2) ** 2 + 0.25 * (t1 - t2) ** 2 + (p1 - p2) ** 2)
+
+    def distance_many(
+        self,
+        reference: VectorLike,
+        samples: Sequence[VectorLike],
+        scalar: float | None = None,
+        **kwargs: Any
+    ) -> list[float]:
+        """Delta E ITP of each sample."""
+
+        return euclidean_many(reference, samples, WEIGHTS, self.scalar if scalar is None else scalar)
@@ -1,8 +1,9 @@
 """Delta E OK."""
 from __future__ import annotations
-from ..distance import DeltaE, distance_euclidean
-from ..types import AnyColor
-from typing import Any
+import math
+from ..distance import DeltaE, euclidean_many
+from ..types import AnyColor, Vector, VectorLike
+from typing import Any, Sequence
 
 
 class DEOK(DeltaE):
@@ -15,6 +16,16 @@ class DEOK(DeltaE):
 
         self.scalar = scalar
 
+    def euclidean_space(self, **kwargs: Any) -> str | None:
+        """Delta E OK is Euclidean distance in the Oklab space."""
+
+        return 'oklab'
+
+    def to_coords(self, color: AnyColor, **kwargs: Any) -> Vector:
+        """Get the color's Oklab coordinates."""
+
+        return color.convert('oklab', norm=False).coords(nans=False)
+
     def distance(self, color: AnyColor, sample: AnyColor, scalar: float | None = None, **kwargs: Any) -> float:
         """
         Delta E OK color distance formula.
@@ -22,7 +33,29 @@ class DEOK(DeltaE):
         This just uses simple Euclidean distance in the Oklab color space.
         """
 
+        return self.distance_coords(self.to_coords(color), self.to_coords(sample), scalar)
+
+    def distance_coords(
+        self,
+        coords1: VectorLike,
+        coords2: VectorLike,
+        scalar: float | None = None,
+        **kwargs: Any
+    ) -> float:
+        """Delta E OK color distance formula."""
+
         if scalar is None:
             scalar = self.scalar
 
-        return scalar * distance_euclidean(color, sample, space='oklab')
+        return scalar * math.sqrt(sum((x - y) ** 2 for x, y in zip(coords1, coords2)))
+
+    def distance_many(
+        self,
+        reference: VectorLike,
+        samples: Sequence[VectorLike],
+        scalar: float | None = None,
+        **kwargs: Any
+    ) -> list[float]:
+        """Delta E OK of each sample."""
+
+        return euclidean_many(reference, samples, scalar=self.scalar if scalar is None else scalar)
@@ -6,7 +6,7 @@ https://www.osapublishing.org/oe/fulltext.cfm?uri=oe-25-13-15131&id=368272
 from __future__ import annotations
 import math
 from ..distance import DeltaE
-from ..types import AnyColor
+from ..types import AnyColor, Vector, VectorLike
 from typing import Any
 
 
@@ -15,11 +15,21 @@ class DEZ(DeltaE):
 
     NAME = "jz"
 
+    def to_coords(self, color: AnyColor, **kwargs: Any) -> Vector:
+        """Get the color's Jzazbz coordinates."""
+
+        return color.convert('jzazbz').coords(nans=False)
+
     def distance(self, color: AnyColor, sample: AnyColor, **kwargs: Any) -> float:
         """Delta E z color distance formula."""
 
-        jz1, az1, bz1 = color.convert('jzazbz').coords(nans=False)
-        jz2, az2, bz2 = sample.convert('jzazbz').coords(nans=False)
+        return self.distance_coords(self.to_coords(color), self.to_coords(sample))
+
+    def distance_coords(self, coords1: VectorLike, coords2: VectorLike, **kwargs: Any) -> float:
+        """Delta E z color distance formula."""
+
+        jz1, az1, bz1 = coords1
+        jz2, az2, bz2 = coords2
 
         cz1 = math.sqrt(az1 ** 2 + bz1 ** 2)
         cz2 = math.sqrt(az2 ** 2 + bz2 ** 2)
@@ -0,0 +1,211 @@
+"""
+Color index for fast nearest color queries.
+
+Colors are converted once to a rectangular, perceptual color space (Lab, Oklab, CAM16 UCS, etc.)
+and stored in a k-d tree so that nearest neighbor and radius queries do not need to scan and
+convert every color. Non-Euclidean distancing methods, such as ΔE 2000, are handled by re-ranking
+the nearest Euclidean candidates with the requested method.
+
+https://en.wikipedia.org/wiki/K-d_tree
+"""
+from __future__ import annotations
+import heapq
+import math
+from ..types import ColorInput, AnyColor, Vector
+from typing import Any, Generic, Iterable
+
+# Number of Euclidean candidates to gather per requested result when re-ranking.
+OVERSAMPLE = 4
+MIN_CANDIDATES = 16
+
+
+class _Node:
+    """K-d tree node."""
+
+    __slots__ = ('index', 'axis', 'left', 'right')
+
+    def __init__(self, index: int, axis: int, left: _Node | None, right: _Node | None) -> None:
+        """Initialize."""
+
+        self.index = index
+        self.axis = axis
+        self.left = left
+        self.right = right
+
+
+def _build(points: list[Vector], indices: list[int], depth: int, dims: int) -> _Node | None:
+    """Build a balanced k-d tree by splitting on the median of each axis in turn."""
+
+    if not indices:
+        return None
+
+    axis = depth % dims
+    indices.sort(key=lambda i: points[i][axis])
+    mid = len(indices) // 2
+    return _Node(
+        indices[mid],
+        axis,
+        _build(points, indices[:mid], depth + 1, dims),
+        _build(points, indices[mid + 1:], depth + 1, dims)
+    )
+
+
+def _dist_sq(a: Vector, b: Vector) -> float:
+    """Squared Euclidean distance."""
+
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+class ColorIndex(Generic[AnyColor]):
+    """
+    Index of colors for fast nearest color lookups.
+
+    Distances are Euclidean distances in the index's color space unless a distancing method is
+    specified, in which case the nearest Euclidean candidates are re-ranked with that method.
+    """
+
+    def __init__(
+        self,
+        color_cls: type[AnyColor],
+        colors: Iterable[ColorInput],
+        space: str = 'lab-d65'
+    ) -> None:
+        """Initialize."""
+
+        cs = color_cls.CS_MAP.get(space)
+        if cs is None:
+            raise ValueError(f"'{space}' is not a registered color space")
+        if cs.is_polar():
+            raise ValueError(f"Color index requires a rectangular color space, '{space}' is polar")
+
+        self.color_cls = color_cls
+        self.space = space
+        self.colors = []  # type: list[AnyColor]
+        self.points = []  # type: list[Vector]
+        for c in colors:
+            color = color_cls._handle_color_input(c)
+            self.colors.append(color)
+            self.points.append(color.convert(space, norm=False).coords(nans=False))
+
+        self._dims = len(cs.CHANNELS)
+        self._root = _build(self.points, list(range(len(self.points))), 0, self._dims)
+
+    def __len__(self) -> int:
+        """Number of indexed colors."""
+
+        return len(self.colors)
+
+    def _point(self, color: ColorInput) -> tuple[AnyColor, Vector]:
+        """Get the color and its coordinates in the index's color space."""
+
+        obj = self.color_cls._handle_color_input(color)
+        return obj, obj.convert(self.space, norm=False).coords(nans=False)
+
+    def _knn(self, point: Vector, k: int) -> list[tuple[float, int]]:
+        """Find the `k` nearest points, returning squared distances and indexes, nearest first."""
+
+        # Max heap (via negated distances) of the best candidates found so far
+        best = []  # type: list[tuple[float, int]]
+        # Nodes to visit along with the squared distance to the split that separates them from the point.
+        stack = [(self._root, 0.0)]  # type: list[tuple[_Node | None, float]]
+        while stack:
+            node, bound = stack.pop()
+            # Skip branches that cannot contain a closer point than what we already have.
+            if node is None or (len(best) == k and bound >= -best[0][0]):
+                continue
+
+            d = _dist_sq(point, self.points[node.index])
+            if len(best) < k:
+                heapq.heappush(best, (-d, node.index))
+            elif d < -best[0][0]:
+                heapq.heapreplace(best, (-d, node.index))
+
+            diff = point[node.axis] - self.points[node.index][node.axis]
+            near, far = (node.left, node.right) if diff < 0 else (node.right, node.left)
+
+            # The far side is pushed first so the near side is searched first.
+            stack.append((far, diff * diff))
+            stack.append((near, bound))
+
+        return sorted((-d, i) for d, i in best)
+
+    def within(self, color: ColorInput, radius: float) -> list[tuple[AnyColor, float]]:
+        """Find all colors within the Euclidean radius of the color in the index's color space, nearest first."""
+
+        point = self._point(color)[1]
+        r2 = radius * radius
+        found = []  # type: list[tuple[float, int]]
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            d = _dist_sq(point, self.points[node.index])
+            if d <= r2:
+                found.append((d, node.index))
+
+            diff = point[node.axis] - self.points[node.index][node.axis]
+            if diff < 0 or diff * diff <= r2:
+                stack.append(node.left)
+            if diff >= 0 or diff * diff <= r2:
+                stack.append(node.right)
+
+        found.sort()
+        return [(self.colors[i], math.sqrt(d)) for d, i in found]
+
+    def nearest(
+        self,
+        color: ColorInput,
+        k: int = 1,
+        *,
+        method: str | None = None,
+        candidates: int | None = None,
+        **kwargs: Any
+    ) -> list[tuple[AnyColor, float]]:
+        """
+        Find the `k` nearest colors, nearest first.
+
+        If a distancing method is specified, the `candidates` nearest colors (by Euclidean distance
+        in the index's color space) are re-ranked with the given method. Perceptual distancing methods
+        correlate well with Euclidean distance in perceptual spaces, but re-ranking a candidate set is
+        an approximation, so `candidates` can be increased if more certainty is required. Methods that
+        are Euclidean in the index's color space, such as ΔE 76 in an index of Lab colors, are exact.
+        """
+
+        if k < 1 or not self.colors:
+            return []
+
+        obj, point = self._point(color)
+
+        if method is None:
+            return [(self.colors[i], math.sqrt(d)) for d, i in self._knn(point, k)]
+
+        # Imported here as the distance package imports this module.
+        from . import distance_many
+
+        algorithm = self.color_cls.DE_MAP.get(method)
+        if not algorithm:
+            raise ValueError(f"'{method}' is not currently a supported distancing algorithm.")
+
+        if algorithm.euclidean_space(**kwargs) == self.space:
+            candidates = k
+        elif candidates is None:
+            candidates = max(k * OVERSAMPLE, MIN_CANDIDATES)
+        found = [i for _, i in self._knn(point, max(k, candidates))]
+        deltas = distance_many(algorithm, obj, [self.colors[i] for i in found], **kwargs)
+        ranked = sorted(zip(deltas, found))
+        return [(self.colors[i], d) for d, i in ranked[:k]]
+
+    def closest(self, color: ColorInput, *, method: str | None = None, **kwargs: Any) -> AnyColor:
+        """
+        Get the closest color.
+
+        As with `nearest`, the result is approximate if a distancing method is specified that is not
+        Euclidean in the index's color space. Use `distance.closest` to always get the exact result.
+        """
+
+        results = self.nearest(color, 1, method=method, **kwargs)
+        if not results:
+            raise ValueError('No colors to compare')
+        return results[0][0]
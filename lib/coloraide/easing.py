@@ -37,29 +37,31 @@ x'(t) = 3axt2 + 2bxt + cx
 ```
 
 This greatly simplifies things and makes it faster.
+
+To find the `t` for a given `x`, `x(t)` is sampled at evenly spaced `t` values when the
+easing function is created. The samples bracket the target and provide an initial guess which
+is refined with Newton's method, falling back to bisection within the bracket if the slope is
+too shallow to converge. This is the same approach browsers take.
 """
 from __future__ import annotations
+import bisect
 import functools
-from . import algebra as alg
 from typing import Callable
 
-
-def _bezier(a: float, b: float, c: float, y: float = 0.0) -> Callable[[float], float]:
-    """
-    Calculate the Bezier point.
-
-    We know that P0 and P3 are always (0, 0) and (1, 1) respectively.
-    Knowing this we can simplify the equation by precalculating them in.
-    """
-
-    return lambda x: a * x ** 3 + b * x ** 2 + c * x - y
+SAMPLES = 11
+SAMPLE_STEP = 1.0 / (SAMPLES - 1)
+NEWTON_ITERATIONS = 4
+NEWTON_MIN_SLOPE = 1e-3
+EPSILON = 1e-12
+BISECT_MAX_ITERATIONS = 50
 
 
 def _solve_bezier(
     target: float,
     a: float,
     b: float,
-    c: float
+    c: float,
+    samples: tuple[float, ...]
 ) -> float:
     """
     Solve curve to find a `t` that satisfies our desired `x` (target).
@@ -72,15 +74,43 @@ def _solve_bezier(
     if target <= 0.0 or target >= 1.0:
         return target
 
-    roots = alg.solve_poly([a, b, c, -target])
-    # Find value within range
-    for r in roots:
-        # Solution is well within range
-        if 0 <= r <= 1:
-            return r
-
-    # We should never hit this in normal situations
-    raise ValueError(f'Could not find a solution for {a}t ** 3 + {b}t ** 2 + {c} = {target}')
+    # Find the samples that bracket the target and interpolate between them for an initial guess.
+    # As `x` values are restricted to 0 - 1, `x(t)` never decreases.
+    index = min(bisect.bisect_right(samples, target), SAMPLES - 1) - 1
+    lo = index * SAMPLE_STEP
+    hi = lo + SAMPLE_STEP
+    span = samples[index + 1] - samples[index]
+    t = lo + ((target - samples[index]) / span if span else 0.0) * SAMPLE_STEP
+
+    # Refine with Newton's method
+    if (3 * a * t + 2 * b) * t + c >= NEWTON_MIN_SLOPE:
+        for _ in range(NEWTON_ITERATIONS):
+            x = ((a * t + b) * t + c) * t - target
+            if abs(x) < EPSILON:
+                return t
+            slope = (3 * a * t + 2 * b) * t + c
+            if not slope:
+                break
+            t -= x / slope
+
+        if lo <= t <= hi and abs(((a * t + b) * t + c) * t - target) < EPSILON:
+            return t
+
+    # Bisect the bracket when the slope is too shallow for Newton's method to converge quickly.
+    # A shallow slope means `x` barely changes with `t`, so narrow down `t` and not `x`.
+    t = (lo + hi) / 2
+    for _ in range(BISECT_MAX_ITERATIONS):
+        if hi - lo < EPSILON:
+            break
+        x = ((a * t + b) * t + c) * t - target
+        if x == 0:
+            break
+        if x > 0:
+            hi = t
+        else:
+            lo = t
+        t = (lo + hi) / 2
+    return t
 
 
 def _extrapolate(t: float, p1: tuple[float, float], p2: tuple[float, float]) -> float:
@@ -128,7 +158,8 @@ def _calc_bezier(
     b: tuple[float, float],
     c: tuple[float, float],
     p1: tuple[float, float],
-    p2: tuple[float, float]
+    p2: tuple[float, float],
+    samples: tuple[float, ...]
 ) -> float:
     """
     Calculate the y value of the bezier curve with the given `x`.
@@ -138,19 +169,23 @@ def _calc_bezier(
     """
 
     # Solve for `t` in relation to `x`
-    t = _solve_bezier(target, a[0], b[0], c[0])
+    t = _solve_bezier(target, a[0], b[0], c[0], samples)
 
     # Extrapolate for `y` per the spec
     if t > 1 or t < 0:
         return _extrapolate(t, p1, p2)
 
     # Use the found `t` to locate the `y`
-    y = _bezier(a[1], b[1], c[1])(t)
-    return y
+    return ((a[1] * t + b[1]) * t + c[1]) * t
 
 
+@functools.lru_cache(maxsize=128)
 def cubic_bezier(x1: float, y1: float, x2: float, y2: float) -> Callable[..., float]:
-    """Return a cubic bezier easing function."""
+    """
+    Return a cubic bezier easing function.
+
+    Easing functions are cached by their control points.
+    """
 
     if x1 < 0 or x1 > 1 or x2 < 0 or x2 > 1:
         raise ValueError("Cubic Bezier requires 'x' values to be between 0 - 1")
@@ -164,7 +199,12 @@ def cubic_bezier(x1: float, y1: float, x2: float, y2: float) -> Callable[..., fl
     by = 3.0 * (y2 - y1) - cy
     ay = 1.0 - cy - by
 
-    return functools.partial(_calc_bezier, a=(ax, ay), b=(bx, by), c=(cx, cy), p1=(x1, y1), p2=(x2, y2))
+    # Sample `x(t)` to quickly bracket and estimate `t` for a given `x`
+    samples = tuple(((ax * t + bx) * t + cx) * t for t in (i * SAMPLE_STEP for i in range(SAMPLES)))
+
+    return functools.partial(
+        _calc_bezier, a=(ax, ay), b=(bx, by), c=(cx, cy), p1=(x1, y1), p2=(x2, y2), samples=samples
+    )
 
 
 def linear(t: float) -> float:
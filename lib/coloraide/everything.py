@@ -1,47 +1,7 @@
 """Everything and the kitchen sink."""
 from __future__ import annotations
 from .color import Color as Base
-from .spaces.din99o import DIN99o
-from .spaces.lch99o import LCh99o
-from .spaces.luv import Luv
-from .spaces.lchuv import LChuv
-from .spaces.hsluv import HSLuv
-from .spaces.hpluv import HPLuv
-from .spaces.okhsl import Okhsl
-from .spaces.okhsv import Okhsv
-from .spaces.oklrab import Oklrab
-from .spaces.oklrch import OkLrCh
-from .spaces.hsi import HSI
-from .spaces.ipt import IPT
-from .spaces.igpgtg import IgPgTg
-from .spaces.cmy import CMY
-from .spaces.cmyk import CMYK
-from .spaces.xyy import xyY
-from .spaces.xyb import XYB
-from .spaces.hunter_lab import HunterLab
-from .spaces.prismatic import Prismatic
-from .spaces.rlab import RLAB
-from .spaces.orgb import oRGB
-from .spaces.aces2065_1 import ACES20651
-from .spaces.acescg import ACEScg
-from .spaces.acescc import ACEScc
-from .spaces.acescct import ACEScct
-from .spaces.cam02 import CAM02JMh
-from .spaces.cam02_ucs import CAM02UCS, CAM02LCD, CAM02SCD
-from .spaces.cam16 import CAM16JMh
-from .spaces.cam16_ucs import CAM16UCS, CAM16LCD, CAM16SCD
-from .spaces.hellwig import HellwigJMh, HellwigHKJMh
-from .spaces.zcam import ZCAMJMh
-from .spaces.scam import sCAMJMh
-from .spaces.sucs import sUCS
-from .spaces.hct import HCT
-from .spaces.ucs import UCS
-from .spaces.rec709 import Rec709
-from .spaces.rec709_oetf import Rec709OETF
-from .spaces.ryb import RYB, RYBBiased
-from .spaces.cubehelix import Cubehelix
-from .spaces.rec2020_oetf import Rec2020OETF
-from .spaces.msh import Msh
+from .spaces import LazySpace
 from .distance.delta_e_99o import DE99o
 from .distance.delta_e_cam16 import DECAM16
 from .distance.delta_e_cam02 import DECAM02
@@ -60,57 +20,59 @@ __all__ = ('ColorAll', 'ColorMatch', 'stop', 'hint', 'NaN')
 class ColorAll(Base):
     """Color with all plugins."""
 
+    __slots__ = ()
+
 
 ColorAll.register(
     [
         # Spaces
-        Rec709(),
-        Rec709OETF(),
-        DIN99o(),
-        LCh99o(),
-        Luv(),
-        LChuv(),
-        Okhsl(),
-        Okhsv(),
-        Oklrab(),
-        OkLrCh(),
-        HSLuv(),
-        HPLuv(),
-        HSI(),
-        IPT(),
-        IgPgTg(),
-        CMY(),
-        CMYK(),
-        xyY(),
-        XYB(),
-        HunterLab(),
-        Prismatic(),
-        RLAB(),
-        oRGB(),
-        ACES20651(),
-        ACEScg(),
-        ACEScc(),
-        ACEScct(),
-        CAM02JMh(),
-        CAM02UCS(),
-        CAM02LCD(),
-        CAM02SCD(),
-        CAM16JMh(),
-        CAM16UCS(),
-        CAM16SCD(),
-        CAM16LCD(),
-        HellwigJMh(),
-        HellwigHKJMh(),
-        HCT(),
-        UCS(),
-        RYB(),
-        RYBBiased(),
-        Cubehelix(),
-        ZCAMJMh(),
-        Rec2020OETF(),
-        Msh(),
-        sCAMJMh(),
-        sUCS(),
+        LazySpace('rec709', '.spaces.rec709.Rec709', ('--rec709',)),
+        LazySpace('rec709-oetf', '.spaces.rec709_oetf.Rec709OETF', ('--rec709-oetf',)),
+        LazySpace('din99o', '.spaces.din99o.DIN99o', ('--din99o',)),
+        LazySpace('lch99o', '.spaces.lch99o.LCh99o', ('--lch99o',)),
+        LazySpace('luv', '.spaces.luv.Luv', ('--luv',)),
+        LazySpace('lchuv', '.spaces.lchuv.LChuv', ('--lchuv',)),
+        LazySpace('okhsl', '.spaces.okhsl.Okhsl', ('--okhsl',)),
+        LazySpace('okhsv', '.spaces.okhsv.Okhsv', ('--okhsv',)),
+        LazySpace('oklrab', '.spaces.oklrab.Oklrab', ('--oklrab',)),
+        LazySpace('oklrch', '.spaces.oklrch.OkLrCh', ('--oklrch',)),
+        LazySpace('hsluv', '.spaces.hsluv.HSLuv', ('--hsluv',)),
+        LazySpace('hpluv', '.spaces.hpluv.HPLuv', ('--hpluv',)),
+        LazySpace('hsi', '.spaces.hsi.HSI', ('--hsi',)),
+        LazySpace('ipt', '.spaces.ipt.IPT', ('--ipt',)),
+        LazySpace('igpgtg', '.spaces.igpgtg.IgPgTg', ('--igpgtg',)),
+        LazySpace('cmy', '.spaces.cmy.CMY', ('--cmy',)),
+        LazySpace('cmyk', '.spaces.cmyk.CMYK', ('--cmyk',)),
+        LazySpace('xyy', '.spaces.xyy.xyY', ('--xyy',)),
+        LazySpace('xyb', '.spaces.xyb.XYB', ('--xyb',)),
+        LazySpace('hunter-lab', '.spaces.hunter_lab.HunterLab', ('--hunter-lab',)),
+        LazySpace('prismatic', '.spaces.prismatic.Prismatic', ('--prismatic',)),
+        LazySpace('rlab', '.spaces.rlab.RLAB', ('--rlab',)),
+        LazySpace('orgb', '.spaces.orgb.oRGB', ('--orgb',)),
+        LazySpace('aces2065-1', '.spaces.aces2065_1.ACES20651', ('--aces2065-1',)),
+        LazySpace('acescg', '.spaces.acescg.ACEScg', ('--acescg',)),
+        LazySpace('acescc', '.spaces.acescc.ACEScc', ('--acescc',)),
+        LazySpace('acescct', '.spaces.acescct.ACEScct', ('--acescct',)),
+        LazySpace('cam02-jmh', '.spaces.cam02.CAM02JMh', ('--cam02-jmh',)),
+        LazySpace('cam02-ucs', '.spaces.cam02_ucs.CAM02UCS', ('--cam02-ucs',)),
+        LazySpace('cam02-lcd', '.spaces.cam02_ucs.CAM02LCD', ('--cam02-lcd',)),
+        LazySpace('cam02-scd', '.spaces.cam02_ucs.CAM02SCD', ('--cam02-scd',)),
+        LazySpace('cam16-jmh', '.spaces.cam16.CAM16JMh', ('--cam16-jmh',)),
+        LazySpace('cam16-ucs', '.spaces.cam16_ucs.CAM16UCS', ('--cam16-ucs',)),
+        LazySpace('cam16-scd', '.spaces.cam16_ucs.CAM16SCD', ('--cam16-scd',)),
+        LazySpace('cam16-lcd', '.spaces.cam16_ucs.CAM16LCD', ('--cam16-lcd',)),
+        LazySpace('hellwig-jmh', '.spaces.hellwig.HellwigJMh', ('--hellwig-jmh',)),
+        LazySpace('hellwig-hk-jmh', '.spaces.hellwig.HellwigHKJMh', ('--hellwig-hk-jmh',)),
+        LazySpace('hct', '.spaces.hct.HCT', ('--hct',)),
+        LazySpace('ucs', '.spaces.ucs.UCS', ('--ucs',)),
+        LazySpace('ryb', '.spaces.ryb.RYB', ('--ryb',)),
+        LazySpace('ryb-biased', '.spaces.ryb.RYBBiased', ('--ryb-biased',)),
+        LazySpace('cubehelix', '.spaces.cubehelix.Cubehelix', ('--cubehelix',)),
+        LazySpace('zcam-jmh', '.spaces.zcam.ZCAMJMh', ('--zcam-jmh',)),
+        LazySpace('rec2020-oetf', '.spaces.rec2020_oetf.Rec2020OETF', ('--rec2020-oetf',)),
+        LazySpace('msh', '.spaces.msh.Msh', ('--msh',)),
+        LazySpace('scam-jmh', '.spaces.scam.sCAMJMh', ('--scam-jmh',)),
+        LazySpace('sucs', '.spaces.sucs.sUCS', ('--sucs',)),
 
         # Delta E
         DE99o(),
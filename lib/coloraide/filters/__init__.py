@@ -2,7 +2,7 @@
 from __future__ import annotations
 from abc import ABCMeta, abstractmethod
 from ..types import Plugin, AnyColor
-from typing import Any, TYPE_CHECKING
+from typing import Any, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:  #pragma: no cover
     from ..color import Color
@@ -19,6 +19,16 @@ class Filter(Plugin, metaclass=ABCMeta):
     def filter(self, color: Color, amount: float | None, **kwargs: Any) -> None:  # noqa: A003
         """Filter the given color."""
 
+    def filter_many(self, colors: Sequence[Color], amount: float | None, **kwargs: Any) -> None:
+        """
+        Filter the given colors.
+
+        Colors are filtered one at a time unless a filter can share work across the batch.
+        """
+
+        for color in colors:
+            self.filter(color, amount, **kwargs)
+
 
 def filters(
     color: AnyColor,
@@ -49,3 +59,39 @@ def filters(
     c = color.convert(space, in_place=in_place, norm=False).normalize()
     f.filter(c, amount, **kwargs)
     return c.convert(out_space, in_place=True)
+
+
+def filters_many(
+    colors: Sequence[AnyColor],
+    name: str,
+    amount: float | None = None,
+    space: str | None = None,
+    out_space: str | None = None,
+    in_place: bool = False,
+    **kwargs: Any
+) -> list[AnyColor]:
+    """Filter many colors with the same filter and amount."""
+
+    if not colors:
+        return []
+
+    f = colors[0].FILTER_MAP.get(name)
+    if not f:
+        raise ValueError(f"'{name}' filter is not supported")
+
+    if space is None:
+        space = f.DEFAULT_SPACE
+
+    if space not in f.ALLOWED_SPACES:
+        raise ValueError(
+            f"The '{name}' only supports filtering in the {f.ALLOWED_SPACES!s} spaces, not '{space}'"
+        )
+
+    if out_space is None:
+        out_space = space
+
+    filtered = [c.convert(space, in_place=in_place, norm=False).normalize() for c in colors]
+    f.filter_many(filtered, amount, **kwargs)
+    for c in filtered:
+        c.convert(out_space, in_place=True)
+    return filtered
@@ -3,7 +3,7 @@ from __future__ import annotations
 from .. import algebra as alg
 from ..filters import Filter
 from ..types import Vector, Matrix
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Any, Callable, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:  #pragma: no cover
     from ..color import Color
@@ -136,11 +136,11 @@ def brettel(color: Color, severity: float, wings: tuple[Matrix, Matrix, Vector])
     w1, w2, sep = wings
 
     # Convert to LMS
-    lms_c = alg.matmul_x3(LRGB_TO_LMS, color[:-1], dims=alg.D2_D1)
+    lms_c = alg.matvec_x3(LRGB_TO_LMS, color[:-1])
 
     # Apply appropriate wing filter based on which side of the separator we are on.
     # Tritanopia filter and LMS to sRGB conversion are included in the same matrix.
-    coords = alg.matmul_x3(w2 if alg.matmul_x3(lms_c, sep, dims=alg.D1) > 0 else w1, lms_c, dims=alg.D2_D1)
+    coords = alg.matvec_x3(w2 if alg.vecdot_x3(lms_c, sep) > 0 else w1, lms_c)
 
     if severity < 1:
         color[:-1] = [alg.lerp(a, b, severity) for a, b in zip(color[:-1], coords)]
@@ -164,7 +164,7 @@ def vienot(color: Color, severity: float, transform: Matrix) -> None:
     then we interpolate against the original color.
     """
 
-    coords = alg.matmul_x3(transform, color[:-1], dims=alg.D2_D1)
+    coords = alg.matvec_x3(transform, color[:-1])
     if severity < 1:
         color[:-1] = [alg.lerp(c1, c2, severity) for c1, c2 in zip(color[:-1], coords)]
     else:
@@ -187,7 +187,7 @@ def machado(color: Color, severity: float, matrices: dict[int, Matrix]) -> None:
 
     # Filter the color according to the severity
     m1 = matrices[severity1]
-    coords = alg.matmul_x3(m1, color[:-1], dims=alg.D2_D1)
+    coords = alg.matvec_x3(m1, color[:-1])
 
     # If severity was not exact, and it also isn't max severity,
     # let's calculate the next most severity and interpolate
@@ -204,13 +204,55 @@ def machado(color: Color, severity: float, matrices: dict[int, Matrix]) -> None:
         # but it ends up being faster just modifying the color on both the high
         # and low matrix and interpolating the color than interpolating the matrix
         # and then applying it to the color. The results are identical as well.
-        coords2 = alg.matmul_x3(m2, color[:-1], dims=alg.D2_D1)
+        coords2 = alg.matvec_x3(m2, color[:-1])
         coords = [alg.lerp(c1, c2, weight) for c1, c2 in zip(coords, coords2)]
 
     # Return the altered color
     color[:-1] = coords
 
 
+def brettel_matrices(severity: float, wings: tuple[Matrix, Matrix, Vector]) -> tuple[Matrix, Matrix, Vector]:
+    """
+    Get Brettel's wing filters, and separator, as transforms of linear sRGB.
+
+    The conversion to LMS, and any interpolation with the original color, are folded into the matrices.
+    """
+
+    w1, w2, sep = wings
+    w1 = alg.matmul_x3(w1, LRGB_TO_LMS, dims=alg.D2)
+    w2 = alg.matmul_x3(w2, LRGB_TO_LMS, dims=alg.D2)
+    sep = alg.matmul_x3(sep, LRGB_TO_LMS, dims=alg.D1_D2)
+    if severity < 1:
+        w1 = _lerp_identity(w1, severity)
+        w2 = _lerp_identity(w2, severity)
+    return w1, w2, sep
+
+
+def vienot_matrix(severity: float, transform: Matrix) -> Matrix:
+    """Get the Viénot transform for the given severity."""
+
+    return _lerp_identity(transform, severity) if severity < 1 else transform
+
+
+def machado_matrix(severity: float, matrices: dict[int, Matrix]) -> Matrix:
+    """Get the Machado transform for the given severity, interpolating between the nearest severities."""
+
+    severity *= 10
+    severity1 = int(severity)
+    m1 = matrices[severity1]
+    if severity1 != severity and severity1 < 10:
+        m2 = matrices[severity1 + 1]
+        weight = severity - severity1
+        return [[alg.lerp(a, b, weight) for a, b in zip(r1, r2)] for r1, r2 in zip(m1, m2)]
+    return m1
+
+
+def _lerp_identity(m: Matrix, t: float) -> Matrix:
+    """Interpolate between the identity matrix and the given matrix."""
+
+    return [[alg.lerp(1.0 if i == j else 0.0, v, t) for j, v in enumerate(row)] for i, row in enumerate(m)]
+
+
 class Protan(Filter):
     """Protanopia filter."""
 
@@ -269,6 +311,36 @@ class Protan(Filter):
         amount = alg.clamp(1 if amount is None else amount, 0, 1)
         self.get_best_filter(method, amount == 1)(color, amount)
 
+    def filter_many(self, colors: Sequence[Color], amount: float | None = None, **kwargs: Any) -> None:
+        """
+        Filter the colors.
+
+        The transform for the method and severity is calculated once and applied to every color,
+        with any interpolation against the original color already included in the transform.
+        """
+
+        method = kwargs.get('method')  # type: str | None
+        amount = alg.clamp(1 if amount is None else amount, 0, 1)
+        if method is None:
+            method = self.severe if amount == 1 else self.anomalous
+
+        if method == 'brettel':
+            w1, w2, sep = brettel_matrices(amount, self.BRETTEL)
+            for color in colors:
+                coords = color[:-1]
+                color[:-1] = alg.matvec_x3(w2 if alg.vecdot_x3(coords, sep) > 0 else w1, coords)
+            return
+
+        if method == 'vienot':
+            m = vienot_matrix(amount, self.VIENOT)
+        elif method == 'machado':
+            m = machado_matrix(amount, self.MACHADO)
+        else:
+            raise ValueError(f"Unrecognized CVD filter method '{method}'")
+
+        for color in colors:
+            color[:-1] = alg.matvec_x3(m, color[:-1])
+
 
 class Deutan(Protan):
     """Deuteranopia filter."""
@@ -17,7 +17,7 @@ from ..spaces.hwb import hwb_to_hsv, hsv_to_hwb
 from ..spaces.srgb_linear import sRGBLinear
 from .tools import adaptive_hue_independent
 from ..types import Vector, VectorLike
-from typing import Callable, Any, TYPE_CHECKING  # noqa: F401
+from typing import Callable, Any, Iterable, TYPE_CHECKING  # noqa: F401
 
 if TYPE_CHECKING:  #pragma: no cover
     from ..color import Color
@@ -210,26 +210,28 @@ def raytrace_box(
     ]
 
 
-class RayTrace(Fit):
-    """Gamut mapping by using ray tracing."""
+class RayTraceMapper:
+    """
+    Ray trace gamut mapper for a given gamut, perceptual space, and adaptive lightness.
 
-    NAME = "raytrace"
-    PSPACE = "oklch"
+    Everything that only depends on the gamut and the perceptual space is resolved once
+    so that many colors can be mapped without repeating it. Just as with `RayTrace.fit`,
+    colors are mapped in the given space, `GAMUT_CHECK` is left for the caller to resolve.
+    """
 
-    def fit(
+    def __init__(
         self,
-        color: Color,
+        color_cls: type[Color],
         space: str,
-        *,
-        pspace: str | None = None,
-        adaptive: float = 0.0,
-        **kwargs: Any
+        pspace: str,
+        adaptive: float = 0.0
     ) -> None:
-        """Scale the color within its gamut but preserve L and h as much as possible."""
+        """Initialize."""
 
-        if pspace is None:
-            pspace = self.PSPACE
-        cs = color.CS_MAP[space]
+        self.space = space
+        self.pspace = pspace
+        self.adaptive = adaptive
+        cs = color_cls.CS_MAP[space]
 
         # Requires an RGB-ish or Prism space, preferably a linear space.
         # Coerce RGB cylinders with no defined RGB space to RGB
@@ -244,29 +246,69 @@ class RayTrace(Fit):
         # If there is a linear version of the RGB space, results will be better if we use that.
         # Recalculate the bounding box relative to the linear version.
         linear = cs.linear()
-        if linear and linear in color.CS_MAP:
+        if linear and linear in color_cls.CS_MAP:
             subtractive = cs.SUBTRACTIVE
-            cs = color.CS_MAP[linear]
+            cs = color_cls.CS_MAP[linear]
             if subtractive != cs.SUBTRACTIVE:
-                bmax = color.new(space, [chan.low for chan in cs.CHANNELS]).convert(linear, in_place=True)[:-1]
+                bmax = color_cls(space, [chan.low for chan in cs.CHANNELS]).convert(linear, in_place=True)[:-1]
             else:
-                bmax = color.new(space, bmax).convert(linear, in_place=True)[:-1]
+                bmax = color_cls(space, bmax).convert(linear, in_place=True)[:-1]
             space = linear
 
+        self.trace_space = space
+        self.cs = cs
+        self.coerced = coerced
+        self.bmax = bmax
         # Get the minimum bounds
-        bmin = [chan.low for chan in cs.CHANNELS]
+        self.bmin = [chan.low for chan in cs.CHANNELS]
+
+        # Different perceptual spaces may have components in different orders so capture their indexes
+        pcs = color_cls.CS_MAP[pspace]
+        self.polar = pcs.is_polar()
+        self.indexes = pcs.indexes()
+
+        # Lightness of white used to scale lightness and chroma for adaptive lightness.
+        self.max_light = (
+            color_cls('xyz-d65', WHITE).convert(pspace, in_place=True)[self.indexes[0]] if adaptive else 0.0
+        )
+
+    def fit_many(self, colors: Iterable[Color]) -> None:
+        """
+        Fit many colors in place.
+
+        Colors are handled just as `Color.fit` handles them when fitting to the mapper's space,
+        colors that are already in gamut are only clipped.
+        """
+
+        space = self.space
+        fit = self.fit
+        for color in colors:
+            if color.in_gamut(space, tolerance=0):
+                color.clip(space)
+            else:
+                fit(color)
+
+    def fit(self, color: Color) -> None:
+        """Scale the color within its gamut but preserve L and h as much as possible."""
+
+        space = self.trace_space
+        pspace = self.pspace
+        cs = self.cs
+        coerced = self.coerced
+        bmin = self.bmin
+        bmax = self.bmax
+        adaptive = self.adaptive
+        polar = self.polar
 
         orig = color.space()
         mapcolor = color.convert(pspace, norm=False) if orig != pspace else color.clone().normalize(nans=False)
-        polar = mapcolor._space.is_polar()
         achroma = mapcolor.clone()
 
-        # Different perceptual spaces may have components in different orders so capture their indexes
         if polar:
-            l, c, h = achroma._space.indexes()
+            l, c, h = self.indexes
             achroma[c] = 0.0
         else:
-            l, a, b = achroma._space.indexes()
+            l, a, b = self.indexes
             achroma[a] = 0.0
             achroma[b] = 0.0
 
@@ -274,7 +316,7 @@ class RayTrace(Fit):
         # anchor point relative to the hue independent mid point. Scale lightness and
         # chroma by the max lightness to get lightness between 0 and 1.
         if adaptive:
-            max_light = color.new('xyz-d65', WHITE).convert(pspace, in_place=True)[l]
+            max_light = self.max_light
             alight = adaptive_hue_independent(
                 mapcolor[l] / max_light,
                 max(mapcolor[c] if polar else alg.rect_to_polar(mapcolor[a], mapcolor[b])[0], 0) / max_light,
@@ -365,3 +407,39 @@ class RayTrace(Fit):
                 )
             else:
                 color.update(space, [alg.clamp(x, bmin[e], bmax[e]) for e, x in enumerate(mapcolor[:-1])], mapcolor[-1])
+
+
+class RayTrace(Fit):
+    """Gamut mapping by using ray tracing."""
+
+    NAME = "raytrace"
+    PSPACE = "oklch"
+
+    def mapper(
+        self,
+        color_cls: type[Color],
+        space: str,
+        *,
+        pspace: str | None = None,
+        adaptive: float = 0.0
+    ) -> RayTraceMapper:
+        """
+        Get a mapper to fit many colors to the given gamut.
+
+        Just as with `fit`, the space is used as given, `Color.fit` is what resolves `GAMUT_CHECK`.
+        """
+
+        return RayTraceMapper(color_cls, space, self.PSPACE if pspace is None else pspace, adaptive)
+
+    def fit(
+        self,
+        color: Color,
+        space: str,
+        *,
+        pspace: str | None = None,
+        adaptive: float = 0.0,
+        **kwargs: Any
+    ) -> None:
+        """Scale the color within its gamut but preserve L and h as much as possible."""
+
+        self.mapper(type(color), space, pspace=pspace, adaptive=adaptive).fit(color)
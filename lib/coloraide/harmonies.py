@@ -8,7 +8,7 @@ from .spaces.hsl import hsl_to_srgb, srgb_to_hsl
 from .cat import WHITES
 from . import util
 from .types import Vector, AnyColor
-from typing import Any, TYPE_CHECKING
+from typing import Any, Iterable, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:  #pragma: no cover
     from .color import Color
@@ -115,6 +115,28 @@ class Harmony(metaclass=ABCMeta):
         """Get color harmonies."""
 
 
+class CylinderHarmony(Harmony):
+    """Color harmony created by adjusting the hue of a color's cylinder."""
+
+    def harmonize(self, color: AnyColor, space: str, **kwargs: Any) -> list[AnyColor]:
+        """Get color harmonies."""
+
+        # Get the color cylinder
+        color = color.convert(space, norm=False).normalize()
+        coords, h_idx, h_scale = get_cylinder(color)
+        return self.harmonize_cylinder(color, coords, h_idx, h_scale, **kwargs)
+
+    @abstractmethod
+    def harmonize_cylinder(
+        self,
+        color: AnyColor,
+        coords: Vector,
+        h_idx: int,
+        h_scale: float
+    ) -> list[AnyColor]:
+        """Get color harmonies from a color, already in the harmony's color space, and its cylinder."""
+
+
 class Monochromatic(Harmony):
     """
     Monochromatic harmony.
@@ -133,31 +155,51 @@ class Monochromatic(Harmony):
     def harmonize(self, color: AnyColor, space: str, count: int = 5) -> list[AnyColor]:
         """Get color harmonies."""
 
-        if count < 1:
-            raise ValueError(f'Cannot generate a monochromatic palette of {count} colors.')
-
         # Convert color space
         color1 = color.convert(space, norm=False).normalize()
+        return self.harmonize_bounded(color1, space, *self.bounds(color1, space), count=count)
+
+    def bounds(self, color: AnyColor, space: str) -> tuple[AnyColor, AnyColor]:
+        """
+        Get the white and black to generate tints and shades with.
+
+        Black and white only depend on the color space, so they can be shared between colors.
+        """
 
-        is_cyl = color1._space.is_polar()
+        is_cyl = color._space.is_polar()
 
-        cs = color1._space
+        cs = color._space
         if not is_cyl and not isinstance(cs, Labish) and not (isinstance(cs, Prism) and not isinstance(cs, Luminant)):
             raise ValueError(f'Unsupported color space type {color.space()}')
 
-        # If only one color is requested, just return the current color.
-        if count == 1:
-            return [color1]
-
         # Create black and white so we can generate tints and shades
         # Ensure hue and alpha is masked so we don't interpolate them.
         mask = ['hue', 'alpha'] if is_cyl else ['alpha']
-        w = color1.new('xyz-d65', WHITE, math.nan)
-        max_lum = w[1]
+        w = color.new('xyz-d65', WHITE, math.nan)
         w.convert(space, in_place=True, norm=False).fit().mask(mask, in_place=True)
-        b = color1.new('xyz-d65', BLACK, math.nan)
-        min_lum = b[1]
+        b = color.new('xyz-d65', BLACK, math.nan)
         b.convert(space, in_place=True, norm=False).fit().mask(mask, in_place=True)
+        return w, b
+
+    def harmonize_bounded(
+        self,
+        color1: AnyColor,
+        space: str,
+        w: AnyColor,
+        b: AnyColor,
+        count: int = 5
+    ) -> list[AnyColor]:
+        """Get color harmonies from a color, already in the harmony's color space, and the white and black bounds."""
+
+        if count < 1:
+            raise ValueError(f'Cannot generate a monochromatic palette of {count} colors.')
+
+        # If only one color is requested, just return the current color.
+        if count == 1:
+            return [color1]
+
+        max_lum = WHITE[1]
+        min_lum = BLACK[1]
 
         # Minimum steps should be adjusted to account for trimming off white and
         # black if the color is not achromatic. Additionally, prepare our slice
@@ -222,7 +264,7 @@ class Monochromatic(Harmony):
         return left[-l:] + right[:r]
 
 
-class Geometric(Harmony):
+class Geometric(CylinderHarmony):
     """Geometrically space the colors."""
 
     def __init__(self) -> None:
@@ -231,17 +273,31 @@ class Geometric(Harmony):
         super().__init__()
         self.count = 12
 
-    def harmonize(self, color: AnyColor, space: str) -> list[AnyColor]:
+    def harmonize_cylinder(
+        self,
+        color: AnyColor,
+        coords: Vector,
+        h_idx: int,
+        h_scale: float
+    ) -> list[AnyColor]:
         """Get color harmonies."""
 
-        # Get the color cylinder
-        color = color.convert(space, norm=False).normalize()
-        coords, h_idx, h_scale = get_cylinder(color)
+        return self.space_evenly(color, coords, h_idx, h_scale, self.count)
+
+    def space_evenly(
+        self,
+        color: AnyColor,
+        coords: Vector,
+        h_idx: int,
+        h_scale: float,
+        count: int
+    ) -> list[AnyColor]:
+        """Space the given number of colors evenly around the hue circle."""
 
         # Adjusts hue and convert to the final color
-        degree = current = 360.0 / self.count
+        degree = current = 360.0 / count
         colors = [from_cylinder(color, coords)]
-        for _ in range(self.count - 1):
+        for _ in range(count - 1):
             coords2 = coords[:]
             coords2[h_idx] = adjust_hue(coords2[h_idx], current, h_scale)
             colors.append(from_cylinder(color, coords2))
@@ -255,8 +311,19 @@ class Wheel(Geometric):
     def harmonize(self, color: AnyColor, space: str, count: int = 12) -> list[AnyColor]:
         """Generate a color wheel with the given count."""
 
-        self.count = count
-        return super().harmonize(color, space)
+        return super().harmonize(color, space, count=count)
+
+    def harmonize_cylinder(  # type: ignore[override]
+        self,
+        color: AnyColor,
+        coords: Vector,
+        h_idx: int,
+        h_scale: float,
+        count: int = 12
+    ) -> list[AnyColor]:
+        """Generate a color wheel with the given count."""
+
+        return self.space_evenly(color, coords, h_idx, h_scale, count)
 
 
 class Complementary(Geometric):
@@ -286,16 +353,18 @@ class TetradicSquare(Geometric):
         self.count = 4
 
 
-class SplitComplementary(Harmony):
+class SplitComplementary(CylinderHarmony):
     """Split Complementary colors."""
 
-    def harmonize(self, color: AnyColor, space: str) -> list[AnyColor]:
+    def harmonize_cylinder(
+        self,
+        color: AnyColor,
+        coords: Vector,
+        h_idx: int,
+        h_scale: float
+    ) -> list[AnyColor]:
         """Get color harmonies."""
 
-        # Get the color cylinder
-        color = color.convert(space, norm=False).normalize()
-        coords, h_idx, h_scale = get_cylinder(color)
-
         # Adjusts hue and convert to the final color
         colors = [from_cylinder(color, coords)]
         clone = coords[:]
@@ -306,16 +375,18 @@ class SplitComplementary(Harmony):
         return colors
 
 
-class Analogous(Harmony):
+class Analogous(CylinderHarmony):
     """Analogous colors."""
 
-    def harmonize(self, color: AnyColor, space: str) -> list[AnyColor]:
+    def harmonize_cylinder(
+        self,
+        color: AnyColor,
+        coords: Vector,
+        h_idx: int,
+        h_scale: float
+    ) -> list[AnyColor]:
         """Get color harmonies."""
 
-        # Get the color cylinder
-        color = color.convert(space, norm=False).normalize()
-        coords, h_idx, h_scale = get_cylinder(color)
-
         # Adjusts hue and convert to the final color
         colors = [from_cylinder(color, coords)]
         clone = coords[:]
@@ -326,16 +397,18 @@ class Analogous(Harmony):
         return colors
 
 
-class TetradicRect(Harmony):
+class TetradicRect(CylinderHarmony):
     """Tetradic (rectangular) colors."""
 
-    def harmonize(self, color: AnyColor, space: str) -> list[AnyColor]:
+    def harmonize_cylinder(
+        self,
+        color: AnyColor,
+        coords: Vector,
+        h_idx: int,
+        h_scale: float
+    ) -> list[AnyColor]:
         """Get color harmonies."""
 
-        # Get the color cylinder
-        color = color.convert(space, norm=False).normalize()
-        coords, h_idx, h_scale = get_cylinder(color)
-
         # Adjusts hue and convert to the final color
         colors = [from_cylinder(color, coords)]
         clone = coords[:]
@@ -369,3 +442,60 @@ def harmonize(color: AnyColor, name: str, space: str, **kwargs: Any) -> list[Any
         raise ValueError(f"The color harmony '{name}' cannot be found")
 
     return h.harmonize(color, space, **kwargs)
+
+
+def harmonize_many(
+    colors: Iterable[AnyColor],
+    names: Sequence[str],
+    space: str,
+    *,
+    out_space: str | None = None,
+    options: dict[str, dict[str, Any]] | None = None
+) -> list[dict[str, list[AnyColor]]]:
+    """
+    Get the specified color harmonies for many colors.
+
+    Each color is converted to the harmony color space, and to a cylinder, only once for all of
+    the requested harmonies, and the black and white used by monochromatic harmonies are only
+    created once for all of the colors. Options for a given harmony are provided by its name.
+    """
+
+    if out_space is None:
+        out_space = space
+
+    if options is None:
+        options = {}
+
+    requested = []
+    for name in names:
+        h = SUPPORTED.get(name)
+        if not h:
+            raise ValueError(f"The color harmony '{name}' cannot be found")
+        requested.append((name, h, options.get(name, {})))
+
+    # White and black per color class
+    bounds = {}  # type: dict[type[Any], tuple[Any, Any]]
+    results = []
+    for color in colors:
+        color = color.convert(space, norm=False).normalize()
+        cylinder = None  # type: tuple[Vector, int, float] | None
+        result = {}
+        for name, h, kwargs in requested:
+            if isinstance(h, CylinderHarmony):
+                if cylinder is None:
+                    cylinder = get_cylinder(color)
+                coords, h_idx, h_scale = cylinder
+                colors_ = h.harmonize_cylinder(color, coords[:], h_idx, h_scale, **kwargs)
+            elif isinstance(h, Monochromatic):
+                wb = bounds.get(type(color))
+                if wb is None:
+                    wb = bounds[type(color)] = h.bounds(color, space)
+                colors_ = h.harmonize_bounded(color.clone(), space, *wb, **kwargs)
+            else:  # pragma: no cover
+                colors_ = h.harmonize(color, space, **kwargs)
+
+            for c in colors_:
+                c.convert(out_space, in_place=True)
+            result[name] = colors_
+        results.append(result)
+    return results
@@ -15,10 +15,13 @@ License: MIT (As noted in https://github.com/LeaVerou/color.js/blob/master/packa
 """
 from __future__ import annotations
 import math
+import heapq
 import functools
+from array import array
 from abc import ABCMeta, abstractmethod
 from .. import algebra as alg
 from .. spaces import HSVish, HSLish, RGBish, LChish, Labish
+from .lut import InterpolatorLUT
 from ..types import Matrix, Vector, ColorInput, Plugin, AnyColor
 from typing import Callable, Sequence, Mapping, Any, Generic, TYPE_CHECKING
 
@@ -179,6 +182,33 @@ class Interpolator(Generic[AnyColor], metaclass=ABCMeta):
             hue = 'shorter'
         )
 
+    def to_lut(self, resolution: int = 256, out_space: str | None = None) -> InterpolatorLUT[AnyColor]:
+        """
+        Sample the interpolation into a lookup table.
+
+        The table evenly samples the domain (0 - 1 if no domain is set) and looks up points by
+        linearly interpolating between the two nearest samples in the output space.
+        """
+
+        if resolution < 2:
+            raise ValueError('A lookup table requires a resolution of at least 2')
+
+        if out_space is None:
+            out_space = self._out_space
+        elif out_space not in self.color_cls.CS_MAP:
+            raise ValueError(f"'{out_space}' is not a valid color space")
+
+        start, end = (self._domain[0], self._domain[-1]) if self._domain else (0.0, 1.0)
+        step = (end - start) / (resolution - 1)
+        table = array('d')
+        for i in range(resolution):
+            color = self(start + i * step)
+            if out_space != self._out_space:
+                color.convert(out_space, in_place=True)
+            table.extend(color[:])
+
+        return InterpolatorLUT(self.color_cls, out_space, table, start, end)
+
     def out_space(self, space: str) -> None:
         """Set output space."""
 
@@ -281,46 +311,76 @@ class Interpolator(Generic[AnyColor], metaclass=ABCMeta):
                 p = i * step
                 ret.append((p, self(p)))
 
-        # Iterate over all the stops inserting stops in between all colors
-        # if we have any two colors with a max delta greater than what was requested.
-        # We inject between every stop to ensure the midpoint does not shift.
-        if max_delta_e > 0:
-            # Initial check to see if we need to insert more stops
-            m_delta = 0.0
-            for i in range(1, len(ret)):
-                m_delta = max(
-                    m_delta,
-                    ret[i - 1][1].delta_e(
-                        ret[i][1],
-                        method=delta_e,
-                        **delta_e_args
-                    )
-                )
-
-            # If we currently have delta over our limit inject more stops.
-            # If inserting between every color would push us over the max_steps, halt.
-            total = len(ret)
-            while m_delta > max_delta_e and (total * 2 - 1 <= max_steps):
-                # Inject stops while measuring again to see if it was sufficient
-                m_delta = 0.0
-                i = 1
-                index = 1
-                while index < total:
-                    prev = ret[index - 1]
-                    cur = ret[index]
-                    p = (cur[0] + prev[0]) / 2
-                    color = self(p)
-                    m_delta = max(
-                        m_delta,
-                        color.delta_e(prev[1], method=delta_e, **delta_e_args),
-                        color.delta_e(cur[1], method=delta_e, **delta_e_args)
-                    )
-                    ret.insert(index, (p, color))
-                    total += 1
-                    index += 2
+        # Subdivide any segment between two stops whose delta E exceeds what was requested.
+        if max_delta_e > 0 and len(ret) > 1:
+            return self.subdivide(ret, max_steps, max_delta_e, delta_e, delta_e_args)
 
         return [ri[1] for ri in ret]
 
+    def subdivide(
+        self,
+        stops: list[tuple[float, AnyColor]],
+        max_steps: int | None,
+        max_delta_e: float,
+        delta_e: str | None,
+        delta_e_args: dict[str, Any]
+    ) -> list[AnyColor]:
+        """
+        Subdivide segments whose delta E exceeds the maximum.
+
+        Only segments over the limit are split, largest delta E first, so the work is proportional
+        to how much the ramp curves and not its length. Stops are converted to the delta E method's
+        working space once, so no delta E is ever calculated twice.
+        """
+
+        if delta_e is None:
+            delta_e = self.color_cls.DELTA_E
+        algorithm = self.color_cls.DE_MAP.get(delta_e)
+        if not algorithm:
+            raise ValueError(f"'{delta_e}' is not currently a supported distancing algorithm.")
+
+        points = [p for p, _ in stops]
+        colors = [c for _, c in stops]
+        try:
+            coords = algorithm.prepare(colors, **delta_e_args)  # type: list[Any]
+            to_coords = algorithm.to_coords  # type: Callable[..., Any]
+            measure = algorithm.distance_coords  # type: Callable[..., float]
+        except NotImplementedError:
+            # Methods without batch support compare the colors directly.
+            coords = colors[:]
+            to_coords = lambda color, **kwargs: color  # noqa: E731
+            measure = algorithm.distance
+
+        # Max heap (via negated delta E) of segments, as indexes of their left and right stop.
+        segments = []  # type: list[tuple[float, int, int]]
+        for i in range(1, len(points)):
+            de = measure(coords[i - 1], coords[i], **delta_e_args)
+            if de > max_delta_e:
+                segments.append((-de, i - 1, i))
+        heapq.heapify(segments)
+
+        limit = math.inf if max_steps is None else max_steps
+        while segments and len(points) < limit:
+            _, left, right = heapq.heappop(segments)
+            p = (points[left] + points[right]) / 2
+
+            # Segments can't be split past float precision, which can happen at discontinuities.
+            if p in (points[left], points[right]):
+                continue
+
+            color = self(p)
+            index = len(points)
+            points.append(p)
+            colors.append(color)
+            coords.append(to_coords(color, **delta_e_args))
+
+            for a, b in ((left, index), (index, right)):
+                de = measure(coords[a], coords[b], **delta_e_args)
+                if de > max_delta_e:
+                    heapq.heappush(segments, (-de, a, b))
+
+        return [colors[i] for i in sorted(range(len(points)), key=points.__getitem__)]
+
     def premultiply(self, coords: Vector, alpha: float | None = None) -> None:
         """Apply premultiplication to semi-transparent colors."""
 
@@ -0,0 +1,168 @@
+"""
+Interpolation lookup tables.
+
+An interpolator is sampled once into a flat table of coordinates. Looking up a point
+then only requires finding the two nearest samples and linearly interpolating between
+them instead of running scaling, easing, premultiplication, the interpolation method,
+and color space conversion for every point.
+"""
+from __future__ import annotations
+import math
+from array import array
+from ..types import Vector, AnyColor
+from typing import Any, Generic, Iterable  # noqa: F401
+
+
+class InterpolatorLUT(Generic[AnyColor]):
+    """
+    Lookup table of evenly spaced samples from an interpolator.
+
+    Points outside the sampled domain are clamped to the ends of the table.
+    """
+
+    def __init__(
+        self,
+        color_cls: type[AnyColor],
+        space: str,
+        table: array[float],
+        start: float,
+        end: float
+    ) -> None:
+        """Initialize."""
+
+        cs = color_cls.CS_MAP[space]
+        self.color_cls = color_cls
+        self.space = space
+        self.table = table
+        self.start = start
+        self.end = end
+
+        # Channels plus alpha are stored for each sample.
+        self.stride = len(cs.CHANNELS) + 1
+        self.resolution = len(table) // self.stride
+        self.scale = (self.resolution - 1) / (end - start) if end != start else 0.0
+
+        # Hues must be interpolated the shorter way around.
+        if cs.is_polar():
+            self.hue_index = cs.hue_index()  # type: ignore[attr-defined]
+            self.max_hue = cs.channels[self.hue_index].high
+        else:
+            self.hue_index = -1
+            self.max_hue = 0.0
+
+    def __len__(self) -> int:
+        """Number of samples in the table."""
+
+        return self.resolution
+
+    def locate(self, point: float) -> tuple[int, float]:
+        """Get the index of the sample that starts the point's segment and the point's position in the segment."""
+
+        last = self.resolution - 1
+        t = (point - self.start) * self.scale
+        if not t > 0.0:
+            return 0, 0.0
+        elif t >= last:
+            return last - 1, 1.0
+        index = int(t)
+        return index, t - index
+
+    def segment(self, index: int) -> tuple[Vector, Vector, int]:
+        """
+        Get the start and change of each coordinate across the segment that starts at the given sample.
+
+        The hue index is also returned if the hue must be wrapped after interpolating, or `-1` if not.
+        """
+
+        table = self.table
+        stride = self.stride
+        offset = index * stride
+        start = []  # type: Vector
+        delta = []  # type: Vector
+        wrap = -1
+        for i in range(stride):
+            a = table[offset + i]
+            b = table[offset + stride + i]
+
+            # Undefined values take the other side's value, just as they do when interpolating.
+            if math.isnan(a):
+                start.append(b)
+                delta.append(0.0)
+                continue
+            if math.isnan(b):
+                start.append(a)
+                delta.append(0.0)
+                continue
+
+            if i == self.hue_index:
+                diff = b - a
+                if abs(diff) > self.max_hue / 2:
+                    b += -self.max_hue if diff > 0 else self.max_hue
+                wrap = i
+            start.append(a)
+            delta.append(b - a)
+
+        return start, delta, wrap
+
+    def lookup(self, point: float) -> Vector:
+        """Get the coordinates, including alpha, at the given point."""
+
+        index, f = self.locate(point)
+        table = self.table
+        stride = self.stride
+        offset = index * stride
+        coords = []  # type: Vector
+        for i in range(stride):
+            a = table[offset + i]
+            b = table[offset + stride + i]
+
+            # Undefined values take the other side's value, just as they do when interpolating.
+            if math.isnan(a):
+                coords.append(b)
+                continue
+            if math.isnan(b):
+                coords.append(a)
+                continue
+
+            if i == self.hue_index:
+                diff = b - a
+                if abs(diff) > self.max_hue / 2:
+                    b += -self.max_hue if diff > 0 else self.max_hue
+                coords.append((a + (b - a) * f) % self.max_hue)
+            else:
+                coords.append(a + (b - a) * f)
+
+        return coords
+
+    def __call__(self, point: float) -> AnyColor:
+        """Get the color at the given point."""
+
+        coords = self.lookup(point)
+        return self.color_cls(self.space, coords[:-1], coords[-1])
+
+    def sample_many(self, points: Iterable[float]) -> list[AnyColor]:
+        """
+        Get the colors at each of the given points.
+
+        Points are visited in sorted order so that the points that fall in the same segment
+        share the segment's setup, which is the bulk of a lookup.
+        """
+
+        points = list(points)
+        color_cls = self.color_cls
+        space = self.space
+        max_hue = self.max_hue
+        colors = [None] * len(points)  # type: list[Any]
+        current = -1
+        start = delta = []  # type: Vector
+        wrap = -1
+        for p in sorted(range(len(points)), key=points.__getitem__):
+            index, f = self.locate(points[p])
+            if index != current:
+                current = index
+                start, delta, wrap = self.segment(index)
+            coords = [a + d * f for a, d in zip(start, delta)]
+            if wrap >= 0:
+                coords[wrap] %= max_hue
+            colors[p] = color_cls(space, coords[:-1], coords[-1])
+        return colors
@@ -3,9 +3,10 @@ from __future__ import annotations
 from abc import ABCMeta, abstractmethod
 from ..channels import Channel
 from ..css import serialize
-from ..types import VectorLike, Vector, Plugin
+from ..types import VectorLike, Vector, Matrix, Plugin  # noqa: F401
 from .. import deprecate
-from typing import Any, TYPE_CHECKING, Callable, Sequence
+from typing import Any, TYPE_CHECKING, Callable, Dict, Sequence
+import importlib
 import math
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -118,6 +119,12 @@ class SpaceMeta(ABCMeta):
         if len(cls.mro()) > 2:
             cls.CHANNEL_ALIASES = cls.CHANNEL_ALIASES.copy()  # type: dict[str, str]
 
+        # A declared matrix only describes the conversion it was declared alongside.
+        if 'to_base' in clsdict and 'TO_BASE_MATRIX' not in clsdict:
+            cls.TO_BASE_MATRIX = None
+        if 'from_base' in clsdict and 'FROM_BASE_MATRIX' not in clsdict:
+            cls.FROM_BASE_MATRIX = None
+
 
 class Space(Plugin, metaclass=SpaceMeta):
     """Base color space object."""
@@ -154,6 +161,11 @@ class Space(Plugin, metaclass=SpaceMeta):
     DYNAMIC_RANGE = 'sdr'
     # Is the space subtractive
     SUBTRACTIVE = False
+    # If `to_base` and `from_base` are nothing more than a multiply by a 3x3 matrix, the matrices used.
+    # Bulk operations merge declared matrices so runs of linear conversions are a single multiply.
+    # A subclass that overrides `to_base` or `from_base` must declare the matrix again to keep it.
+    TO_BASE_MATRIX = None  # type: Matrix | None
+    FROM_BASE_MATRIX = None  # type: Matrix | None
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize."""
@@ -268,3 +280,87 @@ class Space(Plugin, metaclass=SpaceMeta):
         """Match a color by string."""
 
         return None
+
+
+class LazySpace(Plugin):
+    """
+    A color space that is registered by name and only imported when it is first used.
+
+    The path is the module path and class name of the space, e.g. `coloraide.spaces.hsv.HSV`.
+    Paths starting with `.` are relative to the `coloraide` package.
+
+    Lazily registered spaces are only matched from strings through the CSS `color()` form, as
+    `SERIALIZE` must be known before the space is loaded. Spaces that parse their own string
+    formats should be registered directly.
+    """
+
+    def __init__(self, name: str, path: str, serialize: tuple[str, ...] = ()) -> None:
+        """Initialize."""
+
+        self.NAME = name
+        self.PATH = path
+        self.SERIALIZE = serialize if serialize else (name,)
+        self._space = None  # type: Space | None
+
+    def load(self) -> Space:
+        """Import and create the color space, if not already done."""
+
+        if self._space is None:
+            module, class_name = self.PATH.rsplit('.', 1)
+            space = getattr(importlib.import_module(module, __package__.rsplit('.', 1)[0]), class_name)()
+            if space.NAME != self.NAME or space._serialize() != self.SERIALIZE:
+                raise ValueError(f"'{self.PATH}' does not match the lazily registered color space '{self.NAME}'")
+            self._space = space
+        return self._space
+
+
+class SpaceMap(Dict[str, Space]):
+    """
+    Mapping of color space names to color spaces.
+
+    Lazily registered spaces are loaded and replaced with the actual space when they are first accessed.
+    """
+
+    def __getitem__(self, name: str) -> Space:
+        """Get a color space, loading it if required."""
+
+        space = super().__getitem__(name)
+        if isinstance(space, LazySpace):
+            space = space.load()
+            super().__setitem__(name, space)
+        return space
+
+    def get(self, name: str, default: Any = None) -> Any:  # type: ignore[override]
+        """Get a color space, loading it if required."""
+
+        return self[name] if name in self else default
+
+    def values(self) -> list[Space]:  # type: ignore[override]
+        """Get all the color spaces, loading any that have not been loaded."""
+
+        return [self[name] for name in self]
+
+    def items(self) -> list[tuple[str, Space]]:  # type: ignore[override]
+        """Get all the color spaces and their names, loading any that have not been loaded."""
+
+        return [(name, self[name]) for name in self]
+
+    def copy(self) -> SpaceMap:
+        """Copy the mapping without loading any color spaces."""
+
+        return SpaceMap(self)
+
+    def registered(self) -> list[Space | LazySpace]:
+        """Get all the registered color spaces without loading them."""
+
+        return list(super().values())
+
+    def loaded(self) -> list[Space]:
+        """Get the color spaces that have already been loaded."""
+
+        return [cs for cs in super().values() if not isinstance(cs, LazySpace)]
+
+    def lazy(self) -> list[LazySpace]:
+        """Get the color spaces that have not been loaded yet."""
+
+        return [cs for cs in super().values() if isinstance(cs, LazySpace)]
@@ -31,13 +31,13 @@ def lin_a98rgb_to_xyz(rgb: Vector) -> Vector:
     https://www.adobe.com/digitalimag/pdfs/AdobeRGB1998.pdf
     """
 
-    return alg.matmul_x3(RGB_TO_XYZ, rgb, dims=alg.D2_D1)
+    return alg.matvec_x3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_a98rgb(xyz: Vector) -> Vector:
     """Convert XYZ to linear-light a98-rgb."""
 
-    return alg.matmul_x3(XYZ_TO_RGB, xyz, dims=alg.D2_D1)
+    return alg.matvec_x3(XYZ_TO_RGB, xyz)
 
 
 class A98RGBLinear(sRGBLinear):
@@ -46,6 +46,8 @@ class A98RGBLinear(sRGBLinear):
     BASE = "xyz-d65"
     NAME = "a98-rgb-linear"
     SERIALIZE = ('--a98-rgb-linear',)
+    TO_BASE_MATRIX = RGB_TO_XYZ
+    FROM_BASE_MATRIX = XYZ_TO_RGB
 
     def to_base(self, coords: Vector) -> Vector:
         """To XYZ from A98 RGB."""
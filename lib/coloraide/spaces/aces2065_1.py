@@ -29,13 +29,13 @@ MAX = 1.0
 def aces_to_xyz(aces: Vector) -> Vector:
     """Convert ACEScc to XYZ."""
 
-    return alg.matmul_x3(AP0_TO_XYZ, aces, dims=alg.D2_D1)
+    return alg.matvec_x3(AP0_TO_XYZ, aces)
 
 
 def xyz_to_aces(xyz: Vector) -> Vector:
     """Convert XYZ to ACEScc."""
 
-    return alg.matmul_x3(XYZ_TO_AP0, xyz, dims=alg.D2_D1)
+    return alg.matvec_x3(XYZ_TO_AP0, xyz)
 
 
 class ACES20651(sRGBLinear):
@@ -45,6 +45,8 @@ class ACES20651(sRGBLinear):
     NAME = "aces2065-1"
     SERIALIZE = ("--aces2065-1",)
     WHITE = WHITES['2deg']['ACES-D60']
+    TO_BASE_MATRIX = AP0_TO_XYZ
+    FROM_BASE_MATRIX = XYZ_TO_AP0
     CHANNELS = (
         Channel("r", 0.0, 65504.0, bound=True),
         Channel("g", 0.0, 65504.0, bound=True),
@@ -26,13 +26,13 @@ XYZ_TO_AP1 = [
 def acescg_to_xyz(acescg: Vector) -> Vector:
     """Convert ACEScc to XYZ."""
 
-    return alg.matmul_x3(AP1_TO_XYZ, acescg, dims=alg.D2_D1)
+    return alg.matvec_x3(AP1_TO_XYZ, acescg)
 
 
 def xyz_to_acescg(xyz: Vector) -> Vector:
     """Convert XYZ to ACEScc."""
 
-    return alg.matmul_x3(XYZ_TO_AP1, xyz, dims=alg.D2_D1)
+    return alg.matvec_x3(XYZ_TO_AP1, xyz)
 
 
 class ACEScg(sRGBLinear):
@@ -42,6 +42,8 @@ class ACEScg(sRGBLinear):
     NAME = "acescg"
     SERIALIZE = ("--acescg",)  # type: tuple[str, ...]
     WHITE = WHITES['2deg']['ACES-D60']
+    TO_BASE_MATRIX = AP1_TO_XYZ
+    FROM_BASE_MATRIX = XYZ_TO_AP1
     CHANNELS = (
         Channel("r", 0.0, 65504.0, bound=True),
         Channel("g", 0.0, 65504.0, bound=True),
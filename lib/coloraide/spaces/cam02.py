@@ -44,6 +44,10 @@ HPE_TO_XYZ = [
     [0.0, 0.0, 1.0]
 ]
 
+# Transforms directly between CAT02 RGB and Hunt-Pointer-Estevez space
+CAT02_TO_HPE = alg.matmat_x3(XYZ_TO_HPE, M02_INV)
+HPE_TO_CAT02 = alg.matmat_x3(M02, HPE_TO_XYZ)
+
 
 class Environment(_Environment):
     """
@@ -81,12 +85,12 @@ class Environment(_Environment):
         """Calculate the adaptation of the reference point and related variables."""
 
         # Cone response for reference white
-        self.rgb_w = alg.matmul_x3(M02, xyz_w, dims=alg.D2_D1)
+        self.rgb_w = alg.matvec_x3(M02, xyz_w)
 
         self.d_rgb = [(self.yw * (self.d / coord) + 1 - self.d) for coord in self.rgb_w]
         self.d_rgb_inv = [1 / coord for coord in self.d_rgb]
         self.rgb_cw = alg.multiply_x3(self.d_rgb, self.rgb_w, dims=alg.D1)
-        self.rgb_pw = alg.matmul_x3(alg.matmul_x3(XYZ_TO_HPE, M02_INV), self.rgb_cw)
+        self.rgb_pw = alg.matvec_x3(CAT02_TO_HPE, self.rgb_cw)
 
         # Achromatic response
         rgb_aw = adapt(self.rgb_pw, self.fl)
@@ -178,9 +182,9 @@ def cam_to_xyz(
     b = r * sin_h
 
     # Calculate back from cone response to XYZ
-    rgb_a = alg.multiply_x3(alg.matmul_x3(M1, [p2, a, b], dims=alg.D2_D1), 1 / 1403, dims=alg.D1_SC)
-    rgb_c = alg.matmul_x3(alg.matmul_x3(M02, HPE_TO_XYZ, dims=alg.D2), unadapt(rgb_a, env.fl), dims=alg.D2_D1)
-    return util.scale1(alg.matmul_x3(M02_INV, alg.multiply_x3(rgb_c, env.d_rgb_inv, dims=alg.D1), dims=alg.D2_D1))
+    rgb_a = alg.multiply_x3(alg.matvec_x3(M1, [p2, a, b]), 1 / 1403, dims=alg.D1_SC)
+    rgb_c = alg.matvec_x3(HPE_TO_CAT02, unadapt(rgb_a, env.fl))
+    return util.scale1(alg.matvec_x3(M02_INV, alg.multiply_x3(rgb_c, env.d_rgb_inv, dims=alg.D1)))
 
 
 def xyz_to_cam(xyz: Vector, env: Environment, calc_hue_quadrature: bool = False) -> Vector:
@@ -189,10 +193,10 @@ def xyz_to_cam(xyz: Vector, env: Environment, calc_hue_quadrature: bool = False)
     # Calculate cone response
     rgb_c = alg.multiply_x3(
         env.d_rgb,
-        alg.matmul_x3(M02, util.scale100(xyz), dims=alg.D2_D1),
+        alg.matvec_x3(M02, util.scale100(xyz)),
         dims=alg.D1
     )
-    rgb_a = adapt(alg.matmul_x3(alg.matmul_x3(XYZ_TO_HPE, M02_INV, dims=alg.D2), rgb_c, dims=alg.D2_D1), env.fl)
+    rgb_a = adapt(alg.matvec_x3(CAT02_TO_HPE, rgb_c), env.fl)
 
     # Calculate red-green and yellow components and resultant hue
     p2 = 2 * rgb_a[0] + rgb_a[1] + 0.05 * rgb_a[2]
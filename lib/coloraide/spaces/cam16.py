@@ -190,7 +190,7 @@ class Environment:
         """Calculate the adaptation of the reference point and related variables."""
 
         # Cone response for reference white
-        self.rgb_w = alg.matmul_x3(M16, xyz_w, dims=alg.D2_D1)
+        self.rgb_w = alg.matvec_x3(M16, xyz_w)
 
         self.d_rgb = [alg.lerp(1, self.yw / coord, self.d) for coord in self.rgb_w]
         self.d_rgb_inv = [1 / coord for coord in self.d_rgb]
@@ -288,9 +288,9 @@ def cam_to_xyz(
     b = r * sin_h
 
     # Calculate back from cone response to XYZ
-    rgb_a = alg.multiply_x3(alg.matmul_x3(M1, [p2, a, b], dims=alg.D2_D1), 1 / 1403, dims=alg.D1_SC)
+    rgb_a = alg.multiply_x3(alg.matvec_x3(M1, [p2, a, b]), 1 / 1403, dims=alg.D1_SC)
     rgb_c = unadapt(rgb_a, env.fl)
-    return util.scale1(alg.matmul_x3(M16_INV, alg.multiply_x3(rgb_c, env.d_rgb_inv, dims=alg.D1), dims=alg.D2_D1))
+    return util.scale1(alg.matvec_x3(M16_INV, alg.multiply_x3(rgb_c, env.d_rgb_inv, dims=alg.D1)))
 
 
 def xyz_to_cam(xyz: Vector, env: Environment, calc_hue_quadrature: bool = False) -> Vector:
@@ -298,7 +298,7 @@ def xyz_to_cam(xyz: Vector, env: Environment, calc_hue_quadrature: bool = False)
 
     # Calculate cone response
     rgb_c = alg.multiply_x3(
-        alg.matmul_x3(M16, util.scale100(xyz), dims=alg.D2_D1),
+        alg.matvec_x3(M16, util.scale100(xyz)),
         env.d_rgb,
         dims=alg.D1
     )
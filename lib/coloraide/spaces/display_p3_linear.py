@@ -25,13 +25,13 @@ def lin_p3_to_xyz(rgb: Vector) -> Vector:
     """
 
     # 0 was computed as -3.972075516933488e-17
-    return alg.matmul_x3(RGB_TO_XYZ, rgb, dims=alg.D2_D1)
+    return alg.matvec_x3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_p3(xyz: Vector) -> Vector:
     """Convert XYZ to linear-light P3."""
 
-    return alg.matmul_x3(XYZ_TO_RGB, xyz, dims=alg.D2_D1)
+    return alg.matvec_x3(XYZ_TO_RGB, xyz)
 
 
 class DisplayP3Linear(sRGBLinear):
@@ -40,6 +40,8 @@ class DisplayP3Linear(sRGBLinear):
     BASE = "xyz-d65"
     NAME = "display-p3-linear"
     SERIALIZE = ('display-p3-linear', '--display-p3-linear')
+    TO_BASE_MATRIX = RGB_TO_XYZ
+    FROM_BASE_MATRIX = XYZ_TO_RGB
 
     def to_base(self, coords: Vector) -> Vector:
         """To XYZ from Linear Display P3."""
@@ -44,6 +44,7 @@ from ..channels import Channel, FLG_ANGLE
 from .cam16 import Environment, cam_to_xyz, xyz_to_cam
 from .lab import EPSILON, KAPPA, KE
 from ..types import Vector
+import weakref
 import math
 
 
@@ -62,11 +63,119 @@ def lstar_to_y(lstar: float) -> float:
     return y
 
 
+class JGuess:
+    """
+    Table of initial J guesses over hue, chroma, and tone.
+
+    Hues are sampled on first use: for each chroma, CAM16 is evaluated over a range of J
+    and the resulting tones are inverted to get J at evenly spaced tones. Guesses are then
+    interpolated between the nearest hue, chroma, and tone samples.
+    """
+
+    HUE_STEP = 30
+    HUE_NODES = 12
+    CHROMA_STEP = 20
+    CHROMA_NODES = 9
+    TONE_STEP = 5
+    TONE_NODES = 21
+    J_STEP = 5
+    J_NODES = 23
+
+    def __init__(self) -> None:
+        """Initialize."""
+
+        self.hues = {}  # type: dict[int, list[Vector]]
+        # Recently solved colors for the same environment.
+        self.solved = {}  # type: dict[tuple[float, float, float], tuple[float, ...]]
+
+    def hue(self, index: int, env: Environment) -> list[Vector]:
+        """Get the J samples, by chroma and then tone, for the hue at the given index."""
+
+        rows = self.hues.get(index)
+        if rows is None:
+            h = index * self.HUE_STEP
+            last = self.J_NODES - 1
+            rows = []
+            for ci in range(self.CHROMA_NODES):
+                c = ci * self.CHROMA_STEP
+                tones = [
+                    y_to_lstar(cam_to_xyz(J=j * self.J_STEP, C=c, h=h, env=env)[1]) for j in range(self.J_NODES)
+                ]
+                row = []
+                k = 0
+                for ti in range(self.TONE_NODES):
+                    t = ti * self.TONE_STEP
+                    while k < last - 1 and tones[k + 1] < t:
+                        k += 1
+                    a, b = tones[k], tones[k + 1]
+                    # Tones that cannot be bracketed, such as those of imaginary colors, get no guess.
+                    row.append(self.J_STEP * (k + (t - a) / (b - a)) if a <= t <= b and a < b else math.nan)
+                rows.append(row)
+            self.hues[index] = rows
+        return rows
+
+    def __call__(self, h: float, c: float, t: float, env: Environment) -> float:
+        """Guess J, NaN is returned if there is no guess."""
+
+        if not (0 <= c and 0 <= t <= 100 and math.isfinite(h)):
+            return math.nan
+
+        x = (h % 360) / self.HUE_STEP
+        hi = int(x) % self.HUE_NODES
+        hf = x - int(x)
+        y = min(c / self.CHROMA_STEP, self.CHROMA_NODES - 1)
+        ci = min(int(y), self.CHROMA_NODES - 2)
+        cf = y - ci
+        z = t / self.TONE_STEP
+        ti = min(int(z), self.TONE_NODES - 2)
+        tf = z - ti
+
+        j = 0.0
+        for index, wh in ((hi, 1 - hf), ((hi + 1) % self.HUE_NODES, hf)):
+            if not wh:
+                continue
+            rows = self.hue(index, env)
+            for row, wc in ((rows[ci], 1 - cf), (rows[ci + 1], cf)):
+                if wc:
+                    j += wh * wc * (row[ti] + (row[ti + 1] - row[ti]) * tf)
+        return j
+
+
+# J guess tables, and recently solved colors, by viewing environment. Tables do not
+# reference their environment, so a table is discarded along with its environment.
+SOLVED_CACHE_SIZE = 256
+_GUESSES = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[Environment, JGuess]
+
+
 def hct_to_xyz(coords: Vector, env: Environment) -> Vector:
     """
     Convert HCT to XYZ.
 
-    Use Newton's method to try and converge as quick as possible or converge as
+    Recently solved colors are cached as tools, such as gamut mapping and tonal palettes,
+    tend to convert the same colors repeatedly.
+    """
+
+    guess = _GUESSES.get(env)
+    if guess is None:
+        guess = _GUESSES[env] = JGuess()
+
+    h, c, t = coords[:]
+    key = (h, c, t)
+    xyz = guess.solved.get(key)
+    if xyz is None:
+        xyz = _hct_to_xyz(h, c, t, env, guess)
+        # Start over when full.
+        if len(guess.solved) >= SOLVED_CACHE_SIZE:
+            guess.solved.clear()
+        guess.solved[key] = xyz
+    return list(xyz)
+
+
+def _hct_to_xyz(h: float, c: float, t: float, env: Environment, guess: JGuess) -> tuple[float, ...]:
+    """
+    Solve HCT to XYZ.
+
+    Use the secant method to try and converge as quick as possible or converge as
     close as we can. While the requested precision is achieved most of the time,
     it may not always be achievable. Especially past the visible spectrum, the
     algorithm will likely struggle to get the same precision. If, for whatever
@@ -74,26 +183,28 @@ def hct_to_xyz(coords: Vector, env: Environment) -> Vector:
     just return the closest we were able to get.
     """
 
-    h, c, t = coords[:]
-
     if t == 0 and c == 0:
-        return [0.0, 0.0, 0.0]
+        return (0.0, 0.0, 0.0)
 
     # Calculate the Y we need to target
     y = lstar_to_y(t)
 
-    # Try to start with a reasonable initial guess for J
-    # Calculated by curve fitting J vs T.
-    if t >= 0:
-        j = 0.003790578348640494 * t * t + 0.6089841908066893 * t + 0.9154856839591797
-    else:
-        j = 9.514281401058887e-06 * t * t + 0.08693011228986187 * t - 21.92910930537688
+    # Start with a guess from the table of J samples.
+    j = guess(h, c, t, env)
+
+    # If there is no guess, fall back to one calculated by curve fitting J vs T.
+    if math.isnan(j) or j <= 0:
+        if t >= 0:
+            j = 0.003790578348640494 * t * t + 0.6089841908066893 * t + 0.9154856839591797
+        else:
+            j = 9.514281401058887e-06 * t * t + 0.08693011228986187 * t - 21.92910930537688
 
     epsilon = 1e-12
 
     maxiter = 16
     last = math.inf
     best = xyz = [0.0] * 3
+    prev_j = prev_y = math.nan
 
     # Try to find a J such that the returned y matches the returned y of the L*
     for _ in range(maxiter):
@@ -106,25 +217,34 @@ def hct_to_xyz(coords: Vector, env: Environment) -> Vector:
         delta = abs(f0)
 
         if delta < epsilon:
-            return xyz
+            return tuple(xyz)
 
         if delta < last:
             best = xyz
             last = delta
 
-        # ```
-        # f(j_root) = (j ** (1 / 2)) * 0.1
-        # f(j) = ((f(j_root) * 100) ** 2) / j - 1 = 0
-        # f(j_root) = Y = y / 100
-        # f(j) = (y ** 2) / j - 1
-        # f'(j) = (2 * y) / j
-        # f'(j) = dx
-        # j = j - f0 / dx
-        # ```
-
-        # Newton: 2nd order convergence
-        # `dx` fraction is flipped so we can multiply by the derivative instead of divide
-        j -= f0 * alg.zdiv(j, 2 * xyz[1])
+        # Secant: use the slope between the last two evaluations as long as Y is increasing with J.
+        # Where it is not, such as for some imaginary colors, the secant is not reliable.
+        slope = (xyz[1] - prev_y) / (j - prev_j) if j != prev_j else math.nan
+        if slope > 0 and j - f0 / slope > 0:
+            j -= f0 / slope
+        else:
+            # ```
+            # f(j_root) = (j ** (1 / 2)) * 0.1
+            # f(j) = ((f(j_root) * 100) ** 2) / j - 1 = 0
+            # f(j_root) = Y = y / 100
+            # f(j) = (y ** 2) / j - 1
+            # f'(j) = (2 * y) / j
+            # f'(j) = dx
+            # j = j - f0 / dx
+            # ```
+
+            # Newton: approximate the derivative to get the first slope
+            # `dx` fraction is flipped so we can multiply by the derivative instead of divide
+            j -= f0 * alg.zdiv(j, 2 * xyz[1])
+
+        prev_j = prev
+        prev_y = xyz[1]
 
         # If J is zero, the next round will yield zero, so quit
         if j == 0 or abs(prev - j) < epsilon:  # pragma: no cover
@@ -134,7 +254,7 @@ def hct_to_xyz(coords: Vector, env: Environment) -> Vector:
     # print('FAIL:', [h, c, t], xyz[1], y)
     # ```
 
-    return best
+    return tuple(best)
 
 
 def xyz_to_hct(coords: Vector, env: Environment) -> Vector:
@@ -57,13 +57,13 @@ def ictcp_to_xyz_d65(ictcp: Vector) -> Vector:
     """From ICtCp to XYZ."""
 
     # Convert to LMS prime
-    pqlms = alg.matmul_x3(ictcp_to_lms_p_mi, ictcp, dims=alg.D2_D1)
+    pqlms = alg.matvec_x3(ictcp_to_lms_p_mi, ictcp)
 
     # Decode PQ LMS to LMS
     lms = util.eotf_st2084(pqlms)
 
     # Convert back to absolute XYZ D65
-    absxyz = alg.matmul_x3(lms_to_xyz_mi, lms, dims=alg.D2_D1)
+    absxyz = alg.matvec_x3(lms_to_xyz_mi, lms)
 
     # Convert back to normal XYZ D65
     return util.absxyz_to_xyz(absxyz, YW)
@@ -76,13 +76,13 @@ def xyz_d65_to_ictcp(xyzd65: Vector) -> Vector:
     absxyz = util.xyz_to_absxyz(xyzd65, YW)
 
     # Convert to LMS
-    lms = alg.matmul_x3(xyz_to_lms_m, absxyz, dims=alg.D2_D1)
+    lms = alg.matvec_x3(xyz_to_lms_m, absxyz)
 
     # PQ encode the LMS
     pqlms = util.inverse_eotf_st2084(lms)
 
     # Calculate Izazbz
-    return alg.matmul_x3(lms_p_to_ictcp_m, pqlms, dims=alg.D2_D1)
+    return alg.matvec_x3(lms_p_to_ictcp_m, pqlms)
 
 
 class ICtCp(Lab):
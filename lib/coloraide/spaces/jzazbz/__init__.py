@@ -73,26 +73,26 @@ def xyz_to_izazbz(xyz: Vector, lms_matrix: Matrix, m2: float) -> Vector:
     ym = (G * ya) - ((G - 1) * xa)
 
     # Convert to LMS
-    lms = alg.matmul_x3(XYZ_TO_LMS, [xm, ym, za], dims=alg.D2_D1)
+    lms = alg.matvec_x3(XYZ_TO_LMS, [xm, ym, za])
 
     # PQ encode the LMS
     pqlms = util.inverse_eotf_st2084(lms, m2=m2)
 
     # Calculate Izazbz
-    return alg.matmul_x3(lms_matrix, pqlms, dims=alg.D2_D1)
+    return alg.matvec_x3(lms_matrix, pqlms)
 
 
 def izazbz_to_xyz(izazbz: Vector, lms_matrix: Matrix, m2: float) -> Vector:
     """Izazbz to absolute XYZ."""
 
     # Convert to LMS prime
-    pqlms = alg.matmul_x3(lms_matrix, izazbz, dims=alg.D2_D1)
+    pqlms = alg.matvec_x3(lms_matrix, izazbz)
 
     # Decode PQ LMS to LMS
     lms = util.eotf_st2084(pqlms, m2=m2)
 
     # Convert back to absolute XYZ D65
-    xm, ym, za = alg.matmul_x3(LMS_TO_XYZ, lms, dims=alg.D2_D1)
+    xm, ym, za = alg.matvec_x3(LMS_TO_XYZ, lms)
     xa = (xm + ((B - 1) * za)) / B
     ya = (ym + ((G - 1) * xa)) / G
 
@@ -77,6 +77,11 @@ K_1 = 0.206
 K_2 = 0.03
 K_3 = (1.0 + K_1) / (1.0 + K_2)
 
+# Cusps of recently used hues, keyed by the normalized `a` and `b` and the gamut.
+# The gamut's matrices are kept in the entry so that their `id` cannot be reused.
+CUSP_CACHE_SIZE = 1024
+_CUSPS = {}  # type: dict[tuple[float, float, int, int], tuple[Matrix, list[Matrix], float, float]]
+
 
 def toe(x: float, k1: float = K_1, k2: float = K_2, k3: float = K_3) -> float:
     """Toe function for L_r."""
@@ -142,10 +147,9 @@ def oklab_to_linear_rgb(lab: Vector, lms_to_rgb: Matrix) -> Vector:
     that transform the LMS values to the linear RGB space.
     """
 
-    return alg.matmul_x3(
+    return alg.matvec_x3(
         lms_to_rgb,
-        [c ** 3 for c in alg.matmul_x3(OKLAB_TO_LMS3, lab, dims=alg.D2_D1)],
-        dims=alg.D2_D1
+        [c ** 3 for c in alg.matvec_x3(OKLAB_TO_LMS3, lab)]
     )
 
 
@@ -159,16 +163,29 @@ def find_cusp(
     Finds L_cusp and C_cusp for a given hue.
 
     `a` and `b` must be normalized so `a^2 + b^2 == 1`.
+
+    As pickers, interpolation, etc. tend to work through the same hues repeatedly,
+    cusps are cached by hue.
     """
 
+    key = (a, b, id(lms_to_rgb), id(ok_coeff))
+    entry = _CUSPS.get(key)
+    if entry is not None and entry[0] is lms_to_rgb and entry[1] is ok_coeff:
+        return [entry[2], entry[3]]
+
     # First, find the maximum saturation (saturation `S = C/L`)
     s_cusp = compute_max_saturation(a, b, lms_to_rgb, ok_coeff)
 
     # Convert to linear RGB to find the first point where at least one of r, g or b >= 1:
-    r, g, b = oklab_to_linear_rgb([1, s_cusp * a, s_cusp * b], lms_to_rgb)
-    l_cusp = alg.nth_root(1.0 / max(max(r, g), b), 3)
+    r, g, b_ = oklab_to_linear_rgb([1, s_cusp * a, s_cusp * b], lms_to_rgb)
+    l_cusp = alg.nth_root(1.0 / max(max(r, g), b_), 3)
     c_cusp = l_cusp * s_cusp
 
+    # Start over when full.
+    if len(_CUSPS) >= CUSP_CACHE_SIZE:
+        _CUSPS.clear()
+    _CUSPS[key] = (lms_to_rgb, ok_coeff, l_cusp, c_cusp)
+
     return [l_cusp, c_cusp]
 
 
@@ -240,23 +257,23 @@ def find_gamut_intersection(
         mdt2 = 6 * (m_dt ** 2) * m_
         sdt2 = 6 * (s_dt ** 2) * s_
 
-        r = alg.matmul_x3(lms_to_rgb[0], [l, m, s], dims=alg.D1) - 1
-        r1 = alg.matmul_x3(lms_to_rgb[0], [ldt, mdt, sdt], dims=alg.D1)
-        r2 = alg.matmul_x3(lms_to_rgb[0], [ldt2, mdt2, sdt2], dims=alg.D1)
+        r = alg.vecdot_x3(lms_to_rgb[0], [l, m, s]) - 1
+        r1 = alg.vecdot_x3(lms_to_rgb[0], [ldt, mdt, sdt])
+        r2 = alg.vecdot_x3(lms_to_rgb[0], [ldt2, mdt2, sdt2])
 
         u_r = r1 / (r1 * r1 - 0.5 * r * r2)
         t_r = -r * u_r
 
-        g = alg.matmul_x3(lms_to_rgb[1], [l, m, s], dims=alg.D1) - 1
-        g1 = alg.matmul_x3(lms_to_rgb[1], [ldt, mdt, sdt], dims=alg.D1)
-        g2 = alg.matmul_x3(lms_to_rgb[1], [ldt2, mdt2, sdt2], dims=alg.D1)
+        g = alg.vecdot_x3(lms_to_rgb[1], [l, m, s]) - 1
+        g1 = alg.vecdot_x3(lms_to_rgb[1], [ldt, mdt, sdt])
+        g2 = alg.vecdot_x3(lms_to_rgb[1], [ldt2, mdt2, sdt2])
 
         u_g = g1 / (g1 * g1 - 0.5 * g * g2)
         t_g = -g * u_g
 
-        b = alg.matmul_x3(lms_to_rgb[2], [l, m, s], dims=alg.D1) - 1
-        b1 = alg.matmul_x3(lms_to_rgb[2], [ldt, mdt, sdt], dims=alg.D1)
-        b2 = alg.matmul_x3(lms_to_rgb[2], [ldt2, mdt2, sdt2], dims=alg.D1)
+        b = alg.vecdot_x3(lms_to_rgb[2], [l, m, s]) - 1
+        b1 = alg.vecdot_x3(lms_to_rgb[2], [ldt, mdt, sdt])
+        b2 = alg.vecdot_x3(lms_to_rgb[2], [ldt2, mdt2, sdt2])
 
         u_b = b1 / (b1 * b1 - 0.5 * b * b2)
         t_b = -b * u_b
@@ -30,13 +30,13 @@ def rotate(v: Vector, d: float) -> Vector:
     m = alg.identity(3)
     m[1][1:] = math.cos(d), -math.sin(d)
     m[2][1:] = math.sin(d), math.cos(d)
-    return alg.matmul_x3(m, v, dims=alg.D2_D1)
+    return alg.matvec_x3(m, v)
 
 
 def srgb_to_orgb(rgb: Vector) -> Vector:
     """Convert sRGB to oRGB."""
 
-    lcc = alg.matmul_x3(RGB_TO_LC1C2, rgb, dims=alg.D2_D1)
+    lcc = alg.matvec_x3(RGB_TO_LC1C2, rgb)
     theta = math.atan2(lcc[2], lcc[1])
     theta0 = theta
     atheta = abs(theta)
@@ -59,7 +59,7 @@ def orgb_to_srgb(lcc: Vector) -> Vector:
     elif (math.pi / 2) <= atheta0 <= math.pi:
         theta = math.copysign((math.pi / 3) + (4 / 3) * (atheta0 - math.pi / 2), theta0)
 
-    return alg.matmul_x3(LC1C2_TO_RGB, rotate(lcc, theta - theta0), dims=alg.D2_D1)
+    return alg.matvec_x3(LC1C2_TO_RGB, rotate(lcc, theta - theta0))
 
 
 class oRGB(Lab):
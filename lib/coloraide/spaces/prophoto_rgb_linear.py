@@ -26,13 +26,13 @@ def lin_prophoto_to_xyz(rgb: Vector) -> Vector:
     http://www.brucelindbloom.com/index.html?Eqn_RGB_XYZ_Matrix.html
     """
 
-    return alg.matmul_x3(RGB_TO_XYZ, rgb, dims=alg.D2_D1)
+    return alg.matvec_x3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_prophoto(xyz: Vector) -> Vector:
     """Convert XYZ to linear-light prophoto-rgb."""
 
-    return alg.matmul_x3(XYZ_TO_RGB, xyz, dims=alg.D2_D1)
+    return alg.matvec_x3(XYZ_TO_RGB, xyz)
 
 
 class ProPhotoRGBLinear(sRGBLinear):
@@ -42,6 +42,8 @@ class ProPhotoRGBLinear(sRGBLinear):
     NAME = "prophoto-rgb-linear"
     SERIALIZE = ('--prophoto-rgb-linear',)
     WHITE = WHITES['2deg']['D50']
+    TO_BASE_MATRIX = RGB_TO_XYZ
+    FROM_BASE_MATRIX = XYZ_TO_RGB
 
     def to_base(self, coords: Vector) -> Vector:
         """To XYZ from Linear Pro Photo RGB."""
@@ -30,13 +30,13 @@ def lin_2020_to_xyz(rgb: Vector) -> Vector:
     http://www.brucelindbloom.com/index.html?Eqn_RGB_XYZ_Matrix.html
     """
 
-    return alg.matmul_x3(RGB_TO_XYZ, rgb, dims=alg.D2_D1)
+    return alg.matvec_x3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_2020(xyz: Vector) -> Vector:
     """Convert XYZ to linear-light rec-2020."""
 
-    return alg.matmul_x3(XYZ_TO_RGB, xyz, dims=alg.D2_D1)
+    return alg.matvec_x3(XYZ_TO_RGB, xyz)
 
 
 class Rec2020Linear(sRGBLinear):
@@ -46,6 +46,8 @@ class Rec2020Linear(sRGBLinear):
     NAME = "rec2020-linear"
     SERIALIZE = ('--rec2020-linear',)
     WHITE = WHITES['2deg']['D65']
+    TO_BASE_MATRIX = RGB_TO_XYZ
+    FROM_BASE_MATRIX = XYZ_TO_RGB
 
     def to_base(self, coords: Vector) -> Vector:
         """To XYZ from Linear Rec 2020."""
@@ -42,14 +42,14 @@ def adapt(xyz: Vector, xyz_ws: Vector, xyz_wd: Vector, d: float) -> Vector:
     https://github.com/colour-science/colour/pull/1349#issuecomment-3058339414
     """
 
-    lms = alg.matmul_x3(M16, xyz, dims=alg.D2_D1)
-    lms_ws = alg.matmul_x3(M16, xyz_ws, dims=alg.D2_D1)
-    lms_wd = alg.matmul_x3(M16, xyz_wd, dims=alg.D2_D1)
+    lms = alg.matvec_x3(M16, xyz)
+    lms_ws = alg.matvec_x3(M16, xyz_ws)
+    lms_wd = alg.matvec_x3(M16, xyz_wd)
 
     y_ratio = xyz_ws[1] / xyz_wd[1]
     lms_r = alg.divide_x3(lms_wd, lms_ws, dims=alg.D1)
     lms_a = [lms[r] * (d * y_ratio * lms_r[r] + (1 - d)) for r in range(3)]
-    return alg.matmul_x3(M16_INV, lms_a, dims=alg.D2_D1)
+    return alg.matvec_x3(M16_INV, lms_a)
 
 
 class Environment:
@@ -29,13 +29,13 @@ def lin_srgb_to_xyz(rgb: Vector) -> Vector:
     D65 (no chromatic adaptation)
     """
 
-    return alg.matmul_x3(RGB_TO_XYZ, rgb, dims=alg.D2_D1)
+    return alg.matvec_x3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_srgb(xyz: Vector) -> Vector:
     """Convert XYZ to linear-light sRGB."""
 
-    return alg.matmul_x3(XYZ_TO_RGB, xyz, dims=alg.D2_D1)
+    return alg.matvec_x3(XYZ_TO_RGB, xyz)
 
 
 class sRGBLinear(RGBish, Space):
@@ -44,6 +44,8 @@ class sRGBLinear(RGBish, Space):
     BASE = 'xyz-d65'
     NAME = "srgb-linear"
     WHITE = WHITES['2deg']['D65']
+    TO_BASE_MATRIX = RGB_TO_XYZ
+    FROM_BASE_MATRIX = XYZ_TO_RGB
     CHANNELS = (
         Channel("r", 0.0, 1.0, bound=True),
         Channel("g", 0.0, 1.0, bound=True),
@@ -28,15 +28,15 @@ def sucs_to_xyz(ich: Vector) -> Vector:
     c = (math.exp(0.0252 * c) - 1) / 0.0447
     r = math.radians(h)
     a, b = c * math.cos(r), c * math.sin(r)
-    lms = [alg.nth_root(x, 0.43) for x in alg.matmul_x3(FROM_IAB, [i, a, b], dims=alg.D2_D1)]
-    return alg.matmul_x3(LMS_TO_XYZ, lms, dims=alg.D2_D1)
+    lms = [alg.nth_root(x, 0.43) for x in alg.matvec_x3(FROM_IAB, [i, a, b])]
+    return alg.matvec_x3(LMS_TO_XYZ, lms)
 
 
 def xyz_to_sucs(xyz: Vector) -> Vector:
     """From XYZ to sUCS."""
 
-    lms_p = [alg.spow(i, 0.43) for i in alg.matmul_x3(XYZ_TO_LMS, xyz, dims=alg.D2_D1)]
-    i, a, b = alg.matmul_x3(TO_IAB, lms_p, dims=alg.D2_D1)
+    lms_p = [alg.spow(i, 0.43) for i in alg.matvec_x3(XYZ_TO_LMS, xyz)]
+    i, a, b = alg.matvec_x3(TO_IAB, lms_p)
     c = (1 / 0.0252) * math.log(1 + 0.0447 * math.sqrt(a ** 2 + b ** 2))
     h = math.atan2(b, a) % math.tau
     return [i, c, math.degrees(h)]
@@ -41,10 +41,9 @@ XYB_TO_XYB_LMS = [
 def rgb_to_xyb(rgb: Vector) -> Vector:
     """Linear sRGB to XYB."""
 
-    xyb = alg.matmul_x3(
+    xyb = alg.matvec_x3(
         XYB_LMS_TO_XYB,
-        [alg.nth_root(c + BIAS, 3) - BIAS_CBRT for c in alg.matmul_x3(LRGB_TO_LMS, rgb, dims=alg.D2_D1)],
-        dims=alg.D2_D1
+        [alg.nth_root(c + BIAS, 3) - BIAS_CBRT for c in alg.matvec_x3(LRGB_TO_LMS, rgb)]
     )
 
     # https://twitter.com/jonsneyers/status/1605321352143331328
@@ -64,10 +63,9 @@ def xyb_to_rgb(xyb: Vector) -> Vector:
         return [0.0] * 3
 
     xyb[2] += xyb[1]
-    return alg.matmul_x3(
+    return alg.matvec_x3(
         LMS_TO_LRGB,
-        [(c + BIAS_CBRT) ** 3 - BIAS for c in alg.matmul_x3(XYB_TO_XYB_LMS, xyb, dims=alg.D2_D1)],
-        dims=alg.D2_D1
+        [(c + BIAS_CBRT) ** 3 - BIAS for c in alg.matvec_x3(XYB_TO_XYB_LMS, xyb)]
     )
 
 
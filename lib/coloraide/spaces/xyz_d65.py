@@ -15,6 +15,7 @@ class XYZD65(RGBish, Space):
     BASE = "xyz-d65"
     NAME = "xyz-d65"
     SERIALIZE = ("xyz-d65", 'xyz')  # type: tuple[str, ...]
+    TO_BASE_MATRIX = FROM_BASE_MATRIX = alg.identity(3)
     CHANNELS = (
         Channel("x", 0.0, 1.0),
         Channel("y", 0.0, 1.0),
@@ -74,10 +74,10 @@ def adapt(
     yb = xyz_wb[1] / xyz_wo[1]
     yd = xyz_wd[1] / xyz_wo[1]
 
-    rgb_b = alg.matmul_x3(CAT02, xyz_b, dims=alg.D2_D1)
-    rgb_wb = alg.matmul_x3(CAT02, xyz_wb, dims=alg.D2_D1)
-    rgb_wd = alg.matmul_x3(CAT02, xyz_wd, dims=alg.D2_D1)
-    rgb_wo = alg.matmul_x3(CAT02, xyz_wo, dims=alg.D2_D1)
+    rgb_b = alg.matvec_x3(CAT02, xyz_b)
+    rgb_wb = alg.matvec_x3(CAT02, xyz_wb)
+    rgb_wd = alg.matvec_x3(CAT02, xyz_wd)
+    rgb_wo = alg.matvec_x3(CAT02, xyz_wo)
 
     d_rgb_wb = alg.add_x3(
         alg.multiply_x3(db * yb, alg.divide_x3(rgb_wo, rgb_wb, dims=alg.D1), dims=alg.SC_D1),
@@ -91,7 +91,7 @@ def adapt(
     )
     d_rgb = alg.divide_x3(d_rgb_wb, d_rgb_wd, dims=alg.D1)
     rgb_d = alg.multiply_x3(d_rgb, rgb_b, dims=alg.D1)
-    return alg.matmul_x3(CAT02_INV, rgb_d, dims=alg.D2_D1)
+    return alg.matvec_x3(CAT02_INV, rgb_d)
 
 
 class Environment:
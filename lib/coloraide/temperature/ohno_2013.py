@@ -7,12 +7,12 @@ from __future__ import annotations
 import math
 from . import planck
 from .. import cat
-from .. import cmfs
+from .. import cmfs as _cmfs
 from .. import util
 from .. import algebra as alg
 from ..temperature import CCT
 from ..types import Vector, VectorLike, AnyColor
-from typing import Any
+from typing import Any, Iterable
 
 
 class BlackBodyCurve:
@@ -24,17 +24,21 @@ class BlackBodyCurve:
 
     For improved accuracy, we split spline data for low temps and high temps
     and assign the number of required data points accordingly.
+
+    The splines are only built the first time an approximated point is requested.
     """
 
     def __init__(
         self,
-        cmfs: dict[int, tuple[float, float, float]] = cmfs.CIE_1931_2DEG,
+        cmfs: dict[int, tuple[float, float, float]] | None = None,
         white: VectorLike = cat.WHITES['2deg']['D65'],
         planck_step: int = 5,
         chromaticity: str = 'uv-1960'
     ) -> None:
         """Initialize."""
 
+        if cmfs is None:
+            cmfs = _cmfs.CIE_1931_2DEG
         keys = [*cmfs.keys()]
         self.cmfs_start = min(keys)
         self.cmfs_end = max(keys)
@@ -42,6 +46,13 @@ class BlackBodyCurve:
         self.white = util.xy_to_xyz(white)
         self.planck_step = planck_step
         self.to_uv = util.xy_to_uv_1960 if chromaticity == 'uv-1960' else util.xy_to_uv
+        self.domain = []  # type: Vector
+        self.domain2 = []  # type: Vector
+        self.spline = None  # type: alg.Interpolate | None
+        self.spline2 = None  # type: alg.Interpolate | None
+
+    def build(self) -> None:
+        """Build the splines."""
 
         # Low temperature range
         start = 1000
@@ -49,18 +60,8 @@ class BlackBodyCurve:
         step = 130
         inc = (end - start) / step
         count = step + 1
-        points = []
-        self.domain = []
-        for r in range(count):
-            k = r * inc + start
-            u, v = self.to_uv(
-                planck.temp_to_xy_planckian_locus(
-                    k, self.cmfs, self.white, self.cmfs_start, self.cmfs_end, self.planck_step
-                )
-            )
-            self.domain.append(k)
-            points.append([u, v])
-        self.spline = alg.interpolate(points, method='catrom')
+        domain = [r * inc + start for r in range(count)]
+        spline = alg.interpolate(self.exact(domain), method='catrom')
 
         # High temperature range
         start = end
@@ -68,18 +69,24 @@ class BlackBodyCurve:
         step = 220
         inc = (end - start) / step
         count = step + 1
-        points = []
-        self.domain2 = []
-        for r in range(count):
-            k = r * inc + start
-            u, v = self.to_uv(
-                planck.temp_to_xy_planckian_locus(
-                    k, self.cmfs, self.white, self.cmfs_start, self.cmfs_end, self.planck_step
-                )
+        domain2 = [r * inc + start for r in range(count)]
+        spline2 = alg.interpolate(self.exact(domain2), method='catrom')
+
+        # The splines are assigned last as their presence signals the curve is ready.
+        self.domain = domain
+        self.domain2 = domain2
+        self.spline2 = spline2
+        self.spline = spline
+
+    def exact(self, temps: Iterable[float]) -> list[Vector]:
+        """Get the exact uv for each of the given temps."""
+
+        to_uv = self.to_uv
+        return [
+            to_uv(xy) for xy in planck.temps_to_xy_planckian_locus(
+                temps, self.cmfs, self.white, self.cmfs_start, self.cmfs_end, self.planck_step
             )
-            self.domain2.append(k)
-            points.append([u, v])
-        self.spline2 = alg.interpolate(points, method='catrom')
+        ]
 
     def scale(self, point: float, domain: Vector) -> float:
         """Scale the temperature point to match the range 0 - 1."""
@@ -107,9 +114,11 @@ class BlackBodyCurve:
                 )
             )
         else:
+            if self.spline is None:
+                self.build()
             if temp <= 20000:
-                return self.spline(self.scale(temp, self.domain))
-            return self.spline2(self.scale(temp, self.domain2))
+                return self.spline(self.scale(temp, self.domain))  # type: ignore[misc]
+            return self.spline2(self.scale(temp, self.domain2))  # type: ignore[misc]
 
 
 class Ohno2013(CCT):
@@ -146,14 +155,24 @@ class Ohno2013(CCT):
 
     def __init__(
         self,
-        cmfs: dict[int, tuple[float, float, float]] = cmfs.CIE_1931_2DEG,
+        cmfs: dict[int, tuple[float, float, float]] | None = None,
         white: VectorLike = cat.WHITES['2deg']['D65'],
         planck_step: int = 5
     ):
         """Initialize."""
 
         self.white = white
-        self.blackbody = BlackBodyCurve(cmfs, white, planck_step, self.CHROMATICITY)
+        self.cmfs = cmfs
+        self.planck_step = planck_step
+        self._blackbody = None  # type: BlackBodyCurve | None
+
+    @property
+    def blackbody(self) -> BlackBodyCurve:
+        """Get the black body curve, creating it on first use so color matching functions are not loaded early."""
+
+        if self._blackbody is None:
+            self._blackbody = BlackBodyCurve(self.cmfs, self.white, self.planck_step, self.CHROMATICITY)
+        return self._blackbody
 
     def to_cct(
         self,
@@ -247,6 +266,20 @@ class Ohno2013(CCT):
 
         return [t, duv]
 
+    def offset(self, uv0: Vector, uv1: Vector, duv: float) -> Vector:
+        """Offset a point on the locus by Duv perpendicular to the locus using a point slightly past it."""
+
+        u0, v0 = uv0
+        du = u0 - uv1[0]
+        dv = v0 - uv1[1]
+        di = math.sqrt(du ** 2 + dv ** 2)
+        if di:
+            du /= di
+            dv /= di
+            u0 = u0 - duv * dv
+            v0 = v0 + duv * du
+        return [u0, v0]
+
     def from_cct(
         self,
         color: type[AnyColor],
@@ -259,16 +292,20 @@ class Ohno2013(CCT):
     ) -> AnyColor:
         """Calculate a color that satisfies the CCT using Planck's law."""
 
-        u0, v0 = self.blackbody(kelvin, exact=True)
+        uv = self.blackbody(kelvin, exact=True)
+        if duv:
+            uv = self.offset(uv, self.blackbody(kelvin + 0.01, exact=True), duv)
+
+        return color.chromaticity(space, [*uv, 1], self.CHROMATICITY, scale=scale, scale_space=scale_space)
+
+    def from_cct_many(self, kelvins: Iterable[float], duv: float = 0.0) -> list[Vector]:
+        """Calculate the chromaticity coordinates that satisfy the CCT for each of the given temperatures."""
+
+        kelvins = list(kelvins)
+        uvs = self.blackbody.exact(kelvins)
         if duv:
-            u1, v1 = self.blackbody(kelvin + 0.01, exact=True)
-            du = u0 - u1
-            dv = v0 - v1
-            di = math.sqrt(du ** 2 + dv ** 2)
-            if di:
-                du /= di
-                dv /= di
-                u0 = u0 - duv * dv
-                v0 = v0 + duv * du
-
-        return color.chromaticity(space, [u0, v0, 1], self.CHROMATICITY, scale=scale, scale_space=scale_space)
+            uvs = [
+                self.offset(uv0, uv1, duv)
+                for uv0, uv1 in zip(uvs, self.blackbody.exact([k + 0.01 for k in kelvins]))
+            ]
+        return uvs
@@ -6,7 +6,9 @@ https://en.wikipedia.org/wiki/Planckian_locus#The_Planckian_locus_in_the_XYZ_col
 from __future__ import annotations
 import math
 from ..types import VectorLike, Vector
+from .. import cmfs as _cmfs
 from .. import util
+from typing import Any, Iterable  # noqa: F401
 
 # Constants for Planck's Law
 # Precise calculation
@@ -21,6 +23,34 @@ from .. import util
 C1 = 3.741771e-16
 C2 = 1.4388e-2
 
+# Minimum number of temperatures before integration is done with NumPy, if available.
+NP_MIN_TEMPS = 16
+
+# Spectral terms per (color matching functions, start, end, step, c1).
+# The color matching functions are kept in the entry so that their `id` cannot be reused.
+_TERMS = {}  # type: dict[tuple[int, int, int, int, float], tuple[Any, _cmfs.CMFArrays, Vector]]
+
+
+def spectral_terms(
+    cmfs: dict[int, tuple[float, float, float]],
+    start: int,
+    end: int,
+    step: int,
+    c1: float
+) -> tuple[_cmfs.CMFArrays, Vector]:
+    """
+    Get the color matching functions as arrays along with the temperature independent part of Planck's law.
+
+    Results are cached as they only depend on the table and the sampling.
+    """
+
+    key = (id(cmfs), start, end, step, c1)
+    entry = _TERMS.get(key)
+    if entry is None or entry[0] is not cmfs:
+        arrays = _cmfs.to_arrays(cmfs, start, end, step)
+        entry = _TERMS[key] = (cmfs, arrays, [c1 * (w ** -5) for w in arrays.wavelengths])
+    return entry[1], entry[2]
+
 
 def temp_to_xy_planckian_locus(
     temp: float,
@@ -37,13 +67,42 @@ def temp_to_xy_planckian_locus(
 
     https://en.wikipedia.org/wiki/Planckian_locus#The_Planckian_locus_in_the_XYZ_color_space
     """
-    x = y = z = 0.0
 
-    for wavelength in range(start, end + 1, step):
-        m = c1 * (wavelength ** -5) * math.expm1((c2 * 1e9) / (wavelength * temp)) ** -1
-        cmf = cmfs[wavelength]
-        x += m * cmf[0]
-        y += m * cmf[1]
-        z += m * cmf[2]
+    arrays, terms = spectral_terms(cmfs, start, end, step, c1)
+    c2 *= 1e9
+    x = y = z = 0.0
+    for wavelength, a, xw, yw, zw in zip(arrays.wavelengths, terms, arrays.x, arrays.y, arrays.z):
+        m = a * math.expm1(c2 / (wavelength * temp)) ** -1
+        x += m * xw
+        y += m * yw
+        z += m * zw
 
     return util.xyz_to_xyY([x, y, z], white)[:-1]
+
+
+def temps_to_xy_planckian_locus(
+    temps: Iterable[float],
+    cmfs: dict[int, tuple[float, float, float]],
+    white: VectorLike,
+    start: int = 360,
+    end: int = 830,
+    step: int = 5,
+    c1: float = C1,
+    c2: float = C2
+) -> list[Vector]:
+    """
+    Get the Planckian locus for many temperatures.
+
+    With NumPy, all temperatures are integrated at once, otherwise each is integrated in turn.
+    """
+
+    temps = list(temps)
+    np = util.import_numpy() if len(temps) >= NP_MIN_TEMPS else None
+    if np is None:
+        return [temp_to_xy_planckian_locus(t, cmfs, white, start, end, step, c1, c2) for t in temps]
+
+    arrays, terms = spectral_terms(cmfs, start, end, step, c1)
+    w = np.asarray(arrays.wavelengths, dtype=float)
+    m = np.asarray(terms) / np.expm1((c2 * 1e9) / (w * np.asarray(temps, dtype=float)[:, np.newaxis]))
+    xyz = m @ np.stack([arrays.x, arrays.y, arrays.z], axis=1)
+    return [util.xyz_to_xyY(c, white)[:-1] for c in xyz.tolist()]
@@ -12,10 +12,10 @@ from . import planck
 from .. import algebra as alg
 from .. import util
 from .. import cat
-from .. import cmfs
+from .. import cmfs as _cmfs
 from ..temperature import CCT
 from ..types import Vector, VectorLike, AnyColor
-from typing import Any, TYPE_CHECKING, NamedTuple
+from typing import Any, Iterable, TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:  #pragma: no cover
     from ..color import Color
@@ -46,7 +46,7 @@ class Robertson1968(CCT):
 
     def __init__(
         self,
-        cmfs: dict[int, tuple[float, float, float]] = cmfs.CIE_1931_2DEG,
+        cmfs: dict[int, tuple[float, float, float]] | None = None,
         white: VectorLike = cat.WHITES['2deg']['D65'],
         mired: VectorLike = MIRED_EXTENDED,
         sigfig: int = 5,
@@ -55,7 +55,30 @@ class Robertson1968(CCT):
         """Initialize."""
 
         self.white = white
-        self.table = self.generate_table(cmfs, white, mired, sigfig, planck_step)
+        self.cmfs = cmfs
+        self.mired = mired
+        self.sigfig = sigfig
+        self.planck_step = planck_step
+        self._table = None  # type: list[CCTEntry] | None
+
+    @property
+    def table(self) -> list[CCTEntry]:
+        """
+        Get the table, generating it on first use.
+
+        Generating the table integrates the Planckian locus a few hundred times, which is too costly to do
+        when the plugin is created as most users of a `Color` class will never request CCT.
+        """
+
+        if self._table is None:
+            self._table = self.generate_table(
+                _cmfs.CIE_1931_2DEG if self.cmfs is None else self.cmfs,
+                self.white,
+                self.mired,
+                self.sigfig,
+                self.planck_step
+            )
+        return self._table
 
     def generate_table(
         self,
@@ -89,14 +112,24 @@ class Robertson1968(CCT):
         xyzw = util.xy_to_xyz(white)
         table = []  # type: list[CCTEntry]
         to_uv = util.xy_to_uv_1960 if self.CHROMATICITY == 'uv-1960' else util.xy_to_uv
-        for t in mired:
-            uv1 = to_uv(planck.temp_to_xy_planckian_locus(1e6 / (t - 0.01), cmfs, xyzw, step=planck_step))
-            uv2 = to_uv(planck.temp_to_xy_planckian_locus(1e6 / (t + 0.01), cmfs, xyzw, step=planck_step))
+
+        # Integrate the locus for all the points at once.
+        count = len(mired)
+        temps = [1e6 / (t - 0.01) for t in mired]
+        temps.extend(1e6 / (t + 0.01) for t in mired)
+        temps.extend(1e6 / t for t in mired if t != 0)
+        locus = [to_uv(xy) for xy in planck.temps_to_xy_planckian_locus(temps, cmfs, xyzw, step=planck_step)]
+        center = count * 2
+
+        for i, t in enumerate(mired):
+            uv1 = locus[i]
+            uv2 = locus[count + i]
             if t == 0:
                 factor = 0.5
                 uv = [alg.lerp(uv1[0], uv2[0], factor), alg.lerp(uv1[1], uv2[1], factor)]
             else:
-                uv = to_uv(planck.temp_to_xy_planckian_locus(1e6 / t, cmfs, xyzw, step=planck_step))
+                uv = locus[center]
+                center += 1
                 d1 = math.sqrt((uv[1] - uv1[1]) ** 2 + (uv[0] - uv1[0]) ** 2)
                 d2 = math.sqrt((uv2[1] - uv[1]) ** 2 + (uv2[0] - uv[0]) ** 2)
                 factor = d1 / (d1 + d2)
@@ -166,10 +199,11 @@ class Robertson1968(CCT):
         dip = kelvin = duv = 0.0
         sign = -1
         u, v = color.split_chromaticity(self.CHROMATICITY)[:-1]
-        end = len(self.table) - 1
+        table = self.table
+        end = len(table) - 1
 
         # Search for line pair coordinate is between.
-        for index, current in enumerate(self.table):
+        for index, current in enumerate(table):
             # Get the distance
             # If a table was generated with values down to 1000K,
             # we would get a positive slope, so to keep logic the
@@ -183,7 +217,7 @@ class Robertson1968(CCT):
 
             if index > 0 and (di <= 0.0 or index == end):
                 # Calculate the required interpolation factor between the two lines
-                previous = self.table[index - 1]
+                previous = table[index - 1]
                 di /= current.slope_length
                 dip /= previous.slope_length
                 factor = dip / (dip - di)
@@ -207,25 +241,17 @@ class Robertson1968(CCT):
 
         return [kelvin, duv]
 
-    def from_cct(
-        self,
-        color: type[AnyColor],
-        space: str,
-        kelvin: float,
-        duv: float,
-        scale: bool,
-        scale_space: str | None,
-        **kwargs: Any
-    ) -> AnyColor:
-        """Calculate a color that satisfies the CCT."""
+    def to_uv(self, kelvin: float, duv: float) -> Vector:
+        """Calculate the chromaticity coordinates that satisfy the CCT."""
 
         # Find inverse temperature to use as index.
         mired = 1.0E6 / kelvin
         u = v = 0.0
-        end = len(self.table) - 2
+        table = self.table
+        end = len(table) - 2
 
-        for index, current in enumerate(self.table):
-            future = self.table[index + 1]
+        for index, current in enumerate(table):
+            future = table[index + 1]
 
             # Find the two isotherms that our target temp is between
             future_mired = future.mired
@@ -249,4 +275,24 @@ class Robertson1968(CCT):
                     v += dv * sign * duv
                 break
 
-        return color.chromaticity(space, [u, v, 1], self.CHROMATICITY, scale=scale, scale_space=scale_space)
+        return [u, v]
+
+    def from_cct(
+        self,
+        color: type[AnyColor],
+        space: str,
+        kelvin: float,
+        duv: float,
+        scale: bool,
+        scale_space: str | None,
+        **kwargs: Any
+    ) -> AnyColor:
+        """Calculate a color that satisfies the CCT."""
+
+        uv = self.to_uv(kelvin, duv)
+        return color.chromaticity(space, [*uv, 1], self.CHROMATICITY, scale=scale, scale_space=scale_space)
+
+    def from_cct_many(self, kelvins: Iterable[float], duv: float = 0.0) -> list[Vector]:
+        """Calculate the chromaticity coordinates that satisfy the CCT for each of the given temperatures."""
+
+        return [self.to_uv(k, duv) for k in kelvins]
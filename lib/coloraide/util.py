@@ -33,6 +33,27 @@ C1 = 3424 / 4096
 C2 = 2413 / 128
 C3 = 2392 / 128
 
+# NumPy module once imported, `False` if it is not installed.
+_NUMPY = None  # type: Any
+
+
+def import_numpy() -> Any:
+    """
+    Get NumPy, or `None` if it is not installed.
+
+    NumPy is optional and only used to speed up bulk operations, so it is not imported until first needed.
+    """
+
+    global _NUMPY
+
+    if _NUMPY is None:
+        try:
+            import numpy
+            _NUMPY = numpy
+        except ImportError:  # pragma: no cover
+            _NUMPY = False
+    return _NUMPY or None
+
 
 def xy_to_xyz(xy: VectorLike, Y: float = 1.0, scale: float = 1.0) -> Vector:
     """
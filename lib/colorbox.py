@@ -9,6 +9,7 @@ from .coloraide import Color
 from .coloraide import algebra as alg
 import base64
 import io
+import math
 
 CHECK_LIGHT = Color("#FFFFFF")
 CHECK_DARK = Color("#CCCCCC")
@@ -25,7 +26,7 @@ LEFT = 8
 X = 0
 Y = 1
 
-__all__ = ('color_box',)
+__all__ = ('color_box', 'color_grid')
 
 BIT_DEPTH = 16
 MAX_VALUE = 2 ** BIT_DEPTH - 1
@@ -49,11 +50,46 @@ def to_list(rgb, alpha=False):
     return [r, g, b, a] if alpha else [r, g, b]
 
 
+def checkered_colors(color, light, dark):
+    """
+    Mix color with the light and dark checkered colors.
+
+    The checkered colors are opaque, so we can simply composite the color over
+    them with `source-over` directly on the coordinates, sharing the premultiplied
+    color for both, instead of going through the general compositing logic.
+    The color should be in an RGB space, and the results are returned as lists of
+    RGBA coordinates in that space.
+    """
+
+    space = color.space()
+    coords = color.coords(nans=False)
+    alpha = color[-1]
+    alpha = 0.0 if math.isnan(alpha) else alg.clamp(alpha, 0.0, 1.0)
+
+    # Opaque colors are unaffected by what is behind them.
+    if alpha == 1:
+        coords.append(1.0)
+        return coords, coords
+
+    if light.space() != space:
+        light = light.convert(space)
+    if dark.space() != space:
+        dark = dark.convert(space)
+
+    premultiplied = [c * alpha for c in coords]
+    inverse = 1.0 - alpha
+    mixed_light = [c + b * inverse for c, b in zip(premultiplied, light.coords(nans=False))]
+    mixed_light.append(1.0)
+    mixed_dark = [c + b * inverse for c, b in zip(premultiplied, dark.coords(nans=False))]
+    mixed_dark.append(1.0)
+    return mixed_light, mixed_dark
+
+
 def checkered_color(color, background):
     """Mix color with the checkered color."""
 
-    checkered = Color(color)
-    return Color.layer([checkered, background], space=checkered.space(), out_space=checkered.space())
+    mixed = checkered_colors(color, background, background)[0]
+    return Color(color.space(), mixed[:-1], mixed[-1])
 
 
 def get_border_size(direction, border_map):
@@ -128,12 +164,8 @@ def color_box_raw(
                     )
                 )
             else:
-                preview_colors.append(
-                    (
-                        to_list(checkered_color(colors[c], check_light)),
-                        to_list(checkered_color(colors[c], check_dark))
-                    )
-                )
+                light, dark = checkered_colors(colors[c], check_light, check_dark)
+                preview_colors.append((to_list(light), to_list(dark)))
     else:
         if alpha:
             preview_colors.append(
@@ -256,3 +288,73 @@ def color_box(*args, **kwargs):
     return '<img src="data:image/png;base64,{}">'.format(
         base64.b64encode(color_box_raw(*args, **kwargs)).decode('ascii')
     )
+
+
+def color_grid_raw(rows, border=None, cell_size=8, border_size=1, check_size=4, gamut_space='srgb'):
+    """
+    Generate a grid of colors.
+
+    Rows is a list of rows where each row is a list of colors. Colors should
+    already be in the gamut space. Each color is drawn as a square cell of `cell_size`,
+    and cells are separated by the border. Transparent colors are shown over a
+    checkerboard of `check_size` squares. This is useful for things like heat maps.
+    """
+
+    check_light = CHECK_LIGHT.convert(gamut_space)
+    check_dark = CHECK_DARK.convert(gamut_space)
+
+    if border is None:
+        border = Color(gamut_space, [1, 1, 1])
+    border = to_list(border, False)
+
+    columns = max(len(row) for row in rows) if rows else 0
+    width = columns * cell_size + (columns + 1) * border_size
+    height = len(rows) * cell_size + (len(rows) + 1) * border_size
+
+    border_row = list(border * width)
+    border_cell = list(border * border_size)
+
+    p = []
+    for _ in range(border_size):
+        p.append(border_row)
+
+    for colors in rows:
+        cells = []
+        for color in colors:
+            light, dark = checkered_colors(color, check_light, check_dark)
+            cells.append((to_list(light), to_list(dark)))
+
+        # Every pixel row of a cell is one of two checkerboard phases, so only build each once.
+        phases = [None, None]
+        for y in range(cell_size):
+            phase = (y // check_size) % 2
+            row = phases[phase]
+            if row is None:
+                row = list(border_cell)
+                for light, dark in cells:
+                    if light == dark:
+                        row += light * cell_size
+                    else:
+                        for x in range(cell_size):
+                            row += dark if ((x // check_size) + phase) % 2 == 0 else light
+                    row += border_cell
+                # Pad out short rows
+                row += border * (width - (len(row) // 3))
+                phases[phase] = row
+            p.append(row)
+        for _ in range(border_size):
+            p.append(border_row)
+
+    with io.BytesIO() as f:
+        img = Writer(width, height, alpha=False, bitdepth=BIT_DEPTH)
+        img.write(f, p)
+        f.seek(0)
+        return f.read()
+
+
+def color_grid(*args, **kwargs):
+    """Generate a grid of colors and base64 encode it."""
+
+    return '<img src="data:image/png;base64,{}">'.format(
+        base64.b64encode(color_grid_raw(*args, **kwargs)).decode('ascii')
+    )
@@ -0,0 +1,79 @@
+"""Test algebra."""
+import unittest
+import random
+from lib.coloraide import algebra as alg
+
+
+def dense_141(n):
+    """Create the dense `[1, 4, 1]` matrix previously used to naturalize B-spline controls."""
+
+    m = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        m[i][i] = 4.0
+        if i:
+            m[i][i - 1] = 1.0
+        if i < n - 1:
+            m[i][i + 1] = 1.0
+    return m
+
+
+def naturalize_dense(coordinates):
+    """Naturalize B-spline controls with the previous general solve of the dense matrix."""
+
+    n = len(coordinates) - 2
+    if n == 1:
+        coordinates[1] = [(a * 6 - (b + c)) / 4 for a, b, c in zip(coordinates[1], coordinates[0], coordinates[2])]
+    elif n > 1:
+        c = []
+        for r in range(1, n + 1):
+            if r == 1:
+                c.append([a * 6 - b for a, b in zip(coordinates[r], coordinates[r - 1])])
+            elif r == n:
+                c.append([a * 6 - b for a, b in zip(coordinates[n], coordinates[n + 1])])
+            else:
+                c.append([a * 6 for a in coordinates[r]])
+        v = alg.dot(alg.inv(dense_141(n)), c, dims=alg.D2)
+        for r in range(1, n + 1):
+            coordinates[r] = v[r - 1]
+
+
+class TestTridiagonal(unittest.TestCase):
+    """Test the tridiagonal solver."""
+
+    def assert_matrix_almost_equal(self, m1, m2, places=12):
+        """Compare matrices."""
+
+        self.assertEqual(len(m1), len(m2))
+        for r1, r2 in zip(m1, m2):
+            self.assertEqual(len(r1), len(r2))
+            for a, b in zip(r1, r2):
+                self.assertAlmostEqual(a, b, places=places)
+
+    def test_empty(self):
+        """Test an empty system."""
+
+        self.assertEqual(alg.solve_tridiagonal(1.0, 4.0, 1.0, []), [])
+
+    def test_solve(self):
+        """Test against a general solve of the dense matrix, including the smallest sizes."""
+
+        rand = random.Random(7)
+        for lower, diag, upper in ((1.0, 4.0, 1.0), (-1.0, 3.0, 0.5), (2.0, 5.0, -1.5)):
+            for n in list(range(1, 12)) + [40]:
+                m = [
+                    [diag if i == j else lower if j == i - 1 else upper if j == i + 1 else 0.0 for j in range(n)]
+                    for i in range(n)
+                ]
+                b = [[rand.uniform(-10, 10) for _ in range(4)] for _ in range(n)]
+                self.assert_matrix_almost_equal(alg.solve_tridiagonal(lower, diag, upper, b), alg.solve(m, b))
+
+    def test_naturalize_bspline_controls(self):
+        """Test natural B-spline controls against the previous dense solve."""
+
+        rand = random.Random(11)
+        for size in list(range(2, 16)) + [50]:
+            coords = [[rand.uniform(-1, 2) for _ in range(4)] for _ in range(size)]
+            expected = [c[:] for c in coords]
+            naturalize_dense(expected)
+            alg.naturalize_bspline_controls(coords)
+            self.assert_matrix_almost_equal(coords, expected)
@@ -0,0 +1,75 @@
+"""Test merging color accumulators against accumulating in a single pass."""
+import unittest
+import random
+import math
+import pickle
+from lib.coloraide.everything import ColorAll as Color
+from lib.coloraide.average import ColorAccumulator
+
+
+class TestColorAccumulator(unittest.TestCase):
+    """Test the color accumulator."""
+
+    def setUp(self):
+        """Create weighted colors, some translucent, some achromatic, and some with hues across 0/360."""
+
+        rand = random.Random(19)
+        self.colors = []
+        for i in range(90):
+            hue = rand.uniform(-40, 40) % 360 if i % 3 else rand.uniform(0, 360)
+            chroma = 0 if i % 17 == 0 else rand.uniform(0.02, 0.3)
+            alpha = rand.uniform(0.2, 1) if i % 4 else math.nan
+            self.colors.append(Color('oklch', [rand.uniform(0.1, 0.9), chroma, hue], alpha))
+        self.weights = [rand.uniform(0, 2) for _ in self.colors]
+
+    def assert_close(self, values1, values2, msg=None):
+        """Compare channel values, undefined values must match."""
+
+        self.assertEqual(len(values1), len(values2), msg)
+        for a, b in zip(values1, values2):
+            if math.isnan(b):
+                self.assertTrue(math.isnan(a), f'{msg}: {values1} != {values2}')
+            else:
+                self.assertTrue(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12), f'{msg}: {values1} != {values2}')
+
+    def test_merge_pickled(self):
+        """Test that merging pickled partial accumulators matches accumulating in a single pass."""
+
+        for space in ('oklch', 'srgb', 'hwb'):
+            for premultiplied in (True, False):
+                single = ColorAccumulator(Color, space, premultiplied)
+                single.extend(self.colors, self.weights)
+
+                merged = ColorAccumulator(Color, space, premultiplied)
+                for start in range(0, len(self.colors), 25):
+                    part = ColorAccumulator(Color, space, premultiplied)
+                    part.extend(self.colors[start:start + 25], self.weights[start:start + 25])
+                    merged.merge(pickle.loads(pickle.dumps(part)))
+                merged.merge(ColorAccumulator(Color, space, premultiplied))
+
+                msg = f'{space}, premultiplied={premultiplied}'
+                self.assertEqual(len(merged), len(single))
+                self.assert_close(merged.average()[:], single.average()[:], msg)
+                self.assert_close(merged.minimum(), single.minimum(), msg)
+                self.assert_close(merged.maximum(), single.maximum(), msg)
+                self.assert_close(merged.variance(), single.variance(), msg)
+
+    def test_hue_statistics(self):
+        """Test that hue has no extent and that its variance is circular across 0/360."""
+
+        acc = ColorAccumulator(Color, 'oklch')
+        acc.extend([Color('oklch', [0.5, 0.1, 350]), Color('oklch', [0.5, 0.1, 10])])
+        self.assertTrue(math.isnan(acc.minimum()[2]))
+        self.assertTrue(math.isnan(acc.maximum()[2]))
+        self.assertAlmostEqual(acc.variance()[2], 1 - math.cos(math.radians(10)))
+        self.assertAlmostEqual(acc.average()['hue'] % 360, 0, places=9)
+        self.assertEqual(acc.minimum()[:2], [0.5, 0.1])
+
+    def test_merge_mismatch(self):
+        """Test that accumulators of different spaces or premultiplication cannot be merged."""
+
+        acc = ColorAccumulator(Color, 'oklch')
+        with self.assertRaises(ValueError):
+            acc.merge(ColorAccumulator(Color, 'srgb'))
+        with self.assertRaises(ValueError):
+            acc.merge(ColorAccumulator(Color, 'oklch', premultiplied=False))
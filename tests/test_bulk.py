@@ -0,0 +1,86 @@
+"""Test bulk operations against the equivalent operations on individual colors."""
+import unittest
+import random
+import math
+from lib.coloraide import bulk
+from lib.coloraide.everything import ColorAll as Color
+
+SPACES = sorted(Color.CS_MAP.keys())
+TARGETS = ('xyz-d65', 'xyz-d50', 'srgb', 'srgb-linear', 'prophoto-rgb', 'lab', 'oklch', 'acescc')
+
+
+def as_list(coords):
+    """Get the coordinates as lists whether they are NumPy arrays or not."""
+
+    return coords.tolist() if hasattr(coords, 'tolist') else coords
+
+
+class TestBulk(unittest.TestCase):
+    """Test bulk operations."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create random colors in each space, some of which are outside of sRGB."""
+
+        rand = random.Random(13)
+        colors = [Color('srgb', [rand.uniform(-0.2, 1.2) for _ in range(3)]) for _ in range(4)]
+        colors.append(Color('srgb', [0.01, 0.02, 0.005]))
+        cls.samples = {space: [c.convert(space, norm=False)[:-1] for c in colors] for space in SPACES}
+
+    def assert_coords_close(self, coords1, coords2, msg=None):
+        """Compare coordinates, any value matches an expected undefined value, such as an achromatic hue."""
+
+        self.assertEqual(len(coords1), len(coords2), msg)
+        for a, b in zip(coords1, coords2):
+            if not math.isnan(b):
+                self.assertTrue(math.isclose(a, b, rel_tol=1e-7, abs_tol=1e-9), f'{msg}: {coords1} != {coords2}')
+
+    def test_convert(self):
+        """Test conversion from and to every space."""
+
+        for space in SPACES:
+            for target in TARGETS:
+                for source, target_space in ((space, target), (target, space)):
+                    coords = self.samples[source]
+                    results = as_list(bulk.convert(Color, coords, source, target_space))
+                    for c, result in zip(coords, results):
+                        expected = Color(source, c).convert(target_space, norm=False)[:-1]
+                        self.assert_coords_close(result, expected, f'{source} -> {target_space}')
+
+    def test_clip(self):
+        """Test clipping every space to its own gamut and to sRGB."""
+
+        for space in SPACES:
+            coords = self.samples[space]
+            results = as_list(bulk.clip(Color, coords, space))
+            for c, result in zip(coords, results):
+                self.assert_coords_close(result, Color(space, c).clip()[:-1], space)
+
+            results = as_list(bulk.clip(Color, coords, space, 'srgb'))
+            for c, result in zip(coords, results):
+                self.assert_coords_close(result, Color(space, c).clip('srgb')[:-1], f'{space} in srgb')
+
+    def test_luminance(self):
+        """Test luminance from every space."""
+
+        for space in SPACES:
+            coords = self.samples[space]
+            results = as_list(bulk.luminance(Color, coords, space))
+            for c, result in zip(coords, results):
+                self.assertAlmostEqual(result, Color(space, c).luminance(), places=9, msg=space)
+
+    def test_contrast(self):
+        """Test contrast from every space, both between arrays and against a single color."""
+
+        for space in SPACES:
+            coords = self.samples[space]
+            other = self.samples[space][::-1]
+            results = as_list(bulk.contrast(Color, coords, other, space))
+            for c1, c2, result in zip(coords, other, results):
+                expected = Color(space, c1).contrast(Color(space, c2), method='wcag21')
+                self.assertAlmostEqual(result, expected, places=7, msg=space)
+
+            results = as_list(bulk.contrast(Color, coords, other[0], space))
+            for c1, result in zip(coords, results):
+                expected = Color(space, c1).contrast(Color(space, other[0]), method='wcag21')
+                self.assertAlmostEqual(result, expected, places=7, msg=space)
@@ -0,0 +1,60 @@
+"""Test the color index against a brute force scan."""
+import unittest
+import random
+from lib.coloraide import Color
+from lib.coloraide import distance
+from lib.coloraide.distance.index import ColorIndex
+
+
+class TestColorIndex(unittest.TestCase):
+    """Test color index queries."""
+
+    def setUp(self):
+        """Set up random colors and targets."""
+
+        rand = random.Random(31)
+        self.colors = [Color('srgb', [rand.random() for _ in range(3)]) for _ in range(300)]
+        self.targets = [Color('srgb', [rand.random() for _ in range(3)]) for _ in range(15)]
+
+    def brute_force(self, target, space):
+        """Get indexed colors sorted by Euclidean distance in the space."""
+
+        return sorted(self.colors, key=lambda c: target.distance(c, space=space))
+
+    def test_nearest(self):
+        """Test that the nearest colors match a scan."""
+
+        for space in ('lab-d65', 'oklab'):
+            index = ColorIndex(Color, self.colors, space)
+            for target in self.targets:
+                found = [c for c, _ in index.nearest(target, 5)]
+                self.assertEqual(found, self.brute_force(target, space)[:5])
+
+    def test_within(self):
+        """Test that radius queries match a scan."""
+
+        index = ColorIndex(Color, self.colors, 'oklab')
+        for target in self.targets:
+            found = [c for c, _ in index.within(target, 0.1)]
+            expected = [c for c in self.brute_force(target, 'oklab') if target.distance(c, space='oklab') <= 0.1]
+            self.assertEqual(found, expected)
+
+    def test_closest_exact(self):
+        """Test that closest through an index matches a scan for every method."""
+
+        index = ColorIndex(Color, self.colors, 'lab-d65')
+        for method in ('76', 'ok', '2000', 'cmc', 'hyab', 'itp'):
+            for target in self.targets:
+                self.assertEqual(
+                    distance.closest(target, index, method),
+                    distance.closest(target, self.colors, method)
+                )
+                self.assertEqual(target.closest(index, method=method), target.closest(self.colors, method=method))
+
+    def test_nearest_euclidean_method(self):
+        """Test that methods Euclidean in the index space are exact without oversampling."""
+
+        index = ColorIndex(Color, self.colors, 'oklab')
+        for target in self.targets:
+            found = [c for c, _ in index.nearest(target, 5, method='ok')]
+            self.assertEqual(found, self.brute_force(target, 'oklab')[:5])
@@ -0,0 +1,85 @@
+"""Test HCT round trips and the J guess tables."""
+import unittest
+import random
+import gc
+import weakref
+from lib.coloraide.everything import ColorAll as Color
+from lib.coloraide.spaces import hct
+from lib.coloraide.spaces.cam16 import Environment
+
+
+class TestHCT(unittest.TestCase):
+    """Test HCT conversions."""
+
+    def test_srgb_round_trip(self):
+        """Test that sRGB colors round trip through HCT."""
+
+        rand = random.Random(7)
+        for _ in range(500):
+            color = Color('srgb', [rand.random() for _ in range(3)])
+            result = color.convert('hct').convert('srgb')
+            for a, b in zip(color[:-1], result[:-1]):
+                self.assertAlmostEqual(a, b, places=9)
+
+    def test_tone_convergence(self):
+        """
+        Test that solving HCT to XYZ hits the requested tone.
+
+        Starting from the J guess tables, the solver hits the tone within `1e-12` for all but
+        34 of these samples, compared to 193 when starting from the curve fitted J alone.
+        """
+
+        env = hct.HCT.ENV
+        rand = random.Random(7)
+        misses = 0
+        for _ in range(3000):
+            h = rand.uniform(0, 360)
+            c = rand.uniform(0, 145)
+            t = rand.uniform(0.01, 100)
+            xyz = hct.hct_to_xyz([h, c, t], env)
+            if abs(xyz[1] - hct.lstar_to_y(t)) >= 1e-12:
+                misses += 1
+        self.assertLessEqual(misses, 34)
+
+    def test_guess_table_lifetime(self):
+        """Test that discarded environments, and their J guess tables, are collected."""
+
+        count = len(hct._GUESSES)
+        envs = [
+            Environment(
+                white=hct.HCT.WHITE,
+                adapting_luminance=lum,
+                background_luminance=20,
+                surround='dim',
+                discounting=False
+            )
+            for lum in (16, 32, 64, 128, 256)
+        ]
+        for env in envs:
+            hct.hct_to_xyz([120, 40, 50], env)
+        self.assertEqual(len(hct._GUESSES), count + 5)
+        refs = [weakref.ref(env) for env in envs] + [weakref.ref(hct._GUESSES[env]) for env in envs]
+
+        del env, envs
+        gc.collect()
+        self.assertTrue(all(ref() is None for ref in refs))
+        self.assertEqual(len(hct._GUESSES), count)
+
+    def test_solved_cache(self):
+        """Test that solved colors are cached per environment and the cache starts over when full."""
+
+        env = Environment(
+            white=hct.HCT.WHITE,
+            adapting_luminance=64,
+            background_luminance=20,
+            surround='average',
+            discounting=False
+        )
+        for t in range(hct.SOLVED_CACHE_SIZE):
+            hct.hct_to_xyz([200, 30, t * 100 / hct.SOLVED_CACHE_SIZE], env)
+        solved = hct._GUESSES[env].solved
+        self.assertEqual(len(solved), hct.SOLVED_CACHE_SIZE)
+        self.assertEqual(hct.hct_to_xyz([200, 30, 0.0], env), list(solved[(200, 30, 0.0)]))
+
+        hct.hct_to_xyz([200, 30, 100], env)
+        self.assertEqual(list(solved), [(200, 30, 100)])
@@ -0,0 +1,104 @@
+"""Test that memoized Okhsl cusps match the uncached computation."""
+import unittest
+import random
+import math
+import copy
+from lib.coloraide import algebra as alg
+from lib.coloraide.spaces import okhsl
+from lib.coloraide.spaces.okhsl import LMS_TO_SRGBL, SRGBL_COEFF
+
+
+def uncached_cusp(a, b, lms_to_rgb, ok_coeff):
+    """Find the cusp without consulting the cache."""
+
+    s_cusp = okhsl.compute_max_saturation(a, b, lms_to_rgb, ok_coeff)
+    r, g, b_ = okhsl.oklab_to_linear_rgb([1, s_cusp * a, s_cusp * b], lms_to_rgb)
+    l_cusp = alg.nth_root(1.0 / max(max(r, g), b_), 3)
+    return [l_cusp, l_cusp * s_cusp]
+
+
+def random_hues(rand, count):
+    """Get normalized `a` and `b` for random hues."""
+
+    hues = []
+    for _ in range(count):
+        h = rand.uniform(0, math.tau)
+        hues.append((math.cos(h), math.sin(h)))
+    return hues
+
+
+class TestCuspCache(unittest.TestCase):
+    """Test the cusp cache."""
+
+    def setUp(self):
+        """Start with an empty cache."""
+
+        okhsl._CUSPS.clear()
+
+    def tearDown(self):
+        """Leave an empty cache."""
+
+        okhsl._CUSPS.clear()
+
+    def test_memoized(self):
+        """Test that cached cusps match the uncached computation."""
+
+        for a, b in random_hues(random.Random(3), 200):
+            expected = uncached_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF)
+            self.assertEqual(okhsl.find_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF), expected)
+            self.assertIn((a, b, id(LMS_TO_SRGBL), id(SRGBL_COEFF)), okhsl._CUSPS)
+            self.assertEqual(okhsl.find_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF), expected)
+
+    def test_gamut_in_key(self):
+        """Test that the same hue in a different gamut is not served from the cache."""
+
+        a, b = random_hues(random.Random(5), 1)[0]
+        okhsl.find_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF)
+
+        # Scaling the RGB matrix moves the cusp.
+        scaled = [[v * 2 for v in row] for row in LMS_TO_SRGBL]
+        self.assertEqual(okhsl.find_cusp(a, b, scaled, SRGBL_COEFF), uncached_cusp(a, b, scaled, SRGBL_COEFF))
+        self.assertNotEqual(
+            okhsl.find_cusp(a, b, scaled, SRGBL_COEFF),
+            okhsl.find_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF)
+        )
+
+    def test_stale_identity(self):
+        """Test that an entry for matrices whose `id` has since been reused is not returned."""
+
+        a, b = random_hues(random.Random(7), 1)[0]
+        expected = uncached_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF)
+
+        # Simulate an entry left by other, since freed, matrices that happened to have the same `id`.
+        key = (a, b, id(LMS_TO_SRGBL), id(SRGBL_COEFF))
+        okhsl._CUSPS[key] = (copy.deepcopy(LMS_TO_SRGBL), copy.deepcopy(SRGBL_COEFF), 0.5, 0.5)
+        self.assertEqual(okhsl.find_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF), expected)
+
+        # The stale entry is replaced.
+        entry = okhsl._CUSPS[key]
+        self.assertIs(entry[0], LMS_TO_SRGBL)
+        self.assertIs(entry[1], SRGBL_COEFF)
+        self.assertEqual(list(entry[2:]), expected)
+
+    def test_cache_clear(self):
+        """Test that the cache starts over when full and still returns correct cusps."""
+
+        hues = random_hues(random.Random(11), okhsl.CUSP_CACHE_SIZE + 1)
+        for a, b in hues[:-1]:
+            okhsl.find_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF)
+        self.assertEqual(len(okhsl._CUSPS), okhsl.CUSP_CACHE_SIZE)
+
+        a, b = hues[-1]
+        self.assertEqual(
+            okhsl.find_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF),
+            uncached_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF)
+        )
+        self.assertEqual(list(okhsl._CUSPS), [(a, b, id(LMS_TO_SRGBL), id(SRGBL_COEFF))])
+
+        # Hues from before the clear are computed again and match.
+        for a, b in hues[:50]:
+            self.assertEqual(
+                okhsl.find_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF),
+                uncached_cusp(a, b, LMS_TO_SRGBL, SRGBL_COEFF)
+            )
+        self.assertEqual(len(okhsl._CUSPS), 51)
@@ -0,0 +1,42 @@
+"""Test fitting many colors with a ray trace mapper."""
+import unittest
+import random
+from lib.coloraide.everything import ColorAll as Color
+
+
+class TestRayTraceMapper(unittest.TestCase):
+    """Test the ray trace mapper."""
+
+    def setUp(self):
+        """Create colors in and out of the tested gamuts."""
+
+        rand = random.Random(17)
+        self.colors = [Color('rec2020', [rand.uniform(-0.1, 1.1) for _ in range(3)]) for _ in range(60)]
+        self.colors.append(Color('srgb', [0.2, 0.4, 0.6]))
+        self.colors.append(Color('display-p3', [1.05, 0.5, -0.02]).convert('oklch'))
+
+    def test_fit_many(self):
+        """Test that fitting many colors matches fitting each with `Color.fit`."""
+
+        plugin = Color.FIT_MAP['raytrace']
+        for space in ('srgb', 'display-p3', 'a98-rgb', 'okhsl', 'cmy'):
+            for pspace in ('oklch', 'cam16-jmh'):
+                for adaptive in (0.0, 0.5):
+                    colors = [c.clone() for c in self.colors]
+                    plugin.mapper(Color, space, pspace=pspace, adaptive=adaptive).fit_many(colors)
+                    for color, result in zip(self.colors, colors):
+                        expected = color.clone().fit(space, method='raytrace', pspace=pspace, adaptive=adaptive)
+                        self.assertEqual(result.space(), expected.space())
+                        self.assertEqual(result[:], expected[:], f'{color} in {space}, {pspace}, {adaptive}')
+
+    def test_fit_in_given_space(self):
+        """Test that the plugin fits in the space it is given, the same as a mapper for the space."""
+
+        plugin = Color.FIT_MAP['raytrace']
+        mapper = plugin.mapper(Color, 'hsl')
+        for color in self.colors:
+            result = color.clone()
+            plugin.fit(result, 'hsl')
+            expected = color.clone()
+            mapper.fit(expected)
+            self.assertEqual(result[:], expected[:])
@@ -0,0 +1,134 @@
+"""Test that lazily built CCT tables match the eager baseline construction."""
+import unittest
+import math
+from lib.coloraide import Color
+from lib.coloraide import algebra as alg
+from lib.coloraide import cmfs
+from lib.coloraide import util
+from lib.coloraide import cat
+from lib.coloraide.temperature import planck
+from lib.coloraide.temperature.robertson_1968 import Robertson1968, MIRED_EXTENDED
+from lib.coloraide.temperature.ohno_2013 import Ohno2013
+
+D65 = cat.WHITES['2deg']['D65']
+
+
+def eager_locus(temp, table, white, start=360, end=830, step=5):
+    """Integrate the Planckian locus one wavelength at a time, directly from the color matching functions."""
+
+    x = y = z = 0.0
+    for wavelength in range(start, end + 1, step):
+        m = planck.C1 * (wavelength ** -5) * math.expm1((planck.C2 * 1e9) / (wavelength * temp)) ** -1
+        cmf = table[wavelength]
+        x += m * cmf[0]
+        y += m * cmf[1]
+        z += m * cmf[2]
+    return util.xyz_to_xyY([x, y, z], white)[:-1]
+
+
+def eager_robertson_table(table, white, mired, sigfig, planck_step):
+    """Generate the Robertson 1968 table one isotherm at a time."""
+
+    xyzw = util.xy_to_xyz(white)
+    entries = []
+    for t in mired:
+        uv1 = util.xy_to_uv_1960(eager_locus(1e6 / (t - 0.01), table, xyzw, step=planck_step))
+        uv2 = util.xy_to_uv_1960(eager_locus(1e6 / (t + 0.01), table, xyzw, step=planck_step))
+        if t == 0:
+            factor = 0.5
+            uv = [alg.lerp(uv1[0], uv2[0], factor), alg.lerp(uv1[1], uv2[1], factor)]
+        else:
+            uv = util.xy_to_uv_1960(eager_locus(1e6 / t, table, xyzw, step=planck_step))
+            d1 = math.sqrt((uv[1] - uv1[1]) ** 2 + (uv[0] - uv1[0]) ** 2)
+            d2 = math.sqrt((uv2[1] - uv[1]) ** 2 + (uv2[0] - uv[0]) ** 2)
+            factor = d1 / (d1 + d2)
+
+        m1 = -((uv[1] - uv1[1]) / (uv[0] - uv1[0])) ** -1
+        m2 = -((uv2[1] - uv[1]) / (uv2[0] - uv[0])) ** -1
+        m = alg.lerp(m1, m2, factor)
+        template = '{{:.{}g}}'.format(sigfig)
+        slope = float(template.format(m))
+        length = math.sqrt(1 + slope * slope)
+        entries.append(
+            (
+                float(t),
+                float(template.format(uv[0])),
+                float(template.format(uv[1])),
+                slope,
+                length,
+                1 / length,
+                slope / length
+            )
+        )
+    return entries
+
+
+def eager_splines(table, white, planck_step):
+    """Build the Ohno 2013 black body splines along with their domains."""
+
+    keys = list(table.keys())
+    xyzw = util.xy_to_xyz(white)
+    splines = []
+    for start, end, step in ((1000, 20000, 130), (20000, 100000, 220)):
+        inc = (end - start) / step
+        domain = []
+        points = []
+        for r in range(step + 1):
+            k = r * inc + start
+            domain.append(k)
+            points.append(util.xy_to_uv_1960(eager_locus(k, table, xyzw, min(keys), max(keys), planck_step)))
+        splines.append((domain, alg.interpolate(points, method='catrom')))
+    return splines
+
+
+class TestLazyTables(unittest.TestCase):
+    """Test lazily built temperature tables."""
+
+    def test_robertson_table(self):
+        """Test the Robertson 1968 table is built on first use and matches the eager construction."""
+
+        plugin = Robertson1968()
+        self.assertIsNone(plugin._table)
+
+        expected = eager_robertson_table(cmfs.CIE_1931_2DEG, D65, MIRED_EXTENDED, 5, 1)
+        table = plugin.table
+        self.assertIs(plugin.table, table)
+        self.assertEqual(len(table), len(expected))
+        for entry, values in zip(table, expected):
+            for a, b in zip(entry, values):
+                self.assertAlmostEqual(a, b, places=12)
+
+    def test_ohno_splines(self):
+        """Test the Ohno 2013 black body curve is built on first use and matches the eager construction."""
+
+        plugin = Ohno2013()
+        self.assertIsNone(plugin._blackbody)
+        curve = plugin.blackbody
+        self.assertIsNone(curve.spline)
+
+        # Exact points never need the splines.
+        curve(6500, exact=True)
+        self.assertIsNone(curve.spline)
+
+        (domain, spline), (domain2, spline2) = eager_splines(cmfs.CIE_1931_2DEG, D65, 5)
+        for temp in range(1000, 100001, 1370):
+            uv = curve(temp)
+            if temp <= 20000:
+                expected = spline(curve.scale(temp, domain))
+            else:
+                expected = spline2(curve.scale(temp, domain2))
+            for a, b in zip(uv, expected):
+                self.assertAlmostEqual(a, b, places=12)
+        self.assertEqual(curve.domain, domain)
+        self.assertEqual(curve.domain2, domain2)
+
+    def test_cct_round_trip(self):
+        """Test both methods still round trip through the lazily built tables."""
+
+        for method in ('robertson-1968', 'ohno-2013'):
+            for temp in (2000, 4500, 6504, 12000):
+                for duv in (-0.01, 0.0, 0.01):
+                    color = Color.blackbody('xyz-d65', temp, duv, method=method, scale=False)
+                    cct, duv2 = color.cct(method=method)
+                    self.assertAlmostEqual(cct, temp, delta=temp * 1e-3)
+                    self.assertAlmostEqual(duv2, duv, places=4)
@@ -0,0 +1,159 @@
+"""
+Microbenchmark the 3x3 algebra kernels and the color space conversions built on them.
+
+The dedicated kernels (`matvec_x3`, `matmat_x3`, and `vecdot_x3`) are timed against the
+generic, shape dispatching `matmul_x3` and `dot` they replace, followed by the `to_base`
+and `from_base` conversion of each color space. Times are the best of several repeats in
+microseconds per call.
+
+To compare the conversions before and after a change, give a git ref with `--baseline`.
+The ref's `lib` tree is extracted to a temporary directory and timed in a separate process
+so both trees can be shown side by side.
+
+Run from the repository root: `python tools/bench_algebra.py [--repeat N] [--number N] [--baseline REF] [space ...]`.
+"""
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+M = [
+    [0.4123907992659595, 0.357584339383878, 0.1804807884018343],
+    [0.21263900587151036, 0.7151686787677559, 0.07219231536073371],
+    [0.01933081871559185, 0.11919477979462598, 0.9505321522496606]
+]
+V = [0.3, 0.5, 0.7]
+
+
+def load(root):
+    """Import the algebra module and a color class with every space from the given tree."""
+
+    sys.path.insert(0, root)
+    from lib.coloraide import algebra as alg
+    from lib.coloraide.everything import ColorAll
+    return alg, ColorAll
+
+
+def best(fn, number, repeat):
+    """Get the best time of a function in microseconds per call."""
+
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def bench_kernels(alg, number, repeat):
+    """Benchmark the kernels against the generic functions they replace."""
+
+    m2 = alg.inv(M)
+    cases = [
+        ('matrix x vector', lambda: alg.matmul_x3(M, V, dims=alg.D2_D1), lambda: alg.matvec_x3(M, V)),
+        ('matrix x matrix', lambda: alg.matmul_x3(M, m2, dims=alg.D2), lambda: alg.matmat_x3(M, m2)),
+        ('vector . vector', lambda: alg.dot(V, V, dims=alg.D1), lambda: alg.vecdot_x3(V, V))
+    ]
+
+    print('{:<18} {:>10} {:>10}'.format('kernel', 'generic', 'x3'))
+    for name, generic, kernel in cases:
+        print('{:<18} {:>10.3f} {:>10.3f}'.format(name, best(generic, number, repeat), best(kernel, number, repeat)))
+
+
+def time_spaces(color_cls, spaces, number, repeat):
+    """Time the conversion of each color space from and to its base space."""
+
+    times = {}
+    for name in spaces:
+        cs = color_cls.CS_MAP.get(name)
+        if cs is None or not cs.BASE or cs.BASE == name:
+            continue
+        base = color_cls('srgb', V).convert(cs.BASE)[:-1]
+        coords = cs.from_base(base)
+        times[name] = (
+            best(lambda: cs.from_base(base), number, repeat),
+            best(lambda: cs.to_base(coords), number, repeat)
+        )
+    return times
+
+
+def time_baseline(ref, spaces, number, repeat):
+    """Time the conversions of the color spaces in the tree at the given git ref."""
+
+    archive = subprocess.run(['git', 'archive', ref, 'lib'], cwd=ROOT, check=True, stdout=subprocess.PIPE).stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            # Only trust the archive's contents as data where the extraction filters are available.
+            tar.extractall(tmp, **({'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}))
+        result = subprocess.run(
+            [
+                sys.executable, os.path.abspath(__file__), '--root', tmp, '--json',
+                '--number', str(number), '--repeat', str(repeat), *spaces
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True
+        )
+    return {k: tuple(v) for k, v in json.loads(result.stdout).items()}
+
+
+def print_spaces(times, baseline=None):
+    """Print the conversion times, along with the baseline times if available."""
+
+    if baseline is None:
+        print('\n{:<18} {:>10} {:>10}'.format('space', 'from_base', 'to_base'))
+        for name, (from_base, to_base) in times.items():
+            print('{:<18} {:>10.3f} {:>10.3f}'.format(name, from_base, to_base))
+        return
+
+    print(
+        '\n{:<18} {:>10} {:>10} {:>7} {:>10} {:>10} {:>7}'.format(
+            'space', 'from_base', 'baseline', 'ratio', 'to_base', 'baseline', 'ratio'
+        )
+    )
+    for name, (from_base, to_base) in times.items():
+        if name not in baseline:
+            print(
+                '{:<18} {:>10.3f} {:>10} {:>7} {:>10.3f} {:>10} {:>7}'.format(
+                    name, from_base, '-', '-', to_base, '-', '-'
+                )
+            )
+            continue
+        base_from, base_to = baseline[name]
+        print(
+            '{:<18} {:>10.3f} {:>10.3f} {:>7.2f} {:>10.3f} {:>10.3f} {:>7.2f}'.format(
+                name, from_base, base_from, from_base / base_from, to_base, base_to, to_base / base_to
+            )
+        )
+
+
+def main():
+    """Run the benchmarks."""
+
+    parser = argparse.ArgumentParser(prog='bench_algebra', description='Microbenchmark the 3x3 algebra kernels.')
+    parser.add_argument('--number', type=int, default=1000, help='Calls per timing.')
+    parser.add_argument('--repeat', type=int, default=25, help='Timings to take the best of.')
+    parser.add_argument('--baseline', help='Git ref to compare the color space conversions against.')
+    parser.add_argument('--root', default=ROOT, help=argparse.SUPPRESS)
+    parser.add_argument('--json', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('spaces', nargs='*', help='Color spaces to time, all registered spaces if none.')
+    args = parser.parse_args()
+
+    alg, color_cls = load(args.root)
+    spaces = args.spaces or sorted(color_cls.CS_MAP.keys())
+
+    # Used to time a baseline tree from another process.
+    if args.json:
+        print(json.dumps(time_spaces(color_cls, spaces, args.number, args.repeat)))
+        return 0
+
+    bench_kernels(alg, args.number, args.repeat)
+    baseline = time_baseline(args.baseline, spaces, args.number, args.repeat) if args.baseline else None
+    print_spaces(time_spaces(color_cls, spaces, args.number, args.repeat), baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())